@@ -52,7 +52,10 @@ ARGS_BACKTEST = [
     "enable_dynamic_pairlist",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_engine",
+    "indicator_cache",
     "strategy_list",
+    "backtest_jobs",
     "export",
     "exportfilename",
     "exportdirectory",
@@ -69,6 +72,8 @@ ARGS_HYPEROPT = [
     "enable_protections",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_engine",
+    "indicator_cache",
     "epochs",
     "spaces",
     "print_all",
@@ -81,6 +86,7 @@ ARGS_HYPEROPT = [
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
     "early_stop",
+    "hyperopt_cache",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -259,7 +265,15 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_breakdown",
+        "backtest_notes",
+        "backtest_jobs",
+        "indicator_cache",
+    )
 ] + [
     "minimum_trade_amount",
     "targeted_trade_amount",
@@ -168,6 +168,13 @@ AVAILABLE_CLI_OPTIONS = {
         "--timeframe-detail",
         help="Specify detail timeframe for backtesting (`1m`, `5m`, `30m`, `1h`, `1d`).",
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help=f"Backtest engine to use (default: `{constants.BACKTEST_ENGINE_DEFAULT}`). "
+        "`columnar` keeps candles in numpy arrays and only visits candles with "
+        "an entry signal or an open trade.",
+        choices=constants.BACKTEST_ENGINES,
+    ),
     "position_stacking": Arg(
         "--eps",
         "--enable-position-stacking",
@@ -207,6 +214,22 @@ AVAILABLE_CLI_OPTIONS = {
         "(so `backtest-data.json` becomes `backtest-data-SampleStrategy.json`",
         nargs="+",
     ),
+    "indicator_cache": Arg(
+        "--indicator-cache",
+        help="Cache populated indicators in `user_data/indicator_cache/`. "
+        "Indicators are recalculated only if strategy, parameters, configuration or data change.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_jobs": Arg(
+        "--backtest-jobs",
+        help="The number of strategies from `--strategy-list` to backtest in parallel "
+        "(worker processes). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), strategies are backtested one after another.",
+        type=int,
+        metavar="JOBS",
+    ),
     "backtest_notes": Arg(
         "--notes",
         help="Add notes to the backtest results.",
@@ -299,6 +322,13 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "hyperopt_cache": Arg(
+        "--hyperopt-cache",
+        help="Cache epoch results in `user_data/hyperopt_results/epoch_cache/`. "
+        "Parameter combinations evaluated before (also in previous runs) are not backtested again.",
+        action="store_true",
+        default=False,
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
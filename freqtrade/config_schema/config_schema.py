@@ -4,6 +4,7 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     MARGIN_MODES,
@@ -105,6 +106,11 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "strategy_process_workers": {
+            "description": "Number of worker processes analyzing pairs. 0 analyzes in-process.",
+            "type": "integer",
+            "minimum": 0,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -228,6 +234,44 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_jobs": {
+            "description": "Number of strategies to backtest in parallel.",
+            "type": "integer",
+        },
+        "data_load_workers": {
+            "description": "Number of threads loading pairs for backtesting and plotting.",
+            "type": "integer",
+            "minimum": 1,
+        },
+        "download_data_workers": {
+            "description": (
+                "Number of threads loading and storing data in download-data, "
+                "while other pairs are downloaded concurrently."
+            ),
+            "type": "integer",
+            "minimum": 1,
+        },
+        "download_trades_bulk": {
+            "description": (
+                "Stream daily trade archives of the exchange into the stored trades "
+                "in download-data, resuming after the last stored day."
+            ),
+            "type": "boolean",
+        },
+        "indicator_cache": {
+            "description": "Cache populated indicators on disk for backtesting and hyperopt.",
+            "type": "boolean",
+        },
+        "hyperopt_cache": {
+            "description": "Cache hyperopt epoch results on disk, reusing them for repeated "
+            "parameter combinations.",
+            "type": "boolean",
+        },
+        "backtest_engine": {
+            "description": "Backtest engine to use (default or columnar).",
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -690,6 +734,12 @@ CONF_SCHEMA = {
                     "type": "string",
                     "enum": ["error", "info"],
                 },
+                "max_concurrent_requests": {
+                    "description": "Maximum number of concurrent requests per API endpoint.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 4,
+                },
             },
             "required": ["enabled", "listen_ip_address", "listen_port", "username", "password"],
         },
@@ -698,6 +748,13 @@ CONF_SCHEMA = {
             "description": "Database connection URL.",
             "type": "string",
         },
+        "db_read_url": {
+            "description": (
+                "Database connection URL for reading API requests, e.g. a read replica. "
+                "Use the same URL as `db_url` for SQLite."
+            ),
+            "type": "string",
+        },
         "export": {
             "description": "Type of data to export.",
             "type": "string",
@@ -1062,6 +1119,15 @@ CONF_SCHEMA = {
                     "maximum": 20,
                     "default": 8,
                 },
+                "message_encoding": {
+                    "description": (
+                        "Encoding requested for messages from producers. "
+                        "`binary` sends dataframes as raw column buffers."
+                    ),
+                    "type": "string",
+                    "enum": ["json", "binary"],
+                    "default": "json",
+                },
             },
             "required": ["producers"],
         },
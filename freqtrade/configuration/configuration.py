@@ -265,6 +265,12 @@ class Configuration:
             logstring="Parameter --enable-protections detected, enabling Protections ...",
         )
 
+        self._args_to_config(
+            config,
+            argname="indicator_cache",
+            logstring="Parameter --indicator-cache detected, caching indicators ...",
+        )
+
         self._args_to_config(
             config,
             argname="enable_dynamic_pairlist",
@@ -295,6 +301,7 @@ class Configuration:
                 "timeframe_detail",
                 "Parameter --timeframe-detail detected, using {} for intra-candle backtesting ...",
             ),
+            ("backtest_engine", "Parameter --backtest-engine detected, using {} engine ..."),
             ("backtest_show_pair_list", "Parameter --show-pair-list detected."),
             (
                 "stake_amount",
@@ -327,6 +334,7 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_jobs", "Parameter --backtest-jobs detected: {} ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
@@ -342,6 +350,7 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_cache", "Parameter --hyperopt-cache detected, caching epoch results ..."),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
@@ -8,11 +8,12 @@ from freqtrade.data.converter.converter import (
     trim_dataframe,
     trim_dataframes,
 )
-from freqtrade.data.converter.orderflow import populate_dataframe_with_trades
+from freqtrade.data.converter.orderflow import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
     trades_convert_types,
+    trades_df_after_last,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_list_to_df,
@@ -31,8 +32,10 @@ __all__ = [
     "trim_dataframes",
     "convert_trades_format",
     "convert_trades_to_ohlcv",
+    "OrderflowCache",
     "populate_dataframe_with_trades",
     "trades_convert_types",
+    "trades_df_after_last",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
     "trades_list_to_df",
@@ -6,7 +6,7 @@ import logging
 
 import numpy as np
 import pandas as pd
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, RangeIndex, to_datetime
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, Config
 from freqtrade.enums import CandleType, TradingMode
@@ -36,22 +36,30 @@ def ohlcv_to_dataframe(
     """
     logger.debug(f"Converting candle (OHLCV) data to dataframe for pair {pair}.")
     cols = DEFAULT_DATAFRAME_COLUMNS
-    df = DataFrame(ohlcv, columns=cols)
-
-    df["date"] = to_datetime(df["date"], unit="ms", utc=True)
-
-    # Some exchanges return int values for Volume and even for OHLC.
-    # Convert them since TA-LIB indicators used in the strategy assume floats
-    # and fail with exception...
-    df = df.astype(
-        dtype={
-            "open": "float",
-            "high": "float",
-            "low": "float",
-            "close": "float",
-            "volume": "float",
-        }
-    )
+    try:
+        # Some exchanges return int values for Volume and even for OHLC.
+        # Convert them since TA-LIB indicators used in the strategy assume floats
+        # and fail with exception...
+        values = np.array(ohlcv, dtype=np.float64).reshape(-1, len(cols))
+    except (TypeError, ValueError):
+        values = None
+
+    if values is not None:
+        # Columns of the dataframe are views of the converted array
+        df = DataFrame(values[:, 1:], columns=cols[1:])
+        df.insert(0, "date", to_datetime(values[:, 0].astype(np.int64), unit="ms", utc=True))
+    else:
+        df = DataFrame(ohlcv, columns=cols)
+        df["date"] = to_datetime(df["date"], unit="ms", utc=True)
+        df = df.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            }
+        )
     return clean_ohlcv_dataframe(
         df, timeframe, pair, fill_missing=fill_missing, drop_incomplete=drop_incomplete
     )
@@ -73,16 +81,21 @@ def clean_ohlcv_dataframe(
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
-    # group by index and aggregate results to eliminate duplicate ticks
-    data = data.groupby(by="date", as_index=False, sort=True).agg(
-        {
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "max",
-        }
-    )
+    dates = data["date"].values
+    if len(dates) < 2 or (dates[1:] > dates[:-1]).all():
+        # Sorted without duplicates - nothing to group
+        data = _ohlcv_columns(data)
+    else:
+        # group by index and aggregate results to eliminate duplicate ticks
+        data = data.groupby(by="date", as_index=False, sort=True).agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "max",
+            }
+        )
     # eliminate partial candle
     if drop_incomplete:
         data.drop(data.tail(1).index, inplace=True)
@@ -94,6 +107,51 @@ def clean_ohlcv_dataframe(
         return data
 
 
+def _ohlcv_columns(data: DataFrame) -> DataFrame:
+    """
+    OHLCV columns of a dataframe with unique dates, with a fresh index.
+    Columns are shared with data if possible - read-only columns (e.g. memory-mapped files)
+    are copied, so the result can be modified.
+    """
+    if list(data.columns) == DEFAULT_DATAFRAME_COLUMNS and all(
+        data[col].values.flags.writeable for col in DEFAULT_DATAFRAME_COLUMNS
+    ):
+        data = data.copy(deep=False)
+    else:
+        data = data.loc[:, DEFAULT_DATAFRAME_COLUMNS].copy()
+    if not data.index.equals(RangeIndex(len(data))):
+        data.index = RangeIndex(len(data))
+    return data
+
+
+def _reindex_missing_data(dataframe: DataFrame, timeframe: str) -> DataFrame | None:
+    """
+    Reindex sorted, unique candles on the candle dates between the first and last candle.
+    :return: Dataframe with missing candles as NaN rows - None if the candles are not aligned
+        to timeframes dividing a day, which require resampling.
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    timeframe_secs = timeframe_to_seconds(timeframe)
+    dates = dataframe["date"].values
+    if 86400 % timeframe_secs != 0 or not np.issubdtype(dates.dtype, np.datetime64):
+        return None
+    i8 = dates.view(np.int64)
+    step = pd.Timedelta(seconds=timeframe_secs) // pd.Timedelta(
+        1, unit=np.datetime_data(dates.dtype)[0]
+    )
+    if len(i8) < 2 or not (i8[1:] > i8[:-1]).all() or (i8 % step).any():
+        return None
+    full_range = pd.date_range(
+        dataframe["date"].iat[0], dataframe["date"].iat[-1], freq=f"{timeframe_secs}s"
+    )
+    df = dataframe.set_index("date").loc[:, DEFAULT_DATAFRAME_COLUMNS[1:]].reindex(full_range)
+    df.index.name = "date"
+    # A single candle per date - resampling would count missing volume as 0
+    df["volume"] = df["volume"].fillna(0)
+    return df
+
+
 def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
     """
     Fills up missing data with 0 volume rows,
@@ -102,10 +160,18 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     """
     from freqtrade.exchange import timeframe_to_resample_freq
 
-    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    resample_interval = timeframe_to_resample_freq(timeframe)
-    # Resample to create "NAN" values
-    df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
+    df = _reindex_missing_data(dataframe, timeframe)
+    if df is None:
+        ohlcv_dict = {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+        }
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        # Resample to create "NAN" values
+        df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
 
     # Forwardfill close for missing columns
     df["close"] = df["close"].ffill()
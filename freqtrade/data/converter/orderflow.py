@@ -4,7 +4,8 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
+from itertools import pairwise
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -76,17 +77,52 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+class OrderflowCache:
+    """
+    Orderflow results (ORDERFLOW_ADDED_COLUMNS) of finished candles, keyed by candle start.
+    Holds at most `maxsize` candles - the oldest candles are evicted first.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._candles: dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._candles)
+
+    def get(self, candle_start: int) -> tuple | None:
+        """
+        :param candle_start: candle start as nanosecond timestamp
+        :return: column values of the candle, or None if the candle isn't cached
+        """
+        return self._candles.get(candle_start)
+
+    def update(self, candles: dict[int, tuple]) -> None:
+        """
+        Cache the results of finished candles.
+        :param candles: column values (in the order of ORDERFLOW_ADDED_COLUMNS)
+                        per candle start as nanosecond timestamp
+        """
+        self._candles.update(candles)
+        if len(self._candles) > self.maxsize:
+            for key in sorted(self._candles)[: len(self._candles) - self.maxsize]:
+                del self._candles[key]
+
+
 def populate_dataframe_with_trades(
-    cached_grouped_trades: pd.DataFrame | None,
+    orderflow_cache: OrderflowCache | None,
     config: Config,
     dataframe: pd.DataFrame,
     trades: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> tuple[pd.DataFrame, OrderflowCache | None]:
     """
     Populates a dataframe with trades
+    Results of finished candles (candles followed by trades of a later candle) are cached,
+    so only new candles, and the candle still forming, are calculated on the next call.
+    :param orderflow_cache: Cache returned by the previous call for this pair, or None
     :param dataframe: Dataframe to populate
     :param trades: Trades to populate with
-    :return: Dataframe with trades populated
+    :return: Dataframe with trades populated, and the orderflow cache
     """
 
     timeframe = config["timeframe"]
@@ -95,7 +131,7 @@ def populate_dataframe_with_trades(
     # create columns for trades
     _init_dataframe_with_trades_columns(dataframe)
     if trades is None or trades.empty:
-        return dataframe, cached_grouped_trades
+        return dataframe, orderflow_cache
 
     try:
         start_time = time.time()
@@ -109,99 +145,187 @@ def populate_dataframe_with_trades(
         trades = trades.loc[trades["candle_start"] >= start_date]
         trades.reset_index(inplace=True, drop=True)
 
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        if orderflow_cache is None:
+            orderflow_cache = OrderflowCache(config_orderflow["cache_size"])
+        # Position of each trade's candle in dataframe (-1 if the candle isn't in dataframe)
+        candle_pos = _candle_positions(dataframe["date"], trades["candle_start"])
+        candle_starts = dataframe["date"].to_numpy(dtype="datetime64[ns]")
+        columns = {col: dataframe[col].to_numpy(copy=True) for col in ORDERFLOW_ADDED_COLUMNS}
+
+        # Take results of candles which are already in the cache
+        candles = np.unique(candle_pos[candle_pos >= 0])
+        cached = [orderflow_cache.get(candle_starts[c].astype(np.int64).item()) for c in candles]
+        in_cache = np.array([values is not None for values in cached], dtype=bool)
+        if in_cache.any():
+            cached_values = [values for values in cached if values is not None]
+            _set_rows(
+                columns,
+                candles[in_cache],
+                {
+                    col: [values[i] for values in cached_values]
+                    for i, col in enumerate(ORDERFLOW_ADDED_COLUMNS)
+                },
+            )
+            candle_pos[np.isin(candle_pos, candles[in_cache])] = -1
+
+        has_candle = candle_pos >= 0
+        if has_candle.any():
+            # group trades by candle - keeping the order of trades within a candle
+            order = np.argsort(candle_pos[has_candle], kind="stable")
+            candle_trades = trades.loc[has_candle].iloc[order].reset_index(drop=True)
+            candles, results = _orderflow_per_candle(
+                candle_trades, candle_pos[has_candle][order], config_orderflow
+            )
+            _set_rows(columns, candles, results)
+
+            # Candles starting before the latest trade's candle are finished
+            latest_candle_start = trades["candle_start"].to_numpy(dtype="datetime64[ns]").max()
+            orderflow_cache.update(
+                {
+                    candle_starts[candles[i]].astype(np.int64).item(): tuple(
+                        results[col][i] for col in ORDERFLOW_ADDED_COLUMNS
+                    )
+                    for i in np.flatnonzero(candle_starts[candles] < latest_candle_start)
+                }
+            )
+
+        for col in ORDERFLOW_ADDED_COLUMNS:
+            dataframe[col] = columns[col]
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
-        # Cache the entire dataframe
-        cached_grouped_trades = dataframe.tail(config_orderflow["cache_size"]).copy()
-
     except Exception as e:
         logger.exception("Error populating dataframe with trades")
         raise DependencyException(e)
 
-    return dataframe, cached_grouped_trades
+    return dataframe, orderflow_cache
 
 
-def trades_to_volumeprofile_with_total_delta_bid_ask(
-    trades: pd.DataFrame, scale: float
-) -> pd.DataFrame:
+def _candle_positions(dates: pd.Series, candle_starts: pd.Series) -> np.ndarray:
+    """
+    Position of each candle start in the (sorted) dates - -1 if the candle isn't in dates.
+    """
+    dates_ns = dates.to_numpy(dtype="datetime64[ns]")
+    starts_ns = candle_starts.to_numpy(dtype="datetime64[ns]")
+    if len(dates_ns) == 0:
+        return np.full(len(starts_ns), -1, dtype=np.int64)
+    pos = np.searchsorted(dates_ns, starts_ns).astype(np.int64)
+    found = dates_ns[np.minimum(pos, len(dates_ns) - 1)] == starts_ns
+    return np.where(found, pos, -1)
+
+
+def _set_rows(columns: dict[str, np.ndarray], rows: np.ndarray, values: dict[str, Any]) -> None:
+    """
+    Assign values (one entry per row) to rows of the column arrays.
+    """
+    for col, column in columns.items():
+        if column.dtype == object:
+            # lists and dicts must not be broadcast by numpy
+            for row, value in zip(rows, values[col], strict=True):
+                column[row] = value
+        else:
+            column[rows] = values[col]
+
+
+def _orderflow_per_candle(
+    trades: pd.DataFrame, candle_pos: np.ndarray, config_orderflow: dict
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """
+    Calculate orderflow columns for all candles at once.
+    :param trades: trades sorted by candle
+    :param candle_pos: position of the candle of each trade
+    :param config_orderflow: orderflow configuration
+    :return: candle positions and a dict of column values (one entry per candle)
+    """
+    candles, first = np.unique(candle_pos, return_index=True)
+    bounds = np.append(first, len(trades))
+
+    # Volume profile per candle and price level
+    levels = _trades_to_levels(trades, scale=config_orderflow["scale"])
+    levels["candle"] = candle_pos
+
+    totals = levels[["candle", "bid_amount", "ask_amount", "delta"]]
+    cum_delta = totals.groupby("candle")["delta"].cumsum().groupby(candle_pos)
+    totals = totals.groupby("candle")[["bid_amount", "ask_amount"]].sum()
+
+    records = trades.drop(columns=["candle_start", "candle_end"]).to_dict(orient="records")
+
+    profile = levels.groupby(["candle", "price"]).sum(numeric_only=True)
+    imbalances = trades_orderflow_to_imbalances(
+        profile,
+        imbalance_ratio=config_orderflow["imbalance_ratio"],
+        imbalance_volume=config_orderflow["imbalance_volume"],
+    )
+    orderflow_dicts = _split_by_candle(profile.to_dict(orient="index"))
+    imbalance_dicts = _split_by_candle(imbalances.to_dict(orient="index"))
+
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    results: dict[str, Any] = {
+        "trades": [records[start:end] for start, end in pairwise(bounds)],
+        "orderflow": [orderflow_dicts[c] for c in candles],
+        "imbalances": [imbalance_dicts[c] for c in candles],
+        "stacked_imbalances_bid": _stacked_imbalances_per_candle(
+            imbalances, candles, label="bid", stacked_imbalance_range=stacked_imbalance_range
+        ),
+        "stacked_imbalances_ask": _stacked_imbalances_per_candle(
+            imbalances, candles, label="ask", stacked_imbalance_range=stacked_imbalance_range
+        ),
+        "max_delta": cum_delta.max().to_numpy(),
+        "min_delta": cum_delta.min().to_numpy(),
+        "bid": totals["bid_amount"].to_numpy(),
+        "ask": totals["ask_amount"].to_numpy(),
+        "delta": (totals["ask_amount"] - totals["bid_amount"]).to_numpy(),
+        "total_trades": np.diff(bounds),
+    }
+    return candles, results
+
+
+def _split_by_candle(values: dict[tuple[int, float], dict]) -> dict[int, dict[float, dict]]:
     """
+    Split a dict keyed by (candle, price) into one dict per candle.
+    """
+    result: dict[int, dict[float, dict]] = {}
+    for (candle, price), value in values.items():
+        result.setdefault(candle, {})[price] = value
+    return result
+
+
+def _stacked_imbalances_per_candle(
+    imbalances: pd.DataFrame, candles: np.ndarray, label: str, stacked_imbalance_range: int
+) -> list[list]:
+    """
+    stacked_imbalance() for all candles of imbalances (indexed by candle, price).
+    """
+    imbalance = imbalances[f"{label}_imbalance"].to_numpy(dtype=bool)
+    candle = imbalances.index.get_level_values("candle").to_numpy()
+    prices = imbalances.index.get_level_values("price").to_numpy()
+    int_series = pd.Series(np.where(imbalance, 1, 0))
+    # Group consecutive True values (within a candle) and get their counts
+    new_group = np.ones(len(imbalance), dtype=bool)
+    new_group[1:] = (imbalance[1:] != imbalance[:-1]) | (candle[1:] != candle[:-1])
+    counts = int_series.groupby(np.cumsum(new_group)).cumsum().to_numpy()
+
+    stacked: dict[int, list] = {}
+    for idx in np.flatnonzero(counts >= stacked_imbalance_range):
+        stacked.setdefault(candle[idx], []).append(prices[idx - (stacked_imbalance_range - 1)])
+    return [stacked.get(c, []) for c in candles]
+
+
+def _trades_to_levels(trades: pd.DataFrame, scale: float) -> pd.DataFrame:
+    """
+    Bid / ask amounts of each trade, with the price rounded to its level.
     :param trades: dataframe
     :param scale: scale aka bin size e.g. 0.5
-    :return: trades binned to levels according to scale aka orderflow
+    :return: one row per trade
     """
     df = pd.DataFrame([], columns=DEFAULT_ORDERFLOW_COLUMNS)
     # create bid, ask where side is sell or buy
-    df["bid_amount"] = np.where(trades["side"].str.contains("sell"), trades["amount"], 0)
-    df["ask_amount"] = np.where(trades["side"].str.contains("buy"), trades["amount"], 0)
-    df["bid"] = np.where(trades["side"].str.contains("sell"), 1, 0)
-    df["ask"] = np.where(trades["side"].str.contains("buy"), 1, 0)
+    is_sell = trades["side"].str.contains("sell")
+    is_buy = trades["side"].str.contains("buy")
+    df["bid_amount"] = np.where(is_sell, trades["amount"], 0)
+    df["ask_amount"] = np.where(is_buy, trades["amount"], 0)
+    df["bid"] = np.where(is_sell, 1, 0)
+    df["ask"] = np.where(is_buy, 1, 0)
     # round the prices to the nearest multiple of the scale
     df["price"] = ((trades["price"] / scale).round() * scale).astype("float64").values
     if df.empty:
@@ -212,6 +336,20 @@ def trades_to_volumeprofile_with_total_delta_bid_ask(
     df["delta"] = df["ask_amount"] - df["bid_amount"]
     df["total_volume"] = df["ask_amount"] + df["bid_amount"]
     df["total_trades"] = df["ask"] + df["bid"]
+    return df
+
+
+def trades_to_volumeprofile_with_total_delta_bid_ask(
+    trades: pd.DataFrame, scale: float
+) -> pd.DataFrame:
+    """
+    :param trades: dataframe
+    :param scale: scale aka bin size e.g. 0.5
+    :return: trades binned to levels according to scale aka orderflow
+    """
+    df = _trades_to_levels(trades, scale)
+    if df.empty:
+        return df
 
     # group to bins aka apply scale
     df = df.groupby("price").sum(numeric_only=True)
@@ -227,7 +365,11 @@ def trades_orderflow_to_imbalances(df: pd.DataFrame, imbalance_ratio: int, imbal
     """
     bid = df.bid
     # compares bid and ask diagonally
-    ask = df.ask.shift(-1)
+    if isinstance(df.index, pd.MultiIndex):
+        # Orderflow of multiple candles - compare within each candle
+        ask = df.ask.groupby(level=0).shift(-1)
+    else:
+        ask = df.ask.shift(-1)
     bid_imbalance = (bid / ask) > (imbalance_ratio)
     # overwrite bid_imbalance with False if volume is not big enough
     bid_imbalance_filtered = np.where(df.total_volume < imbalance_volume, False, bid_imbalance)
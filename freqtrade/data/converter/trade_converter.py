@@ -33,6 +33,26 @@ def trades_df_remove_duplicates(trades: pd.DataFrame) -> pd.DataFrame:
     return trades.drop_duplicates(subset=["timestamp", "id"])
 
 
+def trades_df_after_last(trades: DataFrame, new_trades: DataFrame) -> DataFrame:
+    """
+    Trades of new_trades which are not yet part of trades.
+    The last timestamp of trades is used as high-water mark - so only new trades (and trades
+    sharing the last timestamp) are compared, instead of deduplicating all trades again.
+    Relies on trades being sorted by timestamp.
+    :param trades: Known trades, sorted by timestamp
+    :param new_trades: Trades to add to trades
+    :return: Trades of new_trades at or after the last known trade, without known trades
+    """
+    if trades.empty:
+        return trades_df_remove_duplicates(new_trades)
+    last_ts = trades["timestamp"].iat[-1]
+    new_trades = new_trades[new_trades["timestamp"] >= last_ts]
+    # Known trades with the last timestamp
+    known_ids = trades["id"].iloc[trades["timestamp"].searchsorted(last_ts) :]
+    known = (new_trades["timestamp"] == last_ts) & new_trades["id"].isin(known_ids)
+    return trades_df_remove_duplicates(new_trades[~known])
+
+
 def trades_dict_to_list(trades: list[dict]) -> TradeList:
     """
     Convert fetch_trades result into a List (to be more memory efficient).
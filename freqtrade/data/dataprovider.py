@@ -7,6 +7,7 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -50,6 +51,7 @@ class DataProvider:
         self.__rpc = rpc
         self.__cached_pairs: dict[PairWithTimeframe, tuple[DataFrame, datetime]] = {}
         self.__slice_index: dict[str, int] = {}
+        self.__slice_index_resolver: Callable[[str], int | None] | None = None
         self.__slice_date: datetime | None = None
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
@@ -77,6 +79,14 @@ class DataProvider:
         """
         self.__slice_index[pair] = limit_index
 
+    def _set_dataframe_max_index_resolver(self, resolver: Callable[[str], int | None] | None):
+        """
+        Limit analyzed dataframes lazily, for pairs without explicit max index.
+        Only relevant in backtesting (used by the columnar backtest engine).
+        :param resolver: Callable returning the dataframe index limit for a pair.
+        """
+        self.__slice_index_resolver = resolver
+
     def _set_dataframe_max_date(self, limit_date: datetime):
         """
         Limit informative dataframe to max specified index.
@@ -331,6 +341,12 @@ class DataProvider:
             )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
+    def _historic_ohlcv_pairs(self) -> ListPairsWithTimeframes:
+        """
+        Pairs loaded from disk via historic_ohlcv() so far.
+        """
+        return list(self.__cached_pairs_backtesting)
+
     def get_required_startup(self, timeframe: str) -> int:
         freqai_config = self._config.get("freqai", {})
         if not freqai_config.get("enabled", False):
@@ -393,7 +409,10 @@ class DataProvider:
                 df, date = self.__cached_pairs[pair_key]
             else:
                 df, date = self.__cached_pairs[pair_key]
-                if (max_index := self.__slice_index.get(pair)) is not None:
+                max_index = self.__slice_index.get(pair)
+                if max_index is None and self.__slice_index_resolver:
+                    max_index = self.__slice_index_resolver(pair)
+                if max_index is not None:
                     df = df.iloc[max(0, max_index - MAX_DATAFRAME_CANDLES) : max_index]
                 else:
                     return (DataFrame(), datetime.fromtimestamp(0, tz=UTC))
@@ -432,6 +451,7 @@ class DataProvider:
         # otherwise they're reloaded each time during hyperopt due to with analyze_per_epoch
         # self.__cached_pairs_backtesting = {}
         self.__slice_index = {}
+        self.__slice_index_resolver = None
 
     # Exchange functions
 
@@ -0,0 +1,105 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import ipc
+
+from freqtrade.configuration import TimeRange
+
+from .featherdatahandler import FeatherDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+def _read_table(filename: Path) -> pa.Table:
+    """
+    Memory-map an Arrow IPC file.
+    Buffers of the table point into the mapping - which stays valid while they are referenced.
+    """
+    with pa.memory_map(str(filename)) as source:
+        return ipc.open_file(source).read_all()
+
+
+def _write_table(data: DataFrame, filename: Path) -> None:
+    """
+    Write data as uncompressed Arrow IPC file with a single record batch.
+    The file is replaced atomically - processes which have the previous file mapped keep
+    a valid view of the previous data.
+    """
+    tmp_file = filename.with_name(f"{filename.name}.tmp")
+    data.to_feather(tmp_file, compression="uncompressed", chunksize=max(len(data), 1))
+    tmp_file.replace(filename)
+
+
+class ArrowDataHandler(FeatherDataHandler):
+    """
+    Uncompressed Arrow IPC files, read through memory mapping.
+    Processes loading the same files share the pages of the operating system's file cache,
+    and numeric and date columns are used without copying - at the cost of larger files.
+    Dataframes loaded from these files are read-only views of the file.
+    """
+
+    def _write_ohlcv_file(self, data: DataFrame, filename: Path) -> None:
+        """
+        Write ohlcv data as a single uncompressed record batch.
+        :param data: Dataframe containing OHLCV data
+        :param filename: File to write
+        """
+        _write_table(data, filename)
+
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Memory-map one ohlcv file.
+        With a timerange, the table is sliced to the timerange (without copying) -
+        so only the pages of the timerange are read from disk.
+        :param filename: File to read
+        :param timerange: Limit data to be loaded to this timerange.
+        :return: DataFrame as stored in the file
+        """
+        table = _read_table(filename)
+        if timerange and table.num_rows > 0 and (timerange.startts > 0 or timerange.stopts > 0):
+            dates = table.column(0).to_numpy()
+            start = 0
+            end = len(dates)
+            if timerange.startts > 0:
+                start = int(np.searchsorted(dates, np.datetime64(timerange.startts, "s"), "left"))
+            if timerange.stopts > 0:
+                end = int(np.searchsorted(dates, np.datetime64(timerange.stopts, "s"), "right"))
+            table = table.slice(start, max(end - start, 0))
+        return table.to_pandas(split_blocks=True)
+
+    def _write_trades_file(self, data: DataFrame, filename: Path) -> None:
+        """
+        Write trades data as a single uncompressed record batch.
+        :param data: Dataframe containing trades
+        :param filename: File to write
+        """
+        _write_table(data, filename)
+
+    def _open_trades_writer(self, filename: Path, schema: pa.Schema) -> ipc.RecordBatchFileWriter:
+        """
+        Open an uncompressed Arrow IPC file for writing trades record batch by record batch.
+        :param filename: File to write
+        :param schema: Schema of the record batches
+        """
+        return ipc.new_file(str(filename), schema)
+
+    def _read_trades_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Load trades from a memory-mapped file
+        :param filename: File to read
+        :param timerange: Timerange to load trades for - filters data to this range if provided
+        :return: Dataframe containing trades
+        """
+        table = _read_table(filename)
+        time_filter = self._build_arrow_time_filter(timerange)
+        if time_filter is not None:
+            table = table.filter(time_filter)
+        return table.to_pandas()
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "arrow"
@@ -0,0 +1,361 @@
+"""
+Base class for datahandlers storing ohlcv and trades data in chunked, columnar files
+(feather, parquet).
+"""
+
+import logging
+from abc import abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.enums import CandleType, TradingMode
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Candles per chunk (record batch / row group) - the unit of timerange pruning when loading.
+OHLCV_CHUNK_SIZE = 2**16
+# Appended segments are merged into the pair file once this many exist.
+MAX_APPEND_SEGMENTS = 32
+
+
+class ChunkedDataHandler(IDataHandler):
+    """
+    Ohlcv data is stored in chunks of OHLCV_CHUNK_SIZE candles,
+    so loading a timerange only decompresses the chunks overlapping it.
+    Appended candles are written to small segment files next to the pair file
+    (e.g. BTC_USDT-1m.feather.0001) - so appending doesn't rewrite the full history.
+    Segments replace all stored candles from their first candle onwards, and are merged into the
+    pair file on the next ohlcv_store() - or once MAX_APPEND_SEGMENTS segments exist.
+    Trades are appended the same way - trade segments only contain trades newer than the
+    stored trades. They are merged into the pair file one record batch at a time, so
+    appending never loads all trades.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+
+    @abstractmethod
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read one ohlcv file.
+        :param filename: File to read
+        :param timerange: Only chunks overlapping this timerange need to be read.
+                          Trimming to the exact timerange happens outside of this method.
+        :return: DataFrame as stored in the file
+        """
+
+    @abstractmethod
+    def _write_ohlcv_file(self, data: DataFrame, filename: Path) -> None:
+        """
+        Write one ohlcv file in chunks of OHLCV_CHUNK_SIZE candles.
+        :param data: Dataframe containing OHLCV data
+        :param filename: File to write
+        """
+
+    @abstractmethod
+    def _read_trades_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read one trades file.
+        :param filename: File to read
+        :param timerange: Timerange to load trades for
+        :return: Dataframe containing trades
+        """
+
+    @abstractmethod
+    def _write_trades_file(self, data: DataFrame, filename: Path) -> None:
+        """
+        Write one trades file.
+        :param data: Dataframe containing trades
+        :param filename: File to write
+        """
+
+    @abstractmethod
+    def _iter_trades_batches(self, filename: Path) -> Iterator[Any]:
+        """
+        Read one trades file record batch by record batch.
+        :param filename: File to read
+        :return: Iterator of pyarrow RecordBatches
+        """
+
+    @abstractmethod
+    def _open_trades_writer(self, filename: Path, schema: Any) -> Any:
+        """
+        Open a writer for a trades file, written record batch by record batch.
+        :param filename: File to write
+        :param schema: pyarrow schema of the record batches
+        :return: Writer with write_batch() and close()
+        """
+
+    @staticmethod
+    def _segment_files(filename: Path) -> list[Path]:
+        """
+        Appended segments of a pair file, in the order they were written.
+        """
+        if not filename.parent.is_dir():
+            return []
+        return sorted(
+            p for p in filename.parent.glob(f"{filename.name}.*") if p.suffix[1:].isdigit()
+        )
+
+    def _convert_ohlcv(self, pairdata: DataFrame) -> DataFrame:
+        pairdata.columns = self._columns
+        # Avoid copies of columns which already have the right type.
+        pairdata = pairdata.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            },
+            copy=False,
+        )
+        if pairdata["date"].dtype != "datetime64[ns, UTC]":
+            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+        return pairdata
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store ohlcv data - replacing existing data and appended segments.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        self._write_ohlcv_file(data.reset_index(drop=True).loc[:, self._columns], filename)
+        for segment in self._segment_files(filename):
+            segment.unlink()
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Only chunks overlapping the timerange are read.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if not filename.exists():
+                return DataFrame(columns=self._columns)
+        try:
+            parts = [self._convert_ohlcv(self._read_ohlcv_file(filename, timerange))]
+            parts.extend(
+                self._convert_ohlcv(self._read_ohlcv_file(segment, None))
+                for segment in self._segment_files(filename)
+            )
+            return self._merge_segments(parts)
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_data_files(self, pair: str, timeframe: str, candle_type: CandleType) -> list[Path]:
+        """
+        Existing files the ohlcv data of this pair is loaded from, including appended segments.
+        """
+        files = super().ohlcv_data_files(pair, timeframe, candle_type)
+        return [*files, *self._segment_files(files[0])] if files else []
+
+    @staticmethod
+    def _merge_segments(parts: list[DataFrame]) -> DataFrame:
+        """
+        Combine the pair file with its appended segments.
+        Each segment replaces all earlier candles from its first candle onwards.
+        """
+        if len(parts) == 1:
+            return parts[0]
+        pieces = []
+        cutoff = None
+        for part in reversed(parts):
+            if cutoff is not None:
+                part = part.loc[part["date"] < cutoff]
+            if not part.empty:
+                cutoff = part["date"].iloc[0]
+            pieces.append(part)
+        return concat(pieces[::-1], ignore_index=True)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Stored candles from the first appended candle onwards are replaced.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append - sorted by date.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        segments = self._segment_files(filename)
+        if not filename.exists() or len(segments) >= MAX_APPEND_SEGMENTS:
+            if filename.exists():
+                existing = self._ohlcv_load(pair, timeframe, None, candle_type)
+                data = self._merge_segments([existing, data.loc[:, self._columns]])
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+
+        index = int(segments[-1].suffix[1:]) + 1 if segments else 1
+        self._write_ohlcv_file(
+            data.reset_index(drop=True).loc[:, self._columns],
+            filename.with_name(f"{filename.name}.{index:04d}"),
+        )
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair, including appended segments.
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        for segment in self._segment_files(filename):
+            segment.unlink()
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+        """
+        Store trades data - replacing existing data and appended segments.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        self._write_trades_file(data.reset_index(drop=True), filename)
+        for segment in self._segment_files(filename):
+            segment.unlink()
+
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
+        """
+        Append trades newer than the stored trades, without rewriting the stored trades.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        if data.empty:
+            return
+        data = data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS]
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            self._trades_store(pair, data, trading_mode)
+            return
+
+        segments = self._segment_files(filename)
+        index = int(segments[-1].suffix[1:]) + 1 if segments else 1
+        segments.append(filename.with_name(f"{filename.name}.{index:04d}"))
+        self._write_trades_file(data, segments[-1])
+        if len(segments) > MAX_APPEND_SEGMENTS:
+            if self._merge_trades_files([filename, *segments], filename):
+                for segment in segments:
+                    segment.unlink()
+            else:
+                logger.debug(f"Trade segments of {pair} overlap, merging them in memory.")
+                self._trades_store(pair, self._trades_load(pair, trading_mode), trading_mode)
+
+    def _merge_trades_files(self, files: list[Path], filename: Path) -> bool:
+        """
+        Write the trades of files to filename, one record batch at a time.
+        :param files: Files to merge, in the order they were written
+        :param filename: File to write - replaced once all trades are written
+        :return: False if nothing was written, as trades of the files overlap or
+            their schemas don't match
+        """
+        tmp_file = filename.with_name(f"{filename.name}.tmp")
+        writer = None
+        schema = None
+        last_timestamp = None
+        try:
+            for file in files:
+                for batch in self._iter_trades_batches(file):
+                    if batch.num_rows == 0:
+                        continue
+                    timestamps = batch.column("timestamp").to_numpy()
+                    if last_timestamp is not None and timestamps.min() < last_timestamp:
+                        return False
+                    last_timestamp = timestamps.max()
+                    if writer is None:
+                        schema = batch.schema.remove_metadata()
+                        writer = self._open_trades_writer(tmp_file, schema)
+                    writer.write_batch(batch.cast(schema))
+            if writer is None:
+                return False
+            writer.close()
+            writer = None
+            tmp_file.replace(filename)
+            return True
+        except (ValueError, NotImplementedError, TypeError) as e:
+            # Schemas don't match (pyarrow's errors derive from these)
+            logger.debug(f"Unable to merge trades files record batch by record batch: {e}")
+            return False
+        finally:
+            if writer is not None:
+                writer.close()
+            tmp_file.unlink(missing_ok=True)
+
+    def _trades_load(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
+    ) -> DataFrame:
+        """
+        Load trades of a pair, including appended segments.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for - filters data to this range if provided
+        :return: Dataframe containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        parts = [self._read_trades_file(filename, timerange)]
+        parts.extend(
+            self._read_trades_file(segment, timerange) for segment in self._segment_files(filename)
+        )
+        if len(parts) == 1:
+            return parts[0]
+        # Segments appended by different writers may overlap
+        return concat(parts, ignore_index=True).sort_values(
+            "timestamp", kind="stable", ignore_index=True
+        )
+
+    def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Remove trades of this pair, including appended segments.
+        :param pair: Delete data for this pair.
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        for segment in self._segment_files(filename):
+            segment.unlink()
+        return super().trades_purge(pair, trading_mode)
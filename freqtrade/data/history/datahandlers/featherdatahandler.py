@@ -1,116 +1,127 @@
 import logging
+from collections.abc import Iterator
+from pathlib import Path
 
-from pandas import DataFrame, read_feather, to_datetime
-from pyarrow import dataset
+import pyarrow as pa
+from pandas import DataFrame, read_feather
+from pyarrow import dataset, ipc
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
-from freqtrade.enums import CandleType, TradingMode
 
-from .idatahandler import IDataHandler
+from .chunkeddatahandler import OHLCV_CHUNK_SIZE, ChunkedDataHandler
 
 
 logger = logging.getLogger(__name__)
 
+# (multiplier, divisor) to convert timestamps of a given unit to ms
+_UNIT_TO_MS = {"s": (1000, 1), "ms": (1, 1), "us": (1, 1000), "ns": (1, 1_000_000)}
+
+
+def _batch_date_ms(reader: ipc.RecordBatchFileReader, batch: int, row: int) -> int:
+    """
+    Date of one row in a record batch, as ms timestamp.
+    Older files may store the date as integer ms timestamp.
+    """
+    value = reader.get_batch(batch).column(0)[row]
+    if pa.types.is_timestamp(value.type):
+        multiplier, divisor = _UNIT_TO_MS[value.type.unit]
+        return value.value * multiplier // divisor
+    return int(value.as_py())
+
+
+def _select_batches(
+    reader: ipc.RecordBatchFileReader, start_ms: int | None, stop_ms: int | None
+) -> range:
+    """
+    Binary search for the record batches overlapping start_ms - stop_ms.
+    Relies on the data being sorted by date.
+    """
+    first = 0
+    end = reader.num_record_batches
+    if start_ms is not None:
+        # First batch ending at or after start
+        lo, hi = 0, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _batch_date_ms(reader, mid, -1) < start_ms:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+    if stop_ms is not None:
+        # First batch starting after stop
+        lo, hi = first, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _batch_date_ms(reader, mid, 0) <= stop_ms:
+                lo = mid + 1
+            else:
+                hi = mid
+        end = lo
+    return range(first, end)
 
-class FeatherDataHandler(IDataHandler):
-    _columns = DEFAULT_DATAFRAME_COLUMNS
 
-    def ohlcv_store(
-        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
-    ) -> None:
+class FeatherDataHandler(ChunkedDataHandler):
+    def _write_ohlcv_file(self, data: DataFrame, filename: Path) -> None:
         """
-        Store data in json format "values".
-            format looks as follows:
-            [[<date>,<open>,<high>,<low>,<close>]]
-        :param pair: Pair - used to generate filename
-        :param timeframe: Timeframe - used to generate filename
+        Write ohlcv data as lz4 compressed feather file, with one record batch per chunk.
         :param data: Dataframe containing OHLCV data
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: None
+        :param filename: File to write
         """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
-        self.create_dir_if_needed(filename)
-
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression="lz4"
+        data.to_feather(
+            filename, compression_level=9, compression="lz4", chunksize=OHLCV_CHUNK_SIZE
         )
 
-    def _ohlcv_load(
-        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
-    ) -> DataFrame:
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
         """
-        Internal method used to load data for one pair from disk.
-        Implements the loading and conversion to a Pandas dataframe.
-        Timerange trimming and dataframe validation happens outside of this method.
-        :param pair: Pair to load data
-        :param timeframe: Timeframe (e.g. "5m")
+        Read one feather file.
+        With a timerange, the file is memory-mapped and only record batches overlapping the
+        timerange are decompressed.
+        :param filename: File to read
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: DataFrame with ohlcv data, or empty DataFrame
+        :return: DataFrame as stored in the file
         """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
-        if not filename.exists():
-            # Fallback mode for 1M files
-            filename = self._pair_data_filename(
-                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
-            )
-            if not filename.exists():
-                return DataFrame(columns=self._columns)
-        try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
+        start_set = bool(timerange and timerange.startts > 0)
+        stop_set = bool(timerange and timerange.stopts > 0)
+        if not timerange or not (start_set or stop_set):
+            return read_feather(filename)
+
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            batches = _select_batches(
+                reader,
+                timerange.startts * 1000 if start_set else None,
+                timerange.stopts * 1000 if stop_set else None,
             )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
-        except Exception as e:
-            logger.exception(
-                f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
-            )
-            return DataFrame(columns=self._columns)
+            return pa.Table.from_batches(
+                [reader.get_batch(i) for i in batches], schema=reader.schema
+            ).to_pandas()
 
-    def ohlcv_append(
-        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
-    ) -> None:
+    def _write_trades_file(self, data: DataFrame, filename: Path) -> None:
         """
-        Append data to existing data structures
-        :param pair: Pair
-        :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        Write trades data as lz4 compressed feather file.
+        :param data: Dataframe containing trades
+        :param filename: File to write
         """
-        raise NotImplementedError()
+        data.to_feather(filename, compression_level=9, compression="lz4")
 
-    def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+    def _iter_trades_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
         """
-        Store trades data (list of Dicts) to file
-        :param pair: Pair - used for filename
-        :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        :param trading_mode: Trading mode to use (used to determine the filename)
+        Read one trades file record batch by record batch, from a memory map.
+        :param filename: File to read
         """
-        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _open_trades_writer(self, filename: Path, schema: pa.Schema) -> ipc.RecordBatchFileWriter:
         """
-        Append data to existing files
-        :param pair: Pair - used for filename
-        :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
+        Open an lz4 compressed feather file for writing trades record batch by record batch.
+        :param filename: File to write
+        :param schema: Schema of the record batches
         """
-        raise NotImplementedError()
+        return ipc.new_file(str(filename), schema, options=ipc.IpcWriteOptions(compression="lz4"))
 
     def _build_arrow_time_filter(self, timerange: TimeRange | None):
         """
@@ -142,20 +153,13 @@ class FeatherDataHandler(IDataHandler):
         else:
             return exprs[0] & exprs[1]
 
-    def _trades_load(
-        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
-    ) -> DataFrame:
+    def _read_trades_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        :param pair: Load trades for this pair
-        :param trading_mode: Trading mode to use (used to determine the filename)
+        Read one trades file.
+        :param filename: File to read
         :param timerange: Timerange to load trades for - filters data to this range if provided
         :return: Dataframe containing trades
         """
-        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        if not filename.exists():
-            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
-
         # Use Arrow dataset with optional timerange filtering, fallback to read_feather
         try:
             dataset_reader = dataset.dataset(filename, format="feather")
@@ -166,12 +170,12 @@ class FeatherDataHandler(IDataHandler):
                 start_desc = timerange.startts if timerange.startts > 0 else "unbounded"
                 stop_desc = timerange.stopts if timerange.stopts > 0 else "unbounded"
                 logger.debug(
-                    f"Loaded {len(tradesdata)} trades for {pair} "
+                    f"Loaded {len(tradesdata)} trades from {filename.name} "
                     f"(filtered start={start_desc}, stop={stop_desc})"
                 )
             else:
                 tradesdata = dataset_reader.to_table().to_pandas()
-                logger.debug(f"Loaded {len(tradesdata)} trades for {pair} (unfiltered)")
+                logger.debug(f"Loaded {len(tradesdata)} trades from {filename.name} (unfiltered)")
 
         except (ImportError, AttributeError, ValueError) as e:
             # Fallback: load entire file
@@ -141,6 +141,22 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    def ohlcv_data_files(self, pair: str, timeframe: str, candle_type: CandleType) -> list[Path]:
+        """
+        Existing files the ohlcv data of this pair is loaded from.
+        :param pair: Pair
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: List of files - empty if no data exists
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type, no_timeframe_modify=True
+            )
+        return [filename] if filename.exists() else []
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -237,12 +253,15 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
     @abstractmethod
@@ -276,11 +295,23 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        manifest_file = self.trades_manifest_filename(pair, trading_mode)
+        if manifest_file.exists():
+            manifest_file.unlink()
         if filename.exists():
             filename.unlink()
             return True
         return False
 
+    def trades_manifest_filename(self, pair: str, trading_mode: TradingMode) -> Path:
+        """
+        File recording the trade archive days ingested into the trades of this pair.
+        :param pair: Pair the trades belong to
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        return filename.with_name(f"{filename.stem}.manifest.json")
+
     def trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
@@ -565,6 +596,10 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "arrow":
+        from .arrowdatahandler import ArrowDataHandler
+
+        return ArrowDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
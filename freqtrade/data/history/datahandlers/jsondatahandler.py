@@ -108,12 +108,15 @@ class JsonDataHandler(IDataHandler):
         trades = data.values.tolist()
         misc.file_dump_json(filename, trades, is_zip=self._use_zip)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
@@ -1,132 +1,90 @@
 import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
 
-from pandas import DataFrame, read_parquet, to_datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame, read_parquet
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
-from freqtrade.enums import CandleType, TradingMode
 
-from .idatahandler import IDataHandler
+from .chunkeddatahandler import OHLCV_CHUNK_SIZE, ChunkedDataHandler
 
 
 logger = logging.getLogger(__name__)
 
 
-class ParquetDataHandler(IDataHandler):
-    _columns = DEFAULT_DATAFRAME_COLUMNS
-
-    def ohlcv_store(
-        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
-    ) -> None:
+class ParquetDataHandler(ChunkedDataHandler):
+    def _write_ohlcv_file(self, data: DataFrame, filename: Path) -> None:
         """
-        Store data in json format "values".
-            format looks as follows:
-            [[<date>,<open>,<high>,<low>,<close>]]
-        :param pair: Pair - used to generate filename
-        :param timeframe: Timeframe - used to generate filename
+        Write ohlcv data as parquet file, with one row group per chunk.
         :param data: Dataframe containing OHLCV data
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: None
+        :param filename: File to write
         """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
-        self.create_dir_if_needed(filename)
-
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        data.to_parquet(filename, row_group_size=OHLCV_CHUNK_SIZE)
 
-    def _ohlcv_load(
-        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
-    ) -> DataFrame:
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
         """
-        Internal method used to load data for one pair from disk.
-        Implements the loading and conversion to a Pandas dataframe.
-        Timerange trimming and dataframe validation happens outside of this method.
-        :param pair: Pair to load data
-        :param timeframe: Timeframe (e.g. "5m")
+        Read one parquet file.
+        With a timerange, row groups outside of the timerange are skipped based on their
+        statistics.
+        :param filename: File to read
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: DataFrame with ohlcv data, or empty DataFrame
+        :return: DataFrame as stored in the file
         """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
-        if not filename.exists():
-            # Fallback mode for 1M files
-            filename = self._pair_data_filename(
-                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
-            )
-            if not filename.exists():
-                return DataFrame(columns=self._columns)
-        try:
-            pairdata = read_parquet(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
-        except Exception as e:
-            logger.exception(
-                f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
-            )
-            return DataFrame(columns=self._columns)
+        filters = []
+        if timerange and (timerange.startts > 0 or timerange.stopts > 0):
+            # Older files may store the date as integer ms timestamp.
+            is_timestamp = pa.types.is_timestamp(pq.read_schema(filename).field("date").type)
 
-    def ohlcv_append(
-        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
-    ) -> None:
-        """
-        Append data to existing data structures
-        :param pair: Pair
-        :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        """
-        raise NotImplementedError()
+            def bound(ts: int) -> datetime | int:
+                return datetime.fromtimestamp(ts, tz=UTC) if is_timestamp else ts * 1000
+
+            if timerange.startts > 0:
+                filters.append(("date", ">=", bound(timerange.startts)))
+            if timerange.stopts > 0:
+                filters.append(("date", "<=", bound(timerange.stopts)))
+        return read_parquet(filename, filters=filters or None)
 
-    def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+    def _write_trades_file(self, data: DataFrame, filename: Path) -> None:
         """
-        Store trades data (list of Dicts) to file
-        :param pair: Pair - used for filename
+        Write trades data as parquet file.
         :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param filename: File to write
         """
-        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_parquet(filename)
+        data.to_parquet(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _read_trades_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
         """
-        Append data to existing files
-        :param pair: Pair - used for filename
-        :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
+        Read one trades file.
+        :param filename: File to read
+        :param timerange: Timerange to load trades for (ms timestamps) - filters data to this
+                          range if provided
+        :return: Dataframe containing trades
         """
-        raise NotImplementedError()
-
-    def _trades_load(
-        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
-    ) -> DataFrame:
+        filters = []
+        if timerange and timerange.startts > 0:
+            filters.append(("timestamp", ">=", timerange.startts))
+        if timerange and timerange.stopts > 0:
+            filters.append(("timestamp", "<=", timerange.stopts))
+        return read_parquet(filename, filters=filters or None)
+
+    def _iter_trades_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
-        :param pair: Load trades for this pair
-        :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
-        :return: List of trades
+        Read one trades file record batch by record batch.
+        :param filename: File to read
         """
-        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        if not filename.exists():
-            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
-
-        tradesdata = read_parquet(filename)
+        with pq.ParquetFile(filename) as parquet_file:
+            yield from parquet_file.iter_batches()
 
-        return tradesdata
+    def _open_trades_writer(self, filename: Path, schema: pa.Schema) -> pq.ParquetWriter:
+        """
+        Open a parquet file for writing trades record batch by record batch.
+        :param filename: File to write
+        :param schema: Schema of the record batches
+        """
+        return pq.ParquetWriter(filename, schema)
 
     @classmethod
     def _get_file_extension(cls):
@@ -1,13 +1,23 @@
+import asyncio
 import logging
 import operator
-from datetime import datetime, timedelta
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from threading import Lock
+from typing import Any, TypeGuard
 
 from pandas import DataFrame, concat
+from rich.progress import TaskID
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import (
     DATETIME_PRINT_FORMAT,
+    DEFAULT_DATAFRAME_COLUMNS,
     DL_DATA_TIMEFRAMES,
     DOCS_LINK,
     Config,
@@ -17,6 +27,9 @@ from freqtrade.constants import (
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
+    ohlcv_to_dataframe,
+    trades_convert_types,
+    trades_df_after_last,
     trades_df_remove_duplicates,
     trades_list_to_df,
 )
@@ -25,6 +38,7 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
 from freqtrade.exchange.exchange_utils import date_minus_candles
+from freqtrade.misc import file_dump_json, file_load_json
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
 from freqtrade.util.migrations import migrate_data
@@ -88,6 +102,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
+    progress_callback: Callable[[int, int], None] | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -101,6 +117,9 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of threads loading pairs in parallel.
+        Reading, decompression and cleaning of the data mostly release the GIL.
+    :param progress_callback: Called with (loaded pairs, total pairs) after each pair.
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -109,8 +128,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -120,13 +139,29 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
-        if not hist.empty:
-            result[pair] = hist
+
+    with ExitStack() as stack:
+        if workers > 1 and len(pairs) > 1:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load_data")
+            )
+            # Results are returned in the order of pairs.
+            histories = executor.map(load_pair, pairs)
         else:
-            if candle_type is CandleType.FUNDING_RATE and user_futures_funding_rate is not None:
-                logger.warning(f"{pair} using user specified [{user_futures_funding_rate}]")
-            elif candle_type not in (CandleType.SPOT, CandleType.FUTURES):
-                result[pair] = DataFrame(columns=["date", "open", "close", "high", "low", "volume"])
+            histories = map(load_pair, pairs)
+
+        for loaded, (pair, hist) in enumerate(zip(pairs, histories, strict=True), start=1):
+            if progress_callback:
+                progress_callback(loaded, len(pairs))
+            if not hist.empty:
+                result[pair] = hist
+            else:
+                if candle_type is CandleType.FUNDING_RATE and user_futures_funding_rate is not None:
+                    logger.warning(f"{pair} using user specified [{user_futures_funding_rate}]")
+                elif candle_type not in (CandleType.SPOT, CandleType.FUTURES):
+                    result[pair] = DataFrame(
+                        columns=["date", "open", "close", "high", "low", "volume"]
+                    )
 
     if fail_without_data and not result:
         raise OperationalException("No data found. Terminating.")
@@ -222,6 +257,279 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _append_pair_history(
+    pair: str,
+    timeframe: str,
+    data: DataFrame,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+) -> bool:
+    """
+    Append new candles to the stored data, if the datahandler supports appending.
+    :return: True if the data has been appended, False if the full data must be stored.
+    """
+    try:
+        data_handler.ohlcv_append(pair, timeframe, data=data, candle_type=candle_type)
+    except NotImplementedError:
+        return False
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    return True
+
+
+class _DownloadStats:
+    """
+    Throughput of candle downloads - updated from the threads storing the data.
+    """
+
+    def __init__(self) -> None:
+        self.candles = 0
+        self.nbytes = 0
+        self._start = time.perf_counter()
+        self._lock = Lock()
+
+    def add(self, data: DataFrame) -> None:
+        with self._lock:
+            self.candles += len(data)
+            self.nbytes += int(data.memory_usage(index=False).sum())
+
+    def log(self) -> None:
+        duration = max(time.perf_counter() - self._start, 1e-6)
+        logger.info(
+            f"Downloaded {self.candles} candles ({self.nbytes / 1e6:.1f} MB) "
+            f"in {duration:.1f}s: {self.candles / duration:.0f} candles/s, "
+            f"{self.nbytes / 1e6 / duration:.2f} MB/s."
+        )
+
+
+class _DownloadProgress:
+    """
+    Updates the download-data progress bars, for jobs ordered by pair.
+    Jobs may complete out of order - the pair task advances once all jobs of a pair are done.
+    """
+
+    def __init__(
+        self,
+        progress: CustomProgress,
+        jobs: list[PairWithTimeframe],
+        candle_type: CandleType,
+        timeframe_task: TaskID,
+        pair_task: TaskID,
+    ) -> None:
+        self._progress = progress
+        self._jobs = jobs
+        self._candle_type = candle_type
+        self._timeframe_task = timeframe_task
+        self._pair_task = pair_task
+        self._remaining = Counter(job[0] for job in jobs)
+
+    def started(self, index: int) -> None:
+        pair, timeframe, candle_type = self._jobs[index]
+        if index == 0 or self._jobs[index - 1][0] != pair:
+            self._progress.update(self._pair_task, description=f"Downloading {pair}")
+            self._progress.update(self._timeframe_task, completed=0)
+        if candle_type == self._candle_type:
+            self._progress.update(self._timeframe_task, description=f"Timeframe {timeframe}")
+        logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+
+    def done(self, index: int) -> None:
+        pair, timeframe, candle_type = self._jobs[index]
+        if candle_type == self._candle_type:
+            self._progress.update(self._timeframe_task, advance=1)
+        else:
+            self._progress.update(
+                self._timeframe_task, advance=1, description=f"Timeframe {candle_type}, {timeframe}"
+            )
+        self._remaining[pair] -= 1
+        if self._remaining[pair] == 0:
+            self._progress.update(self._pair_task, advance=1)
+            self._progress.update(self._timeframe_task, description="Timeframe")
+
+
+def _prepare_pair_download(
+    pair: str,
+    timeframe: str,
+    *,
+    datadir: Path,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> tuple[DataFrame, int | None, int | None]:
+    """
+    Erase or load the stored data of a pair, to determine the range to download.
+    :return: Tuple of stored data, start and end of the range to download (ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
+        f"{format_ms_time(until_ms) if until_ms else 'now'}"
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    return data, since_ms, until_ms
+
+
+def _fetch_pair_history(
+    pair: str,
+    timeframe: str,
+    data: DataFrame,
+    since_ms: int | None,
+    until_ms: int | None,
+    *,
+    exchange: Exchange,
+    new_pairs_days: int,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+    pair_candles: DataFrame | None,
+) -> DataFrame:
+    """
+    Download the candles of a pair - or use pair_candles if they cover the required range.
+    :return: Dataframe with the new candles
+    """
+    if not _use_pair_candles(pair_candles, data, since_ms, erase=erase, prepend=prepend):
+        new_dataframe = exchange.get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=_download_since_ms(since_ms, new_pairs_days),
+            is_new_pair=data.empty,
+            candle_type=candle_type,
+            until_ms=until_ms if until_ms else None,
+        )
+        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+    else:
+        new_dataframe = pair_candles
+        logger.info(
+            f"Downloaded data for {pair} with length {len(new_dataframe)}. Parallel Method."
+        )
+    return new_dataframe
+
+
+def _use_pair_candles(
+    pair_candles: DataFrame | None,
+    data: DataFrame,
+    since_ms: int | None,
+    *,
+    erase: bool,
+    prepend: bool,
+) -> TypeGuard[DataFrame]:
+    """
+    Check if the passed in pair_candles (parallel downloaded) cover since_ms.
+    If we need more data, we have to fall back to the standard method.
+    """
+    pair_candles_since_ms = (
+        dt_ts(pair_candles.iloc[0]["date"])
+        if pair_candles is not None and len(pair_candles.index) > 0
+        else 0
+    )
+    return not (
+        pair_candles is None
+        or len(pair_candles.index) == 0
+        or data.empty
+        or prepend is True
+        or erase is True
+        or pair_candles_since_ms > (since_ms if since_ms else 0)
+    )
+
+
+def _download_since_ms(since_ms: int | None, new_pairs_days: int) -> int:
+    return (
+        since_ms
+        if since_ms
+        else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    )
+
+
+def _ohlcv_chunks_to_dataframe(
+    chunks: list[DataFrame | list], pair: str, timeframe: str
+) -> DataFrame:
+    """
+    Convert the result of Exchange.get_historic_ohlcv_chunks() to a dataframe.
+    """
+    frames = [
+        chunk
+        if isinstance(chunk, DataFrame)
+        else ohlcv_to_dataframe(chunk, timeframe, pair, fill_missing=False, drop_incomplete=True)
+        for chunk in chunks
+    ]
+    # Empty chunks are skipped - unless all are empty.
+    frames = [frame for frame in frames if not frame.empty] or frames[-1:]
+    if not frames:
+        return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+    return frames[0] if len(frames) == 1 else concat(frames)
+
+
+def _store_pair_history(
+    pair: str,
+    timeframe: str,
+    data: DataFrame,
+    new_dataframe: DataFrame,
+    *,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    prepend: bool,
+    stats: _DownloadStats | None = None,
+) -> None:
+    """
+    Merge downloaded candles with the stored data, and store the result.
+    """
+    if stats:
+        stats.add(new_dataframe)
+    if data.empty:
+        data = new_dataframe
+    elif not prepend and _append_pair_history(
+        pair, timeframe, new_dataframe, data_handler, candle_type
+    ):
+        # Only the new candles have been written.
+        return
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(
+            concat([data, new_dataframe], axis=0),
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+
+    logger.debug(
+        "New Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -235,6 +543,7 @@ def _download_pair_history(
     erase: bool = False,
     prepend: bool = False,
     pair_candles: DataFrame | None = None,
+    stats: _DownloadStats | None = None,
 ) -> bool:
     """
     Download latest candles from the exchange for the pair and timeframe passed in parameters
@@ -248,96 +557,45 @@ def _download_pair_history(
     :param candle_type: Any of the enum CandleType (must match trading mode!)
     :param erase: Erase existing data
     :param pair_candles: Optional with "1 call" pair candles.
+    :param stats: Optional throughput statistics to update
     :return: bool with success state
     """
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
+        data, since_ms, until_ms = _prepare_pair_download(
             pair,
             timeframe,
-            timerange,
+            datadir=datadir,
             data_handler=data_handler,
+            timerange=timerange,
             candle_type=candle_type,
+            erase=erase,
             prepend=prepend,
         )
-
-        logger.info(
-            f'Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
-            f"{format_ms_time(until_ms) if until_ms else 'now'}"
-        )
-
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        # used to check if the passed in pair_candles (parallel downloaded) covers since_ms.
-        # If we need more data, we have to fall back to the standard method.
-        pair_candles_since_ms = (
-            dt_ts(pair_candles.iloc[0]["date"])
-            if pair_candles is not None and len(pair_candles.index) > 0
-            else 0
-        )
-        if (
-            pair_candles is None
-            or len(pair_candles.index) == 0
-            or data.empty
-            or prepend is True
-            or erase is True
-            or pair_candles_since_ms > (since_ms if since_ms else 0)
-        ):
-            new_dataframe = exchange.get_historic_ohlcv(
-                pair=pair,
-                timeframe=timeframe,
-                since_ms=(
-                    since_ms
-                    if since_ms
-                    else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
-                ),
-                is_new_pair=data.empty,
-                candle_type=candle_type,
-                until_ms=until_ms if until_ms else None,
-            )
-            logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        else:
-            new_dataframe = pair_candles
-            logger.info(
-                f"Downloaded data for {pair} with length {len(new_dataframe)}. Parallel Method."
-            )
-
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
-                pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        new_dataframe = _fetch_pair_history(
+            pair,
+            timeframe,
+            data,
+            since_ms,
+            until_ms,
+            exchange=exchange,
+            new_pairs_days=new_pairs_days,
+            candle_type=candle_type,
+            erase=erase,
+            prepend=prepend,
+            pair_candles=pair_candles,
         )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        _store_pair_history(
+            pair,
+            timeframe,
+            data,
+            new_dataframe,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            prepend=prepend,
+            stats=stats,
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -347,6 +605,178 @@ def _download_pair_history(
         return False
 
 
+def _run_download_pipeline(
+    exchange: Exchange,
+    jobs: list[PairWithTimeframe],
+    workers: int,
+    *,
+    prepare: Callable[[PairWithTimeframe], Any],
+    fetch: Callable[[int, Any], Coroutine[Any, Any, Any]],
+    store: Callable[[int, Any], None],
+    job_started: Callable[[int], None],
+    job_done: Callable[[int], None],
+) -> None:
+    """
+    Run the download of jobs as pipeline of 3 stages.
+    prepare (loading stored data) and store (converting, merging and writing data) run on a
+    thread pool, while fetch runs on the exchange's event loop - for up to
+    `download_data_concurrency` (exchange option) jobs concurrently.
+    At most `workers + download_data_concurrency` jobs are in progress at once - bounding
+    memory usage.
+    :param jobs: List of (pair, timeframe, candle_type) to download
+    :param workers: Number of threads for the prepare and store stages
+    :param prepare: Called with the job, the result is passed to fetch
+    :param fetch: Coroutine function called with the index of the job and the result of
+                  prepare. The result is passed to store, unless it's None.
+    :param store: Called with the index of the job and the result of fetch
+    :param job_started: Called with the index of the job when its fetch starts
+    :param job_done: Called with the index of the job once it's stored - or failed
+    """
+    concurrency = max(int(exchange.get_option("download_data_concurrency", 1)), 1)
+
+    async def run(executor: ThreadPoolExecutor) -> None:
+        in_progress = asyncio.Semaphore(workers + concurrency)
+        fetching = asyncio.Semaphore(concurrency)
+
+        async def run_job(index: int, job: PairWithTimeframe) -> None:
+            try:
+                state = await asyncio.wrap_future(executor.submit(prepare, job))
+                async with fetching:
+                    job_started(index)
+                    fetched = await fetch(index, state)
+                if fetched is not None:
+                    await asyncio.wrap_future(executor.submit(store, index, fetched))
+            except Exception:
+                logger.exception(
+                    f'Failed to download history data for pair: "{job[0]}", timeframe: {job[1]}.'
+                )
+            finally:
+                job_done(index)
+                in_progress.release()
+
+        tasks = []
+        for index, job in enumerate(jobs):
+            await in_progress.acquire()
+            tasks.append(asyncio.create_task(run_job(index, job)))
+        await asyncio.gather(*tasks)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download_data") as executor:
+        exchange.run_download(run(executor))
+
+
+def _ohlcv_download_jobs(
+    exchange: Exchange,
+    pairs: list[str],
+    timeframes: list[str],
+    trading_mode: str,
+    pairs_not_available: list[str],
+) -> list[PairWithTimeframe]:
+    """
+    List of (pair, timeframe, candle_type) to download, ordered by pair.
+    Pairs not available on the exchange are added to pairs_not_available.
+    """
+    candle_type = CandleType.get_default(trading_mode)
+    jobs: list[PairWithTimeframe] = []
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        jobs.extend((pair, str(timeframe), candle_type) for timeframe in timeframes)
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            # Downloads what is necessary to backtest based on futures data.
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            # All exchanges need FundingRate for futures trading.
+            # The timeframe is aligned to the mark-price timeframe.
+            jobs.append((pair, str(tf_funding_rate), CandleType.FUNDING_RATE))
+            jobs.append((pair, str(tf_mark), fr_candle_type))
+    return jobs
+
+
+def _download_pairs_pipelined(
+    jobs: list[PairWithTimeframe],
+    workers: int,
+    *,
+    exchange: Exchange,
+    datadir: Path,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    new_pairs_days: int,
+    erase: bool,
+    prepend: bool,
+    stats: _DownloadStats,
+    get_pair_candles: Callable[[PairWithTimeframe], DataFrame | None],
+    job_started: Callable[[int], None],
+    job_done: Callable[[int], None],
+) -> None:
+    """
+    Download jobs through _run_download_pipeline.
+    """
+
+    def prepare(job: PairWithTimeframe):
+        return _prepare_pair_download(
+            job[0],
+            job[1],
+            datadir=datadir,
+            data_handler=data_handler,
+            timerange=timerange,
+            candle_type=job[2],
+            erase=erase,
+            prepend=prepend,
+        )
+
+    # Parallel downloaded candles use the event loop - so they're downloaded upfront.
+    pair_candles = {job: get_pair_candles(job) for job in jobs}
+
+    async def fetch(index: int, prepared):
+        pair, timeframe, candle_type = jobs[index]
+        data, since_ms, until_ms = prepared
+        candles = pair_candles.pop(jobs[index])
+        if _use_pair_candles(candles, data, since_ms, erase=erase, prepend=prepend):
+            logger.info(f"Downloaded data for {pair} with length {len(candles)}. Parallel Method.")
+            return data, [candles]
+        chunks = await exchange.get_historic_ohlcv_chunks(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=_download_since_ms(since_ms, new_pairs_days),
+            is_new_pair=data.empty,
+            candle_type=candle_type,
+            until_ms=until_ms if until_ms else None,
+        )
+        return data, chunks
+
+    def store(index: int, fetched) -> None:
+        pair, timeframe, candle_type = jobs[index]
+        data, chunks = fetched
+        new_dataframe = _ohlcv_chunks_to_dataframe(chunks, pair, timeframe)
+        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+        _store_pair_history(
+            pair,
+            timeframe,
+            data,
+            new_dataframe,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            prepend=prepend,
+            stats=stats,
+        )
+
+    _run_download_pipeline(
+        exchange,
+        jobs,
+        workers,
+        prepare=prepare,
+        fetch=fetch,
+        store=store,
+        job_started=job_started,
+        job_done=job_done,
+    )
+
+
 def refresh_backtest_ohlcv_data(
     exchange: Exchange,
     pairs: list[str],
@@ -360,103 +790,96 @@ def refresh_backtest_ohlcv_data(
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
     no_parallel_download: bool = False,
+    workers: int = 1,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param workers: Number of threads loading and storing data while other pairs
+        are downloaded concurrently. With 1, pairs are loaded, downloaded and stored
+        one after the other.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
 
-    pairs_not_available = []
+    pairs_not_available: list[str] = []
     fast_candles: dict[PairWithTimeframe, DataFrame] = {}
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
+    stats = _DownloadStats()
+
+    jobs = _ohlcv_download_jobs(exchange, pairs, timeframes, trading_mode, pairs_not_available)
+    parallel_quick = (
+        not no_parallel_download
+        and exchange.get_option("download_data_parallel_quick", True)
+        and (erase is False)
+        and (prepend is False)
+    )
+
+    def get_pair_candles(job: PairWithTimeframe) -> DataFrame | None:
+        pair, timeframe, candle_type_job = job
+        if candle_type_job != candle_type:
+            return None
+        # Get fast candles via parallel method on first loop through per timeframe
+        # and candle type. Downloads all the pairs in the list and stores them.
+        if parallel_quick and (pair, timeframe, candle_type) not in fast_candles:
+            fast_candles.update(
+                _download_all_pairs_history_parallel(
+                    exchange=exchange,
+                    pairs=pairs,
+                    timeframe=timeframe,
+                    candle_type=candle_type,
+                    timerange=timerange,
+                )
+            )
+
+        # get the already downloaded pair candles if they exist
+        return fast_candles.pop((pair, timeframe, candle_type), None)
+
     with progress_tracker as progress:
         tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
         timeframe_task = progress.add_task("Timeframe", total=tf_length)
         pair_task = progress.add_task("Downloading data...", total=len(pairs))
 
-        for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
+        tracker = _DownloadProgress(progress, jobs, candle_type, timeframe_task, pair_task)
 
-            if pair not in exchange.markets:
-                pairs_not_available.append(f"{pair}: Pair not available on exchange.")
-                logger.info(f"Skipping pair {pair}...")
-                continue
-            for timeframe in timeframes:
-                # Get fast candles via parallel method on first loop through per timeframe
-                # and candle type. Downloads all the pairs in the list and stores them.
-                if (
-                    not no_parallel_download
-                    and exchange.get_option("download_data_parallel_quick", True)
-                    and (
-                        ((pair, timeframe, candle_type) not in fast_candles)
-                        and (erase is False)
-                        and (prepend is False)
-                    )
-                ):
-                    fast_candles.update(
-                        _download_all_pairs_history_parallel(
-                            exchange=exchange,
-                            pairs=pairs,
-                            timeframe=timeframe,
-                            candle_type=candle_type,
-                            timerange=timerange,
-                        )
-                    )
-
-                # get the already downloaded pair candles if they exist
-                pair_candles = fast_candles.pop((pair, timeframe, candle_type), None)
-
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
-                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+        if workers > 1 and len(jobs) > 1:
+            _download_pairs_pipelined(
+                jobs,
+                workers,
+                exchange=exchange,
+                datadir=datadir,
+                data_handler=data_handler,
+                timerange=timerange,
+                new_pairs_days=new_pairs_days,
+                erase=erase,
+                prepend=prepend,
+                stats=stats,
+                get_pair_candles=get_pair_candles,
+                job_started=tracker.started,
+                job_done=tracker.done,
+            )
+        else:
+            for index, job in enumerate(jobs):
+                tracker.started(index)
                 _download_pair_history(
-                    pair=pair,
+                    pair=job[0],
                     datadir=datadir,
                     exchange=exchange,
                     timerange=timerange,
                     data_handler=data_handler,
-                    timeframe=str(timeframe),
+                    timeframe=job[1],
                     new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
+                    candle_type=job[2],
                     erase=erase,
                     prepend=prepend,
-                    pair_candles=pair_candles,  # optional pass of dataframe of parallel candles
+                    pair_candles=get_pair_candles(job),
+                    stats=stats,
                 )
-                progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
-                        pair=pair,
-                        datadir=datadir,
-                        exchange=exchange,
-                        timerange=timerange,
-                        data_handler=data_handler,
-                        timeframe=str(tf),
-                        new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
-                        erase=erase,
-                        prepend=prepend,
-                    )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
-
-            progress.update(pair_task, advance=1)
-            progress.update(timeframe_task, description="Timeframe")
+                tracker.done(index)
 
+    if jobs:
+        stats.log()
     return pairs_not_available
 
 
@@ -495,6 +918,107 @@ def _download_all_pairs_history_parallel(
     return candles
 
 
+def _store_trades_manifest(filename: Path, manifest: dict) -> None:
+    """
+    Replace the manifest file atomically - so an interrupted run leaves a valid manifest.
+    """
+    tmp_file = filename.with_name(f"{filename.name}.tmp")
+    file_dump_json(tmp_file, manifest, log=False)
+    tmp_file.replace(filename)
+
+
+def _ingest_trades_archive(
+    exchange: Exchange,
+    pair: str,
+    *,
+    since: int,
+    until: int | None,
+    data_handler: IDataHandler,
+    trading_mode: TradingMode,
+) -> DataFrame | None:
+    """
+    Stream the daily trade archives of the exchange into the stored trades of the pair,
+    appending one day at a time - so the full history is never held in memory.
+    Ingested days are recorded in a manifest (with the checksum of their archive),
+    so an interrupted download continues after the last ingested day.
+    Trades which are already stored (by an interrupted run, or downloaded from the REST API
+    after the archive) are skipped - so ingesting a day again doesn't duplicate trades.
+    :return: Last stored trades (including all trades sharing the last timestamp) - None if
+        no archive was ingested, as the exchange or data format doesn't support it, or
+        trades were not stored in bulk mode.
+    """
+    manifest_file = data_handler.trades_manifest_filename(pair, trading_mode)
+    manifest = file_load_json(manifest_file) or {"days": {}}
+    days: dict[str, dict] = manifest["days"]
+    if days:
+        first_day = datetime.strptime(min(days), "%Y-%m-%d").replace(tzinfo=UTC)
+        if since < dt_ts(first_day):
+            raise ValueError(
+                f"Start {format_ms_time_det(since)} earlier than "
+                f"available data ({first_day:{DATETIME_PRINT_FORMAT}}). "
+                f"Please use `--erase` if you'd like to redownload {pair}."
+            )
+        last_day = dt_ts(datetime.strptime(max(days), "%Y-%m-%d").replace(tzinfo=UTC))
+        since = last_day + 86400_000
+        logger.info(f"Continuing trade archive download for {pair} after {max(days)}.")
+        # Stored trades from the last ingested day onwards - used as high-water mark.
+        known = data_handler.trades_load(
+            pair, trading_mode, timerange=TimeRange("date", None, last_day, 0)
+        )
+    elif not (known := data_handler.trades_load(pair, trading_mode)).empty:
+        logger.warning(
+            f"Trades of {pair} were not downloaded in bulk mode, downloading without bulk mode. "
+            f"Please use `--erase` if you'd like to redownload {pair} in bulk mode."
+        )
+        return None
+
+    for day in exchange.get_historic_trades_archive(pair, since=since, until=until):
+        trades = trades_df_after_last(known, trades_convert_types(day.trades))
+        try:
+            data_handler.trades_append(pair, trades, trading_mode)
+        except NotImplementedError:
+            logger.warning(
+                f"Bulk trades download is not supported by {type(data_handler).__name__}, "
+                "downloading without bulk mode."
+            )
+            return None
+        if not trades.empty:
+            known = trades
+        days[day.day] = {"sha256": day.sha256, "trades": len(trades)}
+        _store_trades_manifest(manifest_file, manifest)
+        logger.info(f"Stored {len(trades)} archived trades of {pair} for {day.day}.")
+
+    return None if known.empty else known
+
+
+def _download_trades_after_archive(
+    exchange: Exchange,
+    pair: str,
+    known: DataFrame,
+    *,
+    until: int | None,
+    data_handler: IDataHandler,
+    trading_mode: TradingMode,
+) -> bool:
+    """
+    Download trades following the stored trades, appending them to the stored trades.
+    :param known: Last stored trades, including all trades sharing the last timestamp
+    """
+    # - 5 seconds (to ensure we're getting all trades)
+    since = int(known["timestamp"].iat[-1] - (5 * 1000))
+    logger.info(f"Downloading trades for {pair} since: {format_ms_time(since)}.")
+    new_trades = exchange.get_historic_trades(
+        pair=pair,
+        since=since,
+        until=until,
+        from_id=known["id"].iat[-1],
+    )
+    new_trades_df = trades_df_after_last(known, trades_list_to_df(new_trades[1]))
+    data_handler.trades_append(pair, new_trades_df, trading_mode)
+    logger.info(f"Appended {len(new_trades_df)} trades.")
+    return True
+
+
 def _download_trades_history(
     exchange: Exchange,
     pair: str,
@@ -503,10 +1027,12 @@ def _download_trades_history(
     timerange: TimeRange | None = None,
     data_handler: IDataHandler,
     trading_mode: TradingMode,
+    bulk: bool = False,
 ) -> bool:
     """
     Download trade history from the exchange.
     Appends to previously downloaded trades data.
+    :param bulk: Stream trade archives of the exchange (if available) into the stored trades
     """
     until = None
     since = 0
@@ -516,6 +1042,25 @@ def _download_trades_history(
         if timerange.stoptype == "date":
             until = timerange.stopts * 1000
 
+    if bulk:
+        known = _ingest_trades_archive(
+            exchange,
+            pair,
+            since=since or dt_ts(dt_now() - timedelta(days=new_pairs_days)),
+            until=until,
+            data_handler=data_handler,
+            trading_mode=trading_mode,
+        )
+        if known is not None:
+            return _download_trades_after_archive(
+                exchange,
+                pair,
+                known,
+                until=until,
+                data_handler=data_handler,
+                trading_mode=trading_mode,
+            )
+
     trades = data_handler.trades_load(pair, trading_mode)
 
     # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
@@ -587,10 +1132,13 @@ def refresh_backtest_trades_data(
     erase: bool = False,
     data_format: str = "feather",
     progress_tracker: CustomProgress | None = None,
+    bulk: bool = False,
 ) -> list[str]:
     """
     Refresh stored trades data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param bulk: Stream trade archives of the exchange (if available) into the stored trades,
+        without holding all trades in memory.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -618,6 +1166,7 @@ def refresh_backtest_trades_data(
                     timerange=timerange,
                     data_handler=data_handler,
                     trading_mode=trading_mode,
+                    bulk=bulk,
                 )
             except ValueError as e:
                 pairs_not_available.append(f"{pair}: {str(e)}")
@@ -751,6 +1300,7 @@ def download_data(
                 data_format=config["dataformat_trades"],
                 trading_mode=config.get("trading_mode", TradingMode.SPOT),
                 progress_tracker=progress_tracker,
+                bulk=config.get("download_trades_bulk", False),
             )
 
             if config.get("convert_trades") or not exchange.get_option("ohlcv_has_history", True):
@@ -794,6 +1344,7 @@ def download_data(
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
                 no_parallel_download=config.get("no_parallel_download", False),
+                workers=config.get("download_data_workers", 1),
             )
     finally:
         if pairs_not_available:
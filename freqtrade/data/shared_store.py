@@ -0,0 +1,328 @@
+"""
+Columnar stores for dataframes.
+Allow multiple processes to attach to the same candle data without pickling or copying it -
+either via shared memory (SharedDataStore) or via memory-mapped files (MmapDataStore).
+"""
+
+import logging
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Literal
+from uuid import uuid4
+
+import numpy as np
+from joblib import dump, load
+from pandas import DataFrame, to_datetime
+
+
+logger = logging.getLogger(__name__)
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attach to an existing shared memory block.
+    Attached blocks must not be registered with the resource tracker - it would unlink them
+    once the attaching process exits. The creating process remains responsible for their lifetime.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _get_column_layout(
+    data: dict[Any, DataFrame],
+) -> tuple[dict[str, Any], list[tuple[str, list[np.ndarray | None], np.dtype | None, bool]]]:
+    """
+    Prepare the columnar layout of data.
+    Each column spans the rows of all keys - keys without the column leave their rows unset.
+    :return: Tuple of the layout spec and (column, arrays per key, dtype, is_date) per column.
+        dtype is None for columns which can't be stored in a numpy buffer.
+    """
+    keys = list(data.keys())
+    key_columns = [list(df.columns) for df in data.values()]
+    all_columns = list(dict.fromkeys(col for cols in key_columns for col in cols))
+
+    lengths = np.array([len(data[key]) for key in keys], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
+
+    columns: list[tuple[str, list[np.ndarray | None], np.dtype | None, bool]] = []
+    for col in all_columns:
+        present = [df[col] for df in data.values() if col in df.columns]
+        is_date = all(series.dtype.kind == "M" for series in present)
+        arrays: list[np.ndarray | None] = [
+            (df[col].dt.as_unit("ns").array.asi8 if is_date else df[col].to_numpy())
+            if col in df.columns
+            else None
+            for df in data.values()
+        ]
+        try:
+            dtype: np.dtype | None = np.result_type(*(arr for arr in arrays if arr is not None))
+        except TypeError:
+            dtype = None
+        if dtype is not None and dtype.kind not in "biufM" and not is_date:
+            dtype = None
+        columns.append((col, arrays, dtype, is_date))
+
+    spec = {
+        "id": uuid4().hex,
+        "keys": keys,
+        "offsets": offsets,
+        "key_columns": key_columns,
+    }
+    return spec, columns
+
+
+def _fill_column(target: np.ndarray, arrays: list[np.ndarray | None], offsets: list[int]) -> None:
+    for arr, start, end in zip(arrays, offsets[:-1], offsets[1:], strict=True):
+        if arr is not None:
+            target[start:end] = arr
+
+
+class ColumnarDataStore:
+    """
+    Base class for columnar stores of a dict of dataframes (usually {pair: dataframe}).
+    Holds one buffer per column - with rows of all keys concatenated.
+    Numeric, boolean and datetime columns are stored in buffers, other (object) columns are
+    carried inside the (picklable) spec. The index of the dataframes is not preserved.
+    """
+
+    def __init__(self, spec: dict[str, Any], arrays: dict[str, np.ndarray]):
+        self.spec = spec
+        self._arrays = arrays
+
+    def column(self, col: str) -> np.ndarray:
+        """
+        Read-only view of one column, spanning all keys.
+        """
+        arr = self._arrays[col].view()
+        arr.flags.writeable = False
+        return arr
+
+    def to_dataframe(self, key: Any) -> DataFrame:
+        """
+        Rebuild the dataframe of one key.
+        The dataframe is a copy, so it remains valid after the store is closed.
+        """
+        return self._to_dataframe(self.spec["keys"].index(key))
+
+    def _to_dataframe(
+        self, idx: int, arrays: dict[str, np.ndarray] | None = None, copy: bool = True
+    ) -> DataFrame:
+        """
+        :param arrays: Buffers to build the dataframe from - defaults to the store's buffers
+        :param copy: Copy numeric columns. Without copy, the dataframe uses slices of arrays.
+        """
+        arrays = self._arrays if arrays is None else arrays
+        start, end = self.spec["offsets"][idx], self.spec["offsets"][idx + 1]
+        column_info = {col: (dtype, is_date) for col, dtype, _, is_date in self.spec["columns"]}
+        frame: dict[str, Any] = {}
+        for col in self.spec["key_columns"][idx]:
+            dtype, is_date = column_info[col]
+            if dtype == "object":
+                frame[col] = self.spec["objects"][col][idx].copy()
+            elif is_date:
+                frame[col] = to_datetime(arrays[col][start:end], utc=True)
+            else:
+                frame[col] = arrays[col][start:end]
+        return DataFrame(frame, columns=self.spec["key_columns"][idx], copy=copy)
+
+    def to_dataframes(self) -> dict[Any, DataFrame]:
+        """
+        Rebuild the dict of dataframes.
+        Dataframes are copies, so they remain valid after the store is closed.
+        """
+        return {key: self._to_dataframe(idx) for idx, key in enumerate(self.spec["keys"])}
+
+    def close(self) -> None:
+        """
+        Release this process' views of the buffers.
+        """
+        self._arrays = {}
+
+
+class SharedDataStore(ColumnarDataStore):
+    """
+    Columnar store in shared memory.
+    Shared memory blocks live until the creating store is unlinked.
+
+    Usage:
+    store = SharedDataStore.create(data)
+    # in the worker process
+    worker_store = SharedDataStore.attach(store.spec)
+    data = worker_store.to_dataframes()
+    worker_store.close()
+    # in the creating process, once all workers are done
+    store.unlink()
+    """
+
+    def __init__(self, spec: dict[str, Any], buffers: dict[str, SharedMemory], owner: bool):
+        super().__init__(
+            spec,
+            {
+                col: np.ndarray(
+                    (spec["offsets"][-1],), dtype=np.dtype(dtype), buffer=buffers[col].buf
+                )
+                for col, dtype, _, _ in spec["columns"]
+                if col in buffers
+            },
+        )
+        self._buffers = buffers
+        self._owner = owner
+
+    @classmethod
+    def create(cls, data: dict[Any, DataFrame]) -> "SharedDataStore":
+        """
+        Copy data into newly created shared memory blocks.
+        :param data: dict of dataframes
+        :return: SharedDataStore owning the shared memory blocks
+        """
+        spec, columns = _get_column_layout(data)
+        total = spec["offsets"][-1]
+        spec_columns: list[tuple[str, str, str | None, bool]] = []
+        objects: dict[str, list[np.ndarray | None]] = {}
+        buffers: dict[str, SharedMemory] = {}
+        try:
+            for col, arrays, dtype, is_date in columns:
+                if dtype is None:
+                    # Object (e.g. string) columns can't be shared - ship them in the spec.
+                    objects[col] = arrays
+                    spec_columns.append((col, "object", None, False))
+                    continue
+                shm = SharedMemory(create=True, size=max(total * dtype.itemsize, 1))
+                buffers[col] = shm
+                _fill_column(
+                    np.ndarray((total,), dtype=dtype, buffer=shm.buf), arrays, spec["offsets"]
+                )
+                spec_columns.append((col, dtype.str, shm.name, is_date))
+        except Exception:
+            for shm in buffers.values():
+                shm.close()
+                shm.unlink()
+            raise
+
+        spec.update({"columns": spec_columns, "objects": objects})
+        return cls(spec, buffers, owner=True)
+
+    @classmethod
+    def attach(cls, spec: dict[str, Any]) -> "SharedDataStore":
+        """
+        Attach to shared memory blocks created by SharedDataStore.create().
+        :param spec: SharedDataStore.spec of the creating store
+        """
+        buffers = {
+            col: _attach_shared_memory(name)
+            for col, _, name, _ in spec["columns"]
+            if name is not None
+        }
+        return cls(spec, buffers, owner=False)
+
+    def close(self) -> None:
+        """
+        Close this process' handles to the shared memory blocks.
+        """
+        # Views must be released before the blocks can be closed.
+        super().close()
+        for shm in self._buffers.values():
+            shm.close()
+
+    def unlink(self) -> None:
+        """
+        Close and release the shared memory blocks. Only valid for the creating store.
+        """
+        self.close()
+        if self._owner:
+            for shm in self._buffers.values():
+                shm.unlink()
+        self._buffers = {}
+
+
+class MmapDataStore(ColumnarDataStore):
+    """
+    Columnar store in memory-mapped files (one .npy file per column).
+    Processes loading the same directory share the pages of the operating system's file cache,
+    and the data survives the creating process.
+
+    Usage:
+    MmapDataStore.create(data, directory)
+    # in any process
+    store = MmapDataStore.load(directory)
+    data = store.to_dataframes()
+    """
+
+    SPEC_FILE = "spec.pkl"
+
+    def __init__(self, spec: dict[str, Any], arrays: dict[str, np.ndarray], directory: Path):
+        super().__init__(spec, arrays)
+        self.directory = directory
+
+    @classmethod
+    def create(cls, data: dict[Any, DataFrame], directory: Path) -> "MmapDataStore":
+        """
+        Write data to a new store in directory.
+        :param data: dict of dataframes
+        :param directory: Directory for the store. Existing stores in it are replaced.
+        :return: MmapDataStore loaded from directory
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / cls.SPEC_FILE).unlink(missing_ok=True)
+        # Remove columns of a previous store - they'd never be cleaned up otherwise.
+        for file in directory.glob("column_*.npy"):
+            file.unlink()
+        spec, columns = _get_column_layout(data)
+        total = spec["offsets"][-1]
+        spec_columns: list[tuple[str, str, str | None, bool]] = []
+        objects: dict[str, list[np.ndarray | None]] = {}
+        for idx, (col, arrays, dtype, is_date) in enumerate(columns):
+            if dtype is None:
+                objects[col] = arrays
+                spec_columns.append((col, "object", None, False))
+                continue
+            filename = f"column_{idx}.npy"
+            target = np.zeros((total,), dtype=dtype)
+            _fill_column(target, arrays, spec["offsets"])
+            np.save(directory / filename, target)
+            spec_columns.append((col, dtype.str, filename, is_date))
+
+        spec.update({"columns": spec_columns, "objects": objects})
+        # Spec is written last - so an interrupted write never leaves a loadable store.
+        dump(spec, directory / cls.SPEC_FILE)
+        return cls.load(directory)
+
+    @classmethod
+    def load(cls, directory: Path) -> "MmapDataStore":
+        """
+        Memory-map a store created by MmapDataStore.create().
+        :param directory: Directory of the store
+        """
+        spec = load(directory / cls.SPEC_FILE)
+        return cls(spec, cls._map_columns(spec, directory, "r"), directory)
+
+    @staticmethod
+    def _map_columns(
+        spec: dict[str, Any], directory: Path, mode: Literal["r", "c"]
+    ) -> dict[str, np.ndarray]:
+        return {
+            col: np.load(directory / filename, mmap_mode=mode)
+            for col, _, filename, _ in spec["columns"]
+            if filename is not None
+        }
+
+    def to_cow_dataframes(self) -> dict[Any, DataFrame]:
+        """
+        Rebuild the dict of dataframes without copying numeric columns.
+        Columns are fresh copy-on-write mappings of the store's files: pages are shared with
+        all other processes until written to - modifications only affect the returned dataframes.
+        Dataframes must not be used once the store is replaced.
+        """
+        arrays = self._map_columns(self.spec, self.directory, "c")
+        return {
+            key: self._to_dataframe(idx, arrays, copy=False)
+            for idx, key in enumerate(self.spec["keys"])
+        }
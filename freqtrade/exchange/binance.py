@@ -1,6 +1,7 @@
 """Binance exchange subclass"""
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -16,9 +17,10 @@ from freqtrade.exchange.binance_public_data import (
     concat_safe,
     download_archive_ohlcv,
     download_archive_trades,
+    iter_archive_trades,
 )
 from freqtrade.exchange.common import retrier
-from freqtrade.exchange.exchange_types import FtHas, Tickers
+from freqtrade.exchange.exchange_types import FtHas, Tickers, TradesArchiveDay
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
 from freqtrade.misc import deep_merge_dicts, json_load
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts
@@ -161,36 +163,16 @@ class Binance(Exchange):
         """
         if is_new_pair and candle_type in (CandleType.SPOT, CandleType.FUTURES, CandleType.MARK):
             with self._loop_lock:
-                x = self.loop.run_until_complete(
-                    self._async_get_candle_history(pair, timeframe, candle_type, 0)
+                since_ms = self.loop.run_until_complete(
+                    self._async_get_listing_since_ms(pair, timeframe, candle_type, since_ms)
                 )
-            if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
-                # Set starting date to first available candle.
-                since_ms = x[3][0][0]
-                logger.info(
-                    f"Candle-data for {pair} available starting with "
-                    f"{datetime.fromtimestamp(since_ms // 1000, tz=UTC).isoformat()}."
+            if until_ms and since_ms >= until_ms:
+                logger.warning(
+                    f"No available candle-data for {pair} before {dt_from_ts(until_ms).isoformat()}"
                 )
-                if until_ms and since_ms >= until_ms:
-                    logger.warning(
-                        f"No available candle-data for {pair} before "
-                        f"{dt_from_ts(until_ms).isoformat()}"
-                    )
-                    return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
-
-        if (
-            self._config["exchange"].get("only_from_ccxt", False)
-            or
-            # only download timeframes with significant improvements,
-            # otherwise fall back to rest API
-            not (
-                (candle_type == CandleType.SPOT and timeframe in ["1s", "1m", "3m", "5m"])
-                or (
-                    candle_type == CandleType.FUTURES
-                    and timeframe in ["1m", "3m", "5m", "15m", "30m"]
-                )
-            )
-        ):
+                return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+
+        if not self._use_archive_ohlcv(timeframe, candle_type):
             return super().get_historic_ohlcv(
                 pair=pair,
                 timeframe=timeframe,
@@ -210,6 +192,86 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
+    async def get_historic_ohlcv_chunks(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> list[DataFrame | list]:
+        """
+        Coroutine variant of get_historic_ohlcv(), with "fast new pair" detection and
+        downloads from data.binance.vision.
+        """
+        if is_new_pair and candle_type in (CandleType.SPOT, CandleType.FUTURES, CandleType.MARK):
+            since_ms = await self._async_get_listing_since_ms(
+                pair, timeframe, candle_type, since_ms
+            )
+            if until_ms and since_ms >= until_ms:
+                logger.warning(
+                    f"No available candle-data for {pair} before {dt_from_ts(until_ms).isoformat()}"
+                )
+                return []
+
+        if not self._use_archive_ohlcv(timeframe, candle_type):
+            return await super().get_historic_ohlcv_chunks(
+                pair, timeframe, since_ms, candle_type, is_new_pair, until_ms
+            )
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
+        )
+        rest_since_ms = self._rest_since_ms(df, timeframe, since_ms)
+        if until_ms and rest_since_ms > until_ms:
+            return [df]
+        return [
+            df,
+            *await super().get_historic_ohlcv_chunks(
+                pair, timeframe, rest_since_ms, candle_type, is_new_pair, until_ms
+            ),
+        ]
+
+    async def _async_get_listing_since_ms(
+        self, pair: str, timeframe: str, candle_type: CandleType, since_ms: int
+    ) -> int:
+        """
+        Move since_ms to the first available candle if the pair was listed after since_ms.
+        """
+        x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
+        if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
+            # Set starting date to first available candle.
+            since_ms = x[3][0][0]
+            logger.info(
+                f"Candle-data for {pair} available starting with "
+                f"{datetime.fromtimestamp(since_ms // 1000, tz=UTC).isoformat()}."
+            )
+        return since_ms
+
+    def _use_archive_ohlcv(self, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Download from data.binance.vision - only for timeframes with significant improvements,
+        otherwise fall back to rest API.
+        """
+        return not self._config["exchange"].get("only_from_ccxt", False) and (
+            (candle_type == CandleType.SPOT and timeframe in ["1s", "1m", "3m", "5m"])
+            or (candle_type == CandleType.FUTURES and timeframe in ["1m", "3m", "5m", "15m", "30m"])
+        )
+
+    @staticmethod
+    def _rest_since_ms(df: DataFrame, timeframe: str, since_ms: int) -> int:
+        """
+        Start of the data to download from the rest API, after the archived candles in df.
+        """
+        if df.empty:
+            return since_ms
+        return dt_ts(df.iloc[-1].date) + timeframe_to_msecs(timeframe)
+
     def get_historic_ohlcv_fast(
         self,
         pair: str,
@@ -235,10 +297,7 @@ class Binance(Exchange):
             )
 
         # download the remaining data from rest API
-        if df.empty:
-            rest_since_ms = since_ms
-        else:
-            rest_since_ms = dt_ts(df.iloc[-1].date) + timeframe_to_msecs(timeframe)
+        rest_since_ms = self._rest_since_ms(df, timeframe, since_ms)
 
         # make sure since <= until
         if until_ms and rest_since_ms > until_ms:
@@ -443,6 +502,34 @@ class Binance(Exchange):
             pair, until=until, since=since, from_id=from_id
         )
 
+    def get_historic_trades_archive(
+        self, pair: str, since: int, until: int | None = None
+    ) -> Iterator[TradesArchiveDay]:
+        """
+        Stream daily trade archives from https://data.binance.vision.
+        Days are downloaded concurrently, ahead of the day returned.
+        """
+        if self._config["exchange"].get("only_from_ccxt", False):
+            return
+        days = iter_archive_trades(
+            CandleType.FUTURES if self.trading_mode == "futures" else CandleType.SPOT,
+            pair,
+            since_ms=since,
+            until_ms=until,
+            markets=self.markets,
+        )
+        try:
+            while True:
+                with self._loop_lock:
+                    try:
+                        day = self.loop.run_until_complete(anext(days))
+                    except StopAsyncIteration:
+                        return
+                yield day
+        finally:
+            with self._loop_lock:
+                self.loop.run_until_complete(days.aclose())
+
     def _check_delisting_futures(self, pair: str) -> datetime | None:
         delivery_time = self.markets.get(pair, {}).get("info", {}).get("deliveryDate", None)
         if delivery_time:
@@ -4,11 +4,14 @@ Documentation can be found in https://github.com/binance/binance-public-data
 """
 
 import asyncio
+import hashlib
 import logging
 import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
 from datetime import date, timedelta
 from io import BytesIO
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 import numpy as np
@@ -17,12 +20,39 @@ from pandas import DataFrame
 
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_types import TradesArchiveDay
 from freqtrade.misc import chunks
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_now
 
 
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Columns of aggTrades archives. Spot archives have an additional "is_best_match" column.
+AGG_TRADES_COLUMNS = [
+    "id",
+    "price",
+    "amount",
+    "first_trade_id",
+    "last_trade_id",
+    "timestamp",
+    "is_buyer_maker",
+    "is_best_match",
+]
+_AGG_TRADES_TYPES = {
+    "id": "int64",
+    "price": "float64",
+    "amount": "float64",
+    "timestamp": "int64",
+    "is_buyer_maker": "bool",
+}
+
 
 class Http404(Exception):
     def __init__(self, msg, date, url):
@@ -37,6 +67,12 @@ class BadHttpStatus(Exception):
     pass
 
 
+class ChecksumMismatch(Exception):
+    """Downloaded archive doesn't match the published checksum"""
+
+    pass
+
+
 async def download_archive_ohlcv(
     candle_type: CandleType,
     pair: str,
@@ -336,80 +372,67 @@ async def download_archive_trades(
         return pair, []
 
 
-def parse_trades_from_zip(csvf):
+def trades_df_from_zip(csvf) -> DataFrame:
+    """
+    Parse an aggTrades csv file into a dataframe with DEFAULT_TRADES_COLUMNS.
+    Uses the multithreaded Arrow csv reader - if pyarrow is available.
+    """
     # https://github.com/binance/binance-public-data/issues/283
     first_byte = csvf.read(1)[0]
-    if chr(first_byte).isdigit():
-        # spot
-        header = None
-        names = [
-            "id",
-            "price",
-            "amount",
-            "first_trade_id",
-            "last_trade_id",
-            "timestamp",
-            "is_buyer_maker",
-            "is_best_match",
-        ]
-    else:
-        # futures
-        header = 0
-        names = [
-            "id",
-            "price",
-            "amount",
-            "first_trade_id",
-            "last_trade_id",
-            "timestamp",
-            "is_buyer_maker",
-        ]
+    # Spot archives don't have a header line, futures archives lack the last column
+    has_header = not chr(first_byte).isdigit()
+    names = AGG_TRADES_COLUMNS[:-1] if has_header else AGG_TRADES_COLUMNS
     csvf.seek(0)
 
-    df = pd.read_csv(
-        csvf,
-        names=names,
-        header=header,
-    )
-    df.loc[:, "cost"] = df["price"] * df["amount"]
+    if pa_csv is not None:
+        df = pa_csv.read_csv(
+            csvf,
+            read_options=pa_csv.ReadOptions(
+                column_names=names, skip_rows=1 if has_header else 0, use_threads=True
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_AGG_TRADES_TYPES, include_columns=list(_AGG_TRADES_TYPES)
+            ),
+        ).to_pandas()
+    else:  # pragma: no cover
+        df = pd.read_csv(
+            csvf,
+            names=names,
+            header=0 if has_header else None,
+            usecols=list(_AGG_TRADES_TYPES),
+            dtype=_AGG_TRADES_TYPES,
+        )
+    df["cost"] = df["price"] * df["amount"]
     # Side is reversed intentionally
     # based on ccxt parseTrade logic.
-    df.loc[:, "side"] = np.where(df["is_buyer_maker"], "sell", "buy")
-    df.loc[:, "type"] = None
+    df["side"] = np.where(df["is_buyer_maker"], "sell", "buy")
+    df["type"] = None
     # Convert timestamp to ms
-    df.loc[:, "timestamp"] = np.where(
+    df["timestamp"] = np.where(
         df["timestamp"] > 1e13,
         df["timestamp"] // 1000,
         df["timestamp"],
     )
-    return df.loc[:, DEFAULT_TRADES_COLUMNS].to_records(index=False).tolist()
+    return df.loc[:, DEFAULT_TRADES_COLUMNS]
 
 
-async def get_daily_trades(
-    symbol: str,
-    candle_type: CandleType,
+def parse_trades_from_zip(csvf):
+    return trades_df_from_zip(csvf).to_records(index=False).tolist()
+
+
+async def _download_zip(
+    url: str,
     date: date,
     session: aiohttp.ClientSession,
+    parse: Callable[[bytes], T],
     retry_count: int = 3,
     retry_delay: float = 0.0,
-) -> list[list]:
+) -> T:
     """
-    Get daily OHLCV from https://data.binance.vision
-    See https://github.com/binance/binance-public-data
-
-    :symbol: binance symbol name, e.g. BTCUSDT
-    :candle_type: SPOT or FUTURES
-    :date: the returned DataFrame will cover the entire day of `date` in UTC
-    :session: an aiohttp.ClientSession instance
-    :retry_count: times to retry before returning the exceptions
-    :retry_delay: the time to wait before every retry
-    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    Download an archive from https://data.binance.vision
+    :param parse: Called with the content of the zip file - retried if it fails
+    :return: Result of parse
     """
-
-    url = binance_vision_trades_zip_url(symbol, candle_type, date)
-
-    logger.debug(f"download trades data from binance: {url}")
-
     retry = 0
     while True:
         if retry > 0:
@@ -423,9 +446,7 @@ async def get_daily_trades(
                 if resp.status == 200:
                     content = await resp.read()
                     logger.debug(f"Successfully downloaded {url}")
-                    with zipfile.ZipFile(BytesIO(content)) as zipf:
-                        with zipf.open(zipf.namelist()[0]) as csvf:
-                            return parse_trades_from_zip(csvf)
+                    return parse(content)
                 elif resp.status == 404:
                     logger.debug(f"Failed to download {url}")
                     raise Http404(f"404: {url}", date, url)
@@ -439,6 +460,141 @@ async def get_daily_trades(
                 raise
 
 
+async def _download_checksum(url: str, session: aiohttp.ClientSession) -> str | None:
+    """
+    Published sha256 checksum of an archive - None if no checksum is available.
+    Checksum files contain "<sha256>  <filename>".
+    """
+    async with session.get(f"{url}.CHECKSUM") as resp:
+        if resp.status != 200:
+            logger.debug(f"No checksum available for {url}")
+            return None
+        content = await resp.read()
+    return content.decode().split()[0].lower()
+
+
+async def get_daily_trades(
+    symbol: str,
+    candle_type: CandleType,
+    date: date,
+    session: aiohttp.ClientSession,
+    retry_count: int = 3,
+    retry_delay: float = 0.0,
+) -> list[list]:
+    """
+    Get daily OHLCV from https://data.binance.vision
+    See https://github.com/binance/binance-public-data
+
+    :symbol: binance symbol name, e.g. BTCUSDT
+    :candle_type: SPOT or FUTURES
+    :date: the returned DataFrame will cover the entire day of `date` in UTC
+    :session: an aiohttp.ClientSession instance
+    :retry_count: times to retry before returning the exceptions
+    :retry_delay: the time to wait before every retry
+    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    """
+
+    url = binance_vision_trades_zip_url(symbol, candle_type, date)
+
+    logger.debug(f"download trades data from binance: {url}")
+
+    def parse(content: bytes) -> list[list]:
+        with zipfile.ZipFile(BytesIO(content)) as zipf:
+            with zipf.open(zipf.namelist()[0]) as csvf:
+                return parse_trades_from_zip(csvf)
+
+    return await _download_zip(url, date, session, parse, retry_count, retry_delay)
+
+
+async def get_daily_trades_archive(
+    symbol: str,
+    candle_type: CandleType,
+    date: date,
+    session: aiohttp.ClientSession,
+    retry_count: int = 3,
+    retry_delay: float = 0.0,
+) -> TradesArchiveDay:
+    """
+    Get the trades of one day from https://data.binance.vision, verified against the
+    published checksum. Parsing runs in a thread, so other downloads continue meanwhile.
+    :return: TradesArchiveDay with the checksum of the archive and a dataframe of its trades
+    """
+    url = binance_vision_trades_zip_url(symbol, candle_type, date)
+    logger.debug(f"download trades archive from binance: {url}")
+
+    content = await _download_zip(url, date, session, bytes, retry_count, retry_delay)
+    sha256 = hashlib.sha256(content).hexdigest()
+    expected = await _download_checksum(url, session)
+    if expected is not None and expected != sha256:
+        raise ChecksumMismatch(f"Checksum mismatch for {url}: expected {expected}, got {sha256}")
+
+    def parse() -> DataFrame:
+        with zipfile.ZipFile(BytesIO(content)) as zipf:
+            with zipf.open(zipf.namelist()[0]) as csvf:
+                return trades_df_from_zip(csvf)
+
+    trades = await asyncio.to_thread(parse)
+    return TradesArchiveDay(date.strftime("%Y-%m-%d"), sha256, trades)
+
+
+async def iter_archive_trades(
+    candle_type: CandleType,
+    pair: str,
+    *,
+    since_ms: int,
+    until_ms: int | None,
+    markets: dict[str, Any],
+    prefetch: int = 8,
+) -> AsyncGenerator[TradesArchiveDay, None]:
+    """
+    Stream trades from https://data.binance.vision one day at a time, in order of the days.
+    Unlike download_archive_trades, only `prefetch` days are held in memory, so the caller can
+    store each day before the next days are downloaded.
+    Stops at the first missing day or failing download - so the days returned have no gaps.
+    :param since_ms: Start of the first day to return
+    :param until_ms: End of the data, `None` for the latest available data
+    :param prefetch: Number of days downloaded concurrently
+    """
+    symbol = markets[pair]["id"]
+    start = dt_from_ts(since_ms)
+    end = dt_from_ts(until_ms) if until_ms else dt_now()
+    end = min(end, dt_now() - timedelta(days=2))
+    if start >= end:
+        return
+
+    days = date_range(start, end)
+    connector = aiohttp.TCPConnector(limit=100)
+    async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
+        pending: deque[asyncio.Task] = deque()
+
+        def download_next() -> None:
+            if (day := next(days, None)) is not None:
+                pending.append(
+                    asyncio.create_task(get_daily_trades_archive(symbol, candle_type, day, session))
+                )
+
+        for _ in range(prefetch):
+            download_next()
+        try:
+            while pending:
+                task = pending.popleft()
+                try:
+                    result = await task
+                except Http404 as e:
+                    logger.warning(
+                        f"Binance trades archive for {pair} stopped at {e.date} due to "
+                        f"missing data: {e.url}."
+                    )
+                    return
+                except Exception as e:
+                    logger.warning(f"Binance trades archive for {pair} stopped: {e}")
+                    return
+                download_next()
+                yield result
+        finally:
+            await cancel_and_await_tasks(list(pending))
+
+
 async def _download_archive_trades(
     symbol: str,
     pair: str,
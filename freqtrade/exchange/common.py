@@ -35,6 +35,10 @@ def _get_logging_mixin():
 API_RETRY_COUNT = 4
 API_FETCH_ORDER_RETRY_COUNT = 5
 
+# Number of appends to the stored public trades cache before the retained trades are
+# rewritten (removing aged out trades from disk).
+TRADES_CACHE_STORE_INTERVAL = 24
+
 BAD_EXCHANGES = {
     "bitmex": "Various reasons.",
     "probit": "Requires additional, regular calls to `signIn()`.",
@@ -7,7 +7,7 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Coroutine, Generator, Iterator
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
@@ -38,9 +38,8 @@ from freqtrade.constants import (
     PairWithTimeframe,
 )
 from freqtrade.data.converter import (
-    clean_ohlcv_dataframe,
     ohlcv_to_dataframe,
-    trades_df_remove_duplicates,
+    trades_df_after_last,
     trades_dict_to_list,
     trades_list_to_df,
 )
@@ -66,6 +65,7 @@ from freqtrade.exceptions import (
 )
 from freqtrade.exchange.common import (
     API_FETCH_ORDER_RETRY_COUNT,
+    TRADES_CACHE_STORE_INTERVAL,
     retrier,
     retrier_async,
 )
@@ -79,6 +79,7 @@ from freqtrade.exchange.exchange_types import (
     OrderBook,
     Ticker,
     Tickers,
+    TradesArchiveDay,
 )
 from freqtrade.exchange.exchange_utils import (
     ROUND,
@@ -101,6 +102,7 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.kline_cache import KlineCache
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -140,6 +142,7 @@ class Exchange:
         "ohlcv_partial_candle": True,
         "ohlcv_require_since": False,
         "download_data_parallel_quick": True,
+        "download_data_concurrency": 4,  # Pairs downloaded concurrently by download-data
         "always_require_api_keys": False,  # purge API keys for Dry-run. Must default to false.
         # Check https://github.com/ccxt/ccxt/issues/10767 for removal of ohlcv_volume_currency
         "ohlcv_volume_currency": "base",  # "base" or "quote"
@@ -240,11 +243,13 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines = KlineCache()
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
         self._trades: dict[PairWithTimeframe, DataFrame] = {}
+        # Appends to the stored trades cache since it was last rewritten, per pair
+        self._trades_cache_appends: dict[str, int] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: dict[str, Any] = {}
@@ -2492,6 +2497,40 @@ class Exchange:
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
+    async def get_historic_ohlcv_chunks(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> list[DataFrame | list]:
+        """
+        Coroutine variant of get_historic_ohlcv(), used by download-data to download
+        several pairs concurrently (see run_download()).
+        Candles are not converted, so the conversion can happen outside of the event loop.
+        :return: Chunks of candles in ascending date order - raw ohlcv lists or Dataframes
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+            raise_=True,
+        )
+        logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
+        return [data]
+
+    def run_download(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine downloading historic data on the event loop.
+        Blocks other requests to the exchange until it's done.
+        """
+        with self._loop_lock:
+            return self.loop.run_until_complete(coro)
+
     async def _async_get_historic_ohlcv(
         self,
         pair: str,
@@ -2704,30 +2743,23 @@ class Exchange:
         if ticks and cache:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
             self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0]
-        has_cache = cache and (pair, timeframe, c_type) in self._klines
-        # in case of existing cache, fill_missing happens after concatenation
+        if cache and (pair, timeframe, c_type) in self._klines:
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            # Merge new candles into the cached candles, aging out old candles
+            self._klines.update_candles(
+                (pair, timeframe, c_type),
+                ticks,
+                drop_incomplete,
+                candle_limit + self._startup_candle_count,
+            )
+            return self._klines[(pair, timeframe, c_type)]
+
         ohlcv_df = ohlcv_to_dataframe(
-            ticks, timeframe, pair=pair, fill_missing=not has_cache, drop_incomplete=drop_incomplete
+            ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
         )
         # keeping parsed dataframe in cache
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -2953,19 +2985,68 @@ class Exchange:
 
         if cache:
             if (pair, timeframe, c_type) in self._trades:
-                old = self._trades[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                combined_df = concat([old, trades_df], axis=0)
-                logger.debug(f"Clean duplicated ticks from Trades data {pair}")
-                trades_df = DataFrame(
-                    trades_df_remove_duplicates(combined_df), columns=combined_df.columns
+                self._append_trades(
+                    (pair, timeframe, c_type), trades_df, first_required_candle_date
                 )
-                # Age out old candles
-                trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
-                trades_df = trades_df.reset_index(drop=True)
+                # Return the updated, combined df
+                return self._trades[(pair, timeframe, c_type)]
             self._trades[(pair, timeframe, c_type)] = trades_df
         return trades_df
 
+    def _append_trades(
+        self, pairwt: PairWithTimeframe, trades_df: DataFrame, first_required_candle_date: int
+    ) -> DataFrame:
+        """
+        Append trades to the cached trades of pairwt, aging out trades before the first
+        required candle.
+        Only trades after the last cached trade are considered new - so deduplication
+        depends on the number of new trades, not on the number of cached trades.
+        :param pairwt: (pair, timeframe, candle_type) - must be in the cache
+        :param trades_df: Trades to append
+        :param first_required_candle_date: Trades at or before this timestamp (ms) are removed
+        :return: Trades which were not cached yet
+        """
+        old = self._trades[pairwt]
+        logger.debug(f"Clean duplicated ticks from Trades data {pairwt[0]}")
+        new_trades = trades_df_after_last(old, trades_df)
+        # Age out old candles
+        start = int(old["timestamp"].searchsorted(first_required_candle_date, side="right"))
+        new_start = int(
+            new_trades["timestamp"].searchsorted(first_required_candle_date, side="right")
+        )
+        new_trades = new_trades.iloc[new_start:]
+        self._trades[pairwt] = concat([old.iloc[start:], new_trades], axis=0, ignore_index=True)
+        return new_trades
+
+    def _store_cached_trades(
+        self, data_handler, pair: str, trades_df: DataFrame, new_trades: DataFrame | None
+    ) -> None:
+        """
+        Persist cached trades of a pair, to be picked up after a restart.
+        Trades new to the cache are appended to the stored trades. The retained trades are
+        rewritten every TRADES_CACHE_STORE_INTERVAL appends - removing aged out trades from disk.
+        :param data_handler: Datahandler to use
+        :param pair: Pair the trades belong to
+        :param trades_df: All cached trades of the pair
+        :param new_trades: Trades added to the cache - None to rewrite the stored trades
+        """
+        appends = self._trades_cache_appends.get(pair)
+        if new_trades is not None and appends is not None and appends < TRADES_CACHE_STORE_INTERVAL:
+            if new_trades.empty:
+                return
+            try:
+                data_handler.trades_append(
+                    f"{pair}-cached", new_trades[DEFAULT_TRADES_COLUMNS], self.trading_mode
+                )
+                self._trades_cache_appends[pair] = appends + 1
+                return
+            except NotImplementedError:
+                pass
+        data_handler.trades_store(
+            f"{pair}-cached", trades_df[DEFAULT_TRADES_COLUMNS], self.trading_mode
+        )
+        self._trades_cache_appends[pair] = 0
+
     async def _build_trades_dl_jobs(
         self, pairwt: PairWithTimeframe, data_handler, cache: bool
     ) -> tuple[PairWithTimeframe, DataFrame | None]:
@@ -3036,19 +3117,26 @@ class Exchange:
                 return pairwt, None
 
             if new_ticks:
-                all_stored_ticks_list = all_stored_ticks_df[DEFAULT_TRADES_COLUMNS].values.tolist()
-                all_stored_ticks_list.extend(new_ticks)
-                trades_df = self._process_trades_df(
-                    pair,
-                    timeframe,
-                    candle_type,
-                    all_stored_ticks_list,
-                    cache,
-                    first_required_candle_date=first_candle_ms,
-                )
-                data_handler.trades_store(
-                    f"{pair}-cached", trades_df[DEFAULT_TRADES_COLUMNS], self.trading_mode
-                )
+                new_trades = None
+                if cache and is_in_cache:
+                    new_trades = self._append_trades(
+                        pairwt, trades_list_to_df(new_ticks, True), first_candle_ms
+                    )
+                    trades_df = self._trades[pairwt]
+                else:
+                    all_stored_ticks_list = all_stored_ticks_df[
+                        DEFAULT_TRADES_COLUMNS
+                    ].values.tolist()
+                    all_stored_ticks_list.extend(new_ticks)
+                    trades_df = self._process_trades_df(
+                        pair,
+                        timeframe,
+                        candle_type,
+                        all_stored_ticks_list,
+                        cache,
+                        first_required_candle_date=first_candle_ms,
+                    )
+                self._store_cached_trades(data_handler, pair, trades_df, new_trades)
                 return pairwt, trades_df
             else:
                 logger.error(f"No new ticks for {pair}")
@@ -3336,6 +3424,20 @@ class Exchange:
                     pass
             return self.loop.run_until_complete(task)
 
+    def get_historic_trades_archive(
+        self, pair: str, since: int, until: int | None = None
+    ) -> Iterator[TradesArchiveDay]:
+        """
+        Get trade history from daily trade archives of the exchange - one day at a time,
+        so all days don't need to be held in memory.
+        Exchanges without trade archives return no days.
+        :param pair: Pair to download
+        :param since: Timestamp in milliseconds - start of the first day to return
+        :param until: Timestamp in milliseconds. Defaults to the latest available archive.
+        :returns Iterator of TradesArchiveDay, in order of the days without gaps
+        """
+        return iter(())
+
     @retrier
     def _get_funding_fees_from_exchange(self, pair: str, since: datetime | int) -> float:
         """
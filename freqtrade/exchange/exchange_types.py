@@ -1,7 +1,8 @@
-from typing import Any, Literal, TypedDict
+from typing import Any, Literal, NamedTuple, TypedDict
 
 # Re-export for easier use
 from ccxt.base.types import FundingRate  # noqa: F401
+from pandas import DataFrame
 
 from freqtrade.enums import CandleType
 
@@ -30,6 +31,7 @@ class FtHas(TypedDict, total=False):
     always_require_api_keys: bool
     # allow disabling of parallel download-data for specific exchanges
     download_data_parallel_quick: bool
+    download_data_concurrency: int
     # Tickers
     tickers_have_quoteVolume: bool
     tickers_have_percentage: bool
@@ -115,3 +117,14 @@ CcxtOrder = dict[str, Any]
 
 # pair, timeframe, candleType, OHLCV, drop last?,
 OHLCVResponse = tuple[str, str, CandleType, list, bool]
+
+
+class TradesArchiveDay(NamedTuple):
+    """Trades of one day of an exchange's trade archive"""
+
+    # Day as YYYY-MM-DD
+    day: str
+    # sha256 of the archive file
+    sha256: str
+    # Trades with DEFAULT_TRADES_COLUMNS
+    trades: DataFrame
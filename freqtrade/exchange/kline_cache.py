@@ -0,0 +1,257 @@
+"""
+In-memory candle (OHLCV) cache used by the exchange class.
+"""
+
+import logging
+from collections.abc import Iterator, MutableMapping
+
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs, timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# Columns held in the value array - "date" is held separately as int64 (ms).
+_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
+
+
+class KlineBuffer:
+    """
+    Holds the most recent candles of one pair as preallocated numpy columns.
+    Candles are contiguous (missing candles are filled like ohlcv_fill_up_missing_data does),
+    so the position of a candle follows from its date - and updated candles are merged in place.
+    Arrays have twice the capacity, so appending only moves data once every `capacity` candles.
+    The dataframe is built when requested - and kept until the next update.
+    """
+
+    def __init__(self, pair: str, timeframe: str, frame: DataFrame):
+        self._pair = pair
+        self._timeframe = timeframe
+        # 0 until the arrays are initialized
+        self._capacity = 0
+        # Monthly candles don't have a fixed length.
+        self._fixed_width = timeframe_to_seconds(timeframe) < 43200 * 60
+        self._tf_ms = timeframe_to_msecs(timeframe)
+        self._frame: DataFrame | None = frame
+        self._dates = np.empty(0, dtype=np.int64)
+        self._values = np.empty((0, len(_VALUE_COLUMNS)), dtype=np.float64)
+        self._end = 0
+        self._count = 0
+
+    @property
+    def frame(self) -> DataFrame:
+        """
+        Candles as dataframe. The dataframe is not modified by later updates.
+        """
+        if self._frame is None:
+            window = slice(self._end - self._count, self._end)
+            frame = DataFrame(self._values[window].copy(), columns=_VALUE_COLUMNS)
+            frame.insert(0, "date", to_datetime(self._dates[window], unit="ms", utc=True))
+            self._frame = frame
+        return self._frame
+
+    def _load(self, frame: DataFrame, capacity: int) -> None:
+        """
+        (Re)initialize the arrays with the last `capacity` candles of frame.
+        """
+        self._capacity = capacity
+        dates = frame["date"].to_numpy(dtype="datetime64[ms]").astype(np.int64)
+        if len(dates) > 1 and not (np.diff(dates) == self._tf_ms).all():
+            frame = clean_ohlcv_dataframe(
+                frame, self._timeframe, self._pair, fill_missing=True, drop_incomplete=False
+            )
+            dates = frame["date"].to_numpy(dtype="datetime64[ms]").astype(np.int64)
+        self._dates = np.empty(2 * self._capacity, dtype=np.int64)
+        self._values = np.empty((2 * self._capacity, len(_VALUE_COLUMNS)), dtype=np.float64)
+        self._end = 0
+        self._count = 0
+        self._append(dates, frame[_VALUE_COLUMNS].to_numpy(dtype=np.float64))
+
+    def _append(self, dates: np.ndarray, values: np.ndarray) -> None:
+        """
+        Append contiguous candles following the last candle, aging out the oldest candles.
+        """
+        if len(dates) > self._capacity:
+            dates = dates[-self._capacity :]
+            values = values[-self._capacity :]
+        n = len(dates)
+        keep = min(self._count, self._capacity - n)
+        if self._end + n > len(self._dates):
+            # Move the remaining window to the start of the arrays
+            src = slice(self._end - keep, self._end)
+            self._dates[:keep] = self._dates[src]
+            self._values[:keep] = self._values[src]
+            self._end = keep
+        self._dates[self._end : self._end + n] = dates
+        self._values[self._end : self._end + n] = values
+        self._end += n
+        self._count = keep + n
+
+    @staticmethod
+    def _aggregate(ticks: list[list], drop_incomplete: bool) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convert ticks to sorted dates and values - combining duplicate candles
+        the same way clean_ohlcv_dataframe does.
+        """
+        raw = np.array(ticks, dtype=np.float64)
+        raw = raw[np.argsort(raw[:, 0], kind="stable")]
+        dates = raw[:, 0].astype(np.int64)
+        values = raw[:, 1:]
+        dates, first = np.unique(dates, return_index=True)
+        if len(dates) != len(raw):
+            last = np.append(first[1:], len(raw)) - 1
+            values = np.column_stack(
+                (
+                    values[first, _OPEN],
+                    np.fmax.reduceat(values[:, _HIGH], first),
+                    np.fmin.reduceat(values[:, _LOW], first),
+                    values[last, _CLOSE],
+                    np.fmax.reduceat(values[:, _VOLUME], first),
+                )
+            )
+        if drop_incomplete:
+            dates = dates[:-1]
+            values = values[:-1]
+        return dates, values
+
+    def update(self, ticks: list[list], drop_incomplete: bool, capacity: int) -> None:
+        """
+        Merge ticks (as returned by the exchange) into the buffer.
+        Candles equal to the result of concat + clean_ohlcv_dataframe + tail(capacity).
+        :param ticks: list with candle (OHLCV) data
+        :param drop_incomplete: Drop the last candle of ticks, assuming it's incomplete
+        :param capacity: Number of candles to keep
+        """
+        capacity = max(capacity, 1)
+        if self._capacity != capacity and self._fixed_width and not self.frame.empty:
+            self._load(self.frame, capacity)
+            if len(self.frame) != self._count:
+                # Missing candles were filled, or candles aged out.
+                self._frame = None
+        if self._count == 0:
+            self._rebuild(ticks, drop_incomplete, capacity)
+            return
+        if not ticks:
+            return
+        dates, values = self._aggregate(ticks, drop_incomplete)
+        if len(dates) == 0:
+            return
+
+        first = self._dates[self._end - self._count]
+        last = self._dates[self._end - 1]
+        if ((dates - last) % self._tf_ms != 0).any() or (
+            dates[0] < first and self._count < self._capacity
+        ):
+            # Unaligned candles, or candles before the first cached candle.
+            self._rebuild(ticks, drop_incomplete, capacity)
+            return
+
+        # Candles older than the window would be aged out immediately
+        start = np.searchsorted(dates, first)
+        split = np.searchsorted(dates, last, side="right")
+        if split > start:
+            pos = self._end - self._count + (dates[start:split] - first) // self._tf_ms
+            new = values[start:split]
+            cur = self._values[pos]
+            cur[:, _HIGH] = np.fmax(cur[:, _HIGH], new[:, _HIGH])
+            cur[:, _LOW] = np.fmin(cur[:, _LOW], new[:, _LOW])
+            cur[:, _CLOSE] = np.where(np.isnan(new[:, _CLOSE]), cur[:, _CLOSE], new[:, _CLOSE])
+            cur[:, _VOLUME] = np.fmax(cur[:, _VOLUME], new[:, _VOLUME])
+            self._values[pos] = cur
+
+        if split < len(dates):
+            self._append(*self._fill_gaps(last, dates[split:], values[split:]))
+        self._frame = None
+
+    def _fill_gaps(
+        self, last: int, dates: np.ndarray, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Expand new candles to all candles after `last`,
+        using the previous close for missing candles (with 0 volume).
+        """
+        idx = (dates - last) // self._tf_ms - 1
+        count = int(idx[-1]) + 1
+        if count == len(dates):
+            return dates, values
+        logger.debug(
+            f"Missing data fillup for {self._pair}, {self._timeframe}: "
+            f"filled {count - len(dates)} candles."
+        )
+        all_dates = last + self._tf_ms * np.arange(1, count + 1, dtype=np.int64)
+        placed = np.full(count, -1, dtype=np.int64)
+        placed[idx] = np.arange(len(idx))
+        prev = np.maximum.accumulate(placed)
+        close = np.where(
+            prev >= 0, values[prev, _CLOSE], self._values[self._end - 1, _CLOSE]
+        ).reshape(-1, 1)
+        all_values = np.where(
+            placed.reshape(-1, 1) >= 0,
+            values[placed],
+            np.column_stack((close, close, close, close, np.zeros_like(close))),
+        )
+        return all_dates, all_values
+
+    def _rebuild(self, ticks: list[list], drop_incomplete: bool, capacity: int) -> None:
+        """
+        Combine the cached candles with ticks using dataframes.
+        """
+        ohlcv_df = ohlcv_to_dataframe(
+            ticks, self._timeframe, self._pair, fill_missing=False, drop_incomplete=drop_incomplete
+        )
+        frame = clean_ohlcv_dataframe(
+            concat([self.frame, ohlcv_df], axis=0),
+            self._timeframe,
+            self._pair,
+            fill_missing=True,
+            drop_incomplete=False,
+        )
+        self._frame = frame.tail(capacity).reset_index(drop=True)
+        if self._fixed_width:
+            self._load(self._frame, capacity)
+
+
+class KlineCache(MutableMapping[PairWithTimeframe, DataFrame]):
+    """
+    Candle dataframes per (pair, timeframe, candle_type).
+    Behaves like a dict of dataframes, while candle updates (update_candles())
+    are merged into a KlineBuffer per pair - avoiding dataframe operations on every refresh.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict[PairWithTimeframe, KlineBuffer] = {}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        return self._buffers[key].frame
+
+    def __setitem__(self, key: PairWithTimeframe, value: DataFrame) -> None:
+        self._buffers[key] = KlineBuffer(key[0], key[1], value)
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._buffers[key]
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._buffers
+
+    def update_candles(
+        self, key: PairWithTimeframe, ticks: list[list], drop_incomplete: bool, capacity: int
+    ) -> None:
+        """
+        Merge new candles into the cached candles of key - aging out the oldest candles.
+        :param key: (pair, timeframe, candle_type) - must be in the cache
+        :param ticks: list with candle (OHLCV) data, as returned by the exchange
+        :param drop_incomplete: Drop the last candle of ticks, assuming it's incomplete
+        :param capacity: Number of candles to keep
+        """
+        self._buffers[key].update(ticks, drop_incomplete, capacity)
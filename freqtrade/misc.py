@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, TextIO
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 import rapidjson
 
@@ -236,3 +237,30 @@ def append_candles_to_dataframe(left: pd.DataFrame, right: pd.DataFrame) -> pd.D
     left.reset_index(drop=True, inplace=True)
 
     return left
+
+
+def get_dataframe_differences(expected: pd.DataFrame, actual: pd.DataFrame) -> list[str]:
+    """
+    Compare two dataframes of identical length column by column.
+    Numeric columns are compared with a small tolerance, NaN values are considered equal.
+
+    :param expected: The reference dataframe
+    :param actual: The dataframe to compare against the reference
+    :returns: Names of columns which are missing or differ in `actual`
+    """
+    differences = []
+    for col in expected.columns:
+        if col not in actual.columns or len(actual) != len(expected):
+            differences.append(col)
+            continue
+        left = expected[col].reset_index(drop=True)
+        right = actual[col].reset_index(drop=True)
+        if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+            equal = np.isclose(
+                left.to_numpy(dtype=float), right.to_numpy(dtype=float), equal_nan=True
+            ).all()
+        else:
+            equal = ((left == right) | (left.isna() & right.isna())).all()
+        if not equal:
+            differences.append(col)
+    return differences
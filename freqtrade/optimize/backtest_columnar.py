@@ -0,0 +1,263 @@
+"""
+Columnar (numpy based) data containers for the backtesting engine.
+
+ColumnarData is used by Backtesting when ``backtest_engine`` is set to ``columnar``,
+DetailPairData holds ``timeframe_detail`` candles for all engines.
+BacktestSignalData keeps the prepared candles of one backtest for reuse.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Timestamp
+
+
+# Column groups - must follow the ordering of backtesting.HEADERS
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+SIGNAL_COLUMNS = ["enter_long", "exit_long", "enter_short", "exit_short"]
+TAG_COLUMNS = ["enter_tag", "exit_tag"]
+
+
+class ColumnarPairData:
+    """
+    Candles for one pair, stored as contiguous numpy blocks.
+    Rows are materialized lazily (in the same layout as backtesting.HEADERS)
+    - and only for candles the backtest actually visits.
+    """
+
+    __slots__ = ("_dates", "_dates_ns", "_grid", "_prices", "_signals", "_tags")
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        self._dates = dataframe["date"].array
+        self._dates_ns: np.ndarray = DatetimeIndex(dataframe["date"]).as_unit("ns").asi8
+        self._prices: np.ndarray = np.ascontiguousarray(
+            dataframe[PRICE_COLUMNS].to_numpy(dtype=np.float64)
+        )
+        self._signals: np.ndarray = np.ascontiguousarray(
+            dataframe[SIGNAL_COLUMNS].to_numpy(dtype=np.float64)
+        )
+        self._tags: np.ndarray = dataframe[TAG_COLUMNS].to_numpy(dtype=object)
+        self._grid: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._dates_ns)
+
+    @property
+    def dates_ns(self) -> np.ndarray:
+        """Candle dates as nanosecond timestamps"""
+        return self._dates_ns
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Candle prices, with one column per PRICE_COLUMNS entry"""
+        return self._prices
+
+    @property
+    def signals(self) -> np.ndarray:
+        """Shifted signals, with one column per SIGNAL_COLUMNS entry"""
+        return self._signals
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Grid step per candle, as calculated by align()"""
+        return self._grid
+
+    def __getitem__(self, index: int) -> tuple:
+        return (
+            self._dates[index],
+            *self._prices[index].tolist(),
+            *self._signals[index].tolist(),
+            *self._tags[index].tolist(),
+        )
+
+    def entry_mask(self, can_short: bool) -> np.ndarray:
+        """
+        Boolean mask of candles carrying an entry signal.
+        May be a superset of candles resulting in an entry - but never a subset.
+        """
+        mask = self._signals[:, 0] == 1
+        if can_short:
+            mask |= self._signals[:, 2] == 1
+        return mask
+
+    def align(self, start_ns: int, timeframe_ns: int) -> np.ndarray:
+        """
+        Map every candle onto the shared time grid (step 0 is start_ns).
+        :return: grid step per candle
+        """
+        self._grid = (self._dates_ns - start_ns) // timeframe_ns
+        return self._grid
+
+    def rows_until(self, step: int) -> int:
+        """
+        Number of candles up to (and including) the given grid step.
+        """
+        return int(np.searchsorted(self._grid, step, side="right"))
+
+    def index_at(self, step: int) -> int:
+        """
+        Row index for the given grid step, or -1 if the pair has no candle at that step.
+        """
+        idx = int(np.searchsorted(self._grid, step))
+        if idx < len(self._grid) and self._grid[idx] == step:
+            return idx
+        return -1
+
+
+class ColumnarData(dict[str, ColumnarPairData]):
+    """
+    Dict of ColumnarPairData, keyed by pair, with all pairs aligned on one shared time grid.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._signal_pairs: dict[int, set[str]] = {}
+        self._signal_steps: np.ndarray = np.empty(0, dtype=np.int64)
+        self._startup_candles = 0
+        # Current grid step of the backtest
+        self.step = 0
+
+    def align(
+        self,
+        start_date: datetime,
+        timeframe_td: timedelta,
+        can_short: bool,
+        startup_candles: int,
+    ) -> None:
+        """
+        Align all pairs on the time grid starting at start_date, and precompute
+        the pairs with an entry signal for each grid step.
+        """
+        self._startup_candles = startup_candles
+        self.step = 0
+        start_ns = Timestamp(start_date).as_unit("ns").value
+        timeframe_ns = int(timeframe_td.total_seconds()) * 1_000_000_000
+        signal_pairs: dict[int, set[str]] = {}
+        for pair, pair_data in self.items():
+            grid = pair_data.align(start_ns, timeframe_ns)
+            for step in grid[pair_data.entry_mask(can_short)].tolist():
+                signal_pairs.setdefault(step, set()).add(pair)
+        self._signal_pairs = signal_pairs
+        self._signal_steps = np.array(sorted(signal_pairs), dtype=np.int64)
+
+    def next_signal_step(self, step: int) -> int | None:
+        """
+        First grid step (starting at step) with an entry signal on any pair.
+        :return: grid step, or None if no further entry signal exists.
+        """
+        idx = int(np.searchsorted(self._signal_steps, step))
+        if idx < len(self._signal_steps):
+            return int(self._signal_steps[idx])
+        return None
+
+    def dataframe_max_index(self, pair: str) -> int | None:
+        """
+        Analyzed dataframe limit for pair at the current grid step.
+        Replaces per-candle calls to DataProvider._set_dataframe_max_index,
+        as pairs are no longer visited on every candle.
+        """
+        pair_data = self.get(pair)
+        if pair_data is None or (rows := pair_data.rows_until(self.step)) == 0:
+            return None
+        return self._startup_candles + rows
+
+    def active_pairs(self, step: int, pairs: list[str]) -> list[str]:
+        """
+        Pairs (from pairs, in order) with an entry signal at this grid step.
+        Pairs with open trades are not included, they're added by the time generator.
+        """
+        signal_pairs = self._signal_pairs.get(step)
+        if not signal_pairs:
+            return []
+        return [pair for pair in pairs if pair in signal_pairs]
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles for one pair, stored as contiguous numpy blocks.
+    Detail rows for a main candle are located through precomputed start/end offsets,
+    avoiding dataframe slicing for every main candle.
+    """
+
+    __slots__ = ("_dates", "_dates_ns", "_ends", "_main_dates_ns", "_prices", "_starts", "source")
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        # Dataframe this block was created from - used to detect replaced detail data.
+        self.source = dataframe
+        self._dates = dataframe["date"].array
+        self._dates_ns: np.ndarray = DatetimeIndex(dataframe["date"]).as_unit("ns").asi8
+        self._prices: np.ndarray = np.ascontiguousarray(
+            dataframe[PRICE_COLUMNS].to_numpy(dtype=np.float64)
+        )
+        self._main_dates_ns: np.ndarray = np.empty(0, dtype=np.int64)
+        self._starts: np.ndarray = np.empty(0, dtype=np.int64)
+        self._ends: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._dates_ns)
+
+    def align(self, main_dates: DatetimeIndex, timeframe_ns: int) -> None:
+        """
+        Precompute the detail row range [start, end) of each main candle.
+        :param main_dates: Candle dates of the main timeframe
+        :param timeframe_ns: Main timeframe in nanoseconds
+        """
+        self._main_dates_ns = main_dates.as_unit("ns").asi8
+        self._starts = np.searchsorted(self._dates_ns, self._main_dates_ns)
+        self._ends = np.searchsorted(self._dates_ns, self._main_dates_ns + timeframe_ns)
+
+    def offsets(self, date_ns: int, timeframe_ns: int) -> tuple[int, int]:
+        """
+        Detail row range [start, end) for the main candle starting at date_ns.
+        Falls back to searching the detail dates for candles not covered by align().
+        """
+        idx = int(np.searchsorted(self._main_dates_ns, date_ns))
+        if idx < len(self._main_dates_ns) and self._main_dates_ns[idx] == date_ns:
+            return int(self._starts[idx]), int(self._ends[idx])
+        return (
+            int(np.searchsorted(self._dates_ns, date_ns)),
+            int(np.searchsorted(self._dates_ns, date_ns + timeframe_ns)),
+        )
+
+    def rows(self, main_row: tuple, timeframe_ns: int) -> list[tuple] | None:
+        """
+        Detail rows for one main candle (in the layout of backtesting.HEADERS).
+        Signals and tags are taken from the main candle.
+        :return: list of rows, or None if no detail candles exist for this candle.
+        """
+        start, end = self.offsets(Timestamp(main_row[0]).value, timeframe_ns)
+        if start >= end:
+            return None
+        signals = main_row[len(PRICE_COLUMNS) + 1 :]
+        return [
+            (date, *prices, *signals)
+            for date, prices in zip(
+                self._dates[start:end], self._prices[start:end].tolist(), strict=True
+            )
+        ]
+
+
+class BacktestSignalData:
+    """
+    Candles with entry / exit signals, prepared for the backtest loop.
+    Can be reused by further backtests as long as the signals don't change - for example
+    in hyperopt epochs which only optimize roi, stoploss or trailing stop parameters.
+    """
+
+    __slots__ = ("analyzed", "data", "main_dates", "processed")
+
+    def __init__(
+        self,
+        data: "dict[str, list[tuple]] | ColumnarData",
+        processed: dict[str, DataFrame],
+        analyzed: dict[str, DataFrame],
+        main_dates: dict[str, DatetimeIndex],
+    ) -> None:
+        # Backtest loop data (per pair rows, or ColumnarData)
+        self.data = data
+        # Trimmed dataframes with signals, as passed to hyperopt loss functions
+        self.processed = processed
+        # Untrimmed dataframes with signals, as provided to callbacks by the dataprovider
+        self.analyzed = analyzed
+        # Main candle dates per pair, used to align timeframe_detail candles
+        self.main_dates = main_dates
@@ -0,0 +1,274 @@
+"""
+Vectorized exit evaluation for the backtesting engine.
+
+Used by Backtesting when entry / exit signals are reused for many backtests - for example
+hyperopt epochs which only optimize roi, stoploss or trailing stop parameters.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from pandas import Timestamp
+
+from freqtrade.exchange import ROUND_UP, price_to_precision
+from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
+from freqtrade.optimize.backtest_columnar import ColumnarData, ColumnarPairData
+from freqtrade.persistence import LocalTrade
+from freqtrade.resolvers.strategy_resolver import check_override
+from freqtrade.strategy.interface import IStrategy
+
+
+# Callbacks which can delay, prevent or add exits.
+EXIT_CALLBACKS = ("custom_exit", "custom_exit_price", "confirm_trade_exit")
+
+# Profit ratios are rounded to 8 decimals - closer comparisons are treated as possible exits.
+PROFIT_TOLERANCE = 1e-8
+# Candles scanned at once - doubled for every further scan of the same trade.
+MIN_WINDOW = 64
+
+
+@dataclass(slots=True)
+class _TradeState:
+    """Trade attributes updated by exit checks on candles without exit"""
+
+    max_rate: float
+    min_rate: float
+    stop_loss: float
+    stop_loss_pct: float | None
+    is_stop_loss_trailing: bool
+
+
+@dataclass(slots=True)
+class _ExitPlan:
+    # First candle which may exit the trade - None if the trade remains open until the end.
+    date_ns: int | None
+    step: int | None
+    # Trade state before that candle
+    state: _TradeState
+
+
+class ExitPlanner:
+    """
+    Finds the next candle on which an open trade may exit, using vectorized operations on
+    the candles following the last evaluated candle (the trade's forward price path).
+    Roi, stoploss, trailing stop and exit signals are checked for all these candles at once.
+    The backtest loop skips exit checks for the trade until that candle - and evaluates the
+    exit on it as usual, so results don't change.
+
+    Only supports spot trades without custom exit, stoploss or roi callbacks
+    (see Backtesting.vectorized_exits_supported()).
+    Borderline comparisons are treated as possible exits - the backtest loop has the final word.
+    """
+
+    def __init__(self, strategy: IStrategy, data: ColumnarData) -> None:
+        self._strategy = strategy
+        self._data = data
+        self._plans: dict[int, _ExitPlan] = {}
+        roi = sorted(strategy.minimal_roi.items())
+        self._roi_durations = np.array([duration for duration, _ in roi], dtype=np.float64)
+        self._roi_values = np.array([value for _, value in roi], dtype=np.float64)
+
+    @staticmethod
+    def supported(strategy: IStrategy) -> bool:
+        """
+        Strategy doesn't implement callbacks which influence exits.
+        """
+        return (
+            not strategy.use_custom_stoploss
+            and not strategy.use_custom_roi
+            and not strategy.position_adjustment_enable
+            and not any(
+                check_override(strategy, IStrategy, callback) for callback in EXIT_CALLBACKS
+            )
+        )
+
+    def plan(self, trade: LocalTrade, row: tuple) -> None:
+        """
+        Plan the exit of a trade which remained open after the exit check on row.
+        """
+        if trade.has_open_orders:
+            return
+        pair_data = self._data[trade.pair]
+        start = int(np.searchsorted(pair_data.dates_ns, Timestamp(row[0]).as_unit("ns").value)) + 1
+        state = _TradeState(
+            max_rate=trade.max_rate or trade.open_rate,
+            min_rate=trade.min_rate or trade.open_rate,
+            stop_loss=trade.stop_loss,
+            stop_loss_pct=trade.stop_loss_pct,
+            is_stop_loss_trailing=trade.is_stop_loss_trailing,
+        )
+        window = MIN_WINDOW
+        while start < len(pair_data):
+            end = min(start + window, len(pair_data))
+            exit_idx = self._scan(trade, pair_data, start, end, state)
+            if exit_idx is not None:
+                self._plans[trade.id] = _ExitPlan(
+                    int(pair_data.dates_ns[exit_idx]), int(pair_data.grid[exit_idx]), state
+                )
+                return
+            start = end
+            window *= 2
+        self._plans[trade.id] = _ExitPlan(None, None, state)
+
+    def is_due(self, trade: LocalTrade, row: tuple) -> bool:
+        """
+        Check if the trade may exit on this candle.
+        If so, the trade state is brought up to date with all skipped candles.
+        """
+        plan = self._plans.get(trade.id)
+        if plan is None:
+            return True
+        if plan.date_ns is None or Timestamp(row[0]).as_unit("ns").value < plan.date_ns:
+            return False
+        self.finish(trade)
+        return True
+
+    def finish(self, trade: LocalTrade) -> None:
+        """
+        Bring the trade state up to date with all skipped candles.
+        """
+        plan = self._plans.pop(trade.id, None)
+        if plan is not None:
+            trade.max_rate = plan.state.max_rate
+            trade.min_rate = plan.state.min_rate
+            trade.stop_loss = plan.state.stop_loss
+            trade.stop_loss_pct = plan.state.stop_loss_pct
+            trade.is_stop_loss_trailing = plan.state.is_stop_loss_trailing
+
+    def next_step(self, step: int) -> int | None:
+        """
+        First grid step (starting at step) on which an open trade needs evaluation.
+        :return: grid step, or None if no open trade can exit before the end of the data.
+        """
+        steps = []
+        for trade in LocalTrade.bt_trades_open:
+            plan = self._plans.get(trade.id)
+            if plan is None:
+                return step
+            if plan.step is not None:
+                steps.append(plan.step)
+        return min(steps, default=None)
+
+    @staticmethod
+    def _profit_ratio(trade: LocalTrade, rates: np.ndarray) -> np.ndarray:
+        """
+        Vectorized (unrounded) LocalTrade.calc_profit_ratio() for spot trades.
+        """
+        close_value = rates * trade.amount * (1 - (trade.fee_close or 0.0))
+        return close_value / trade.open_trade_value - 1
+
+    @staticmethod
+    def _rounding_step(trade: LocalTrade, rates: np.ndarray) -> np.ndarray:
+        """
+        Upper bound of the difference between rates and the rates rounded up to price precision.
+        """
+        step = np.abs(rates) * 1e-12
+        if trade.price_precision is None or trade.precision_mode_price is None:
+            return step
+        if trade.precision_mode_price == TICK_SIZE:
+            return step + trade.price_precision
+        if trade.precision_mode_price == DECIMAL_PLACES:
+            return step + 10.0**-trade.price_precision
+        # Significant digits
+        return step + np.abs(rates) * 10.0 ** (1 - trade.price_precision)
+
+    def _scan(
+        self,
+        trade: LocalTrade,
+        pair_data: ColumnarPairData,
+        start: int,
+        end: int,
+        state: _TradeState,
+    ) -> int | None:
+        """
+        Check candles [start, end) for possible exits.
+        Updates state with all candles before the first possible exit.
+        :return: Index of the first candle which may exit the trade, or None.
+        """
+        strategy = self._strategy
+        open_, high, low = pair_data.prices[start:end, 0:3].T
+        enter = pair_data.signals[start:end, 0] != 0
+        exit_ = pair_data.signals[start:end, 1] != 0
+        # Profit at candle high, used for roi and the trailing stop.
+        profit_high = self._profit_ratio(trade, high)
+
+        # Roi
+        open_date_ns = Timestamp(trade.open_date_utc).as_unit("ns").value
+        duration = (pair_data.dates_ns[start:end] - open_date_ns) // 60_000_000_000
+        roi_idx = np.searchsorted(self._roi_durations, duration, side="right") - 1
+        roi = np.where(roi_idx >= 0, self._roi_values[np.maximum(roi_idx, 0)], np.inf)
+        exits = profit_high > roi - PROFIT_TOLERANCE
+        if strategy.ignore_roi_if_entry_signal:
+            exits &= ~enter
+
+        # Exit signal
+        if strategy.use_exit_signal:
+            exit_signal = exit_ & ~enter
+            if strategy.exit_profit_only:
+                exit_signal &= (
+                    self._profit_ratio(trade, open_)
+                    > strategy.exit_profit_offset - PROFIT_TOLERANCE
+                )
+            exits |= exit_signal
+
+        # (Trailing) stoploss
+        if strategy.trailing_stop:
+            offset = strategy.trailing_stop_positive_offset
+            stoploss = np.full(len(high), strategy.stoploss)
+            allowed = np.ones(len(high), dtype=bool)
+            if strategy.trailing_only_offset_is_reached:
+                allowed = profit_high >= offset
+            if strategy.trailing_stop_positive is not None:
+                stoploss = np.where(
+                    profit_high > offset, strategy.trailing_stop_positive, strategy.stoploss
+                )
+            if strategy.trailing_only_offset_is_reached or (
+                strategy.trailing_stop_positive is not None
+            ):
+                exits |= np.abs(profit_high - offset) <= PROFIT_TOLERANCE
+            # Unrounded stop of each candle - and the highest stop so far.
+            new_stop = np.where(allowed, high * (1 - np.abs(stoploss)), 0.0)
+            trailing_stop = np.maximum.accumulate(new_stop)
+            rounded_stop = trailing_stop + self._rounding_step(trade, trailing_stop)
+            exits |= np.maximum(state.stop_loss, rounded_stop) >= low
+        else:
+            exits |= state.stop_loss >= low
+
+        exit_idx = int(np.argmax(exits)) if exits.any() else None
+        last = len(high) if exit_idx is None else exit_idx
+        if last > 0:
+            state.max_rate = max(state.max_rate, float(high[:last].max()))
+            state.min_rate = min(state.min_rate, float(low[:last].min()))
+            if strategy.trailing_stop:
+                self._trail_stop(
+                    trade, state, new_stop[:last], trailing_stop[:last], stoploss[:last]
+                )
+        return None if exit_idx is None else start + exit_idx
+
+    def _trail_stop(
+        self,
+        trade: LocalTrade,
+        state: _TradeState,
+        new_stop: np.ndarray,
+        trailing_stop: np.ndarray,
+        stoploss: np.ndarray,
+    ) -> None:
+        """
+        Move the stop as LocalTrade.adjust_stop_loss() would have done on these candles.
+        Only candles with a new highest stop can move it, all others are skipped.
+        """
+        candidates = np.flatnonzero(
+            (new_stop >= trailing_stop)
+            & (new_stop + self._rounding_step(trade, new_stop) > state.stop_loss)
+        )
+        for idx in candidates.tolist():
+            stop_loss = price_to_precision(
+                float(new_stop[idx]),
+                trade.price_precision,
+                trade.precision_mode_price,
+                rounding_mode=ROUND_UP,
+            )
+            if stop_loss > state.stop_loss:
+                state.stop_loss = stop_loss
+                state.stop_loss_pct = -1 * abs(float(stoploss[idx]))
+                state.is_stop_loss_trailing = True
@@ -0,0 +1,149 @@
+"""
+Parallel backtesting of multiple strategies (--strategy-list with --backtest-jobs).
+Candle data is placed once in shared memory, each worker process backtests one strategy.
+"""
+
+import logging
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from joblib import Parallel, delayed, wrap_non_picklable_objects
+from joblib.externals import cloudpickle
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.shared_store import SharedDataStore
+from freqtrade.ft_types import BacktestContentType
+from freqtrade.mixins import LoggingMixin
+from freqtrade.strategy.interface import IStrategy
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+
+logger = logging.getLogger(__name__)
+
+WorkerResult = tuple[str, BacktestContentType, dict[str, Any], datetime, datetime]
+
+
+def _strategy_pickle_magic(bases: tuple[type, ...]) -> None:
+    """
+    Allow strategy inheritance across files, by registering the modules of parent classes
+    to be pickled by value.
+    """
+    for modules in bases:
+        if modules.__name__ != "IStrategy":
+            if mod := sys.modules.get(modules.__module__):
+                cloudpickle.register_pickle_by_value(mod)
+            _strategy_pickle_magic(modules.__bases__)
+
+
+# Exchange attributes which can't be pickled - workers don't make network calls.
+_EXCHANGE_NON_PICKLABLE = ("_api", "_api_async", "loop", "_loop_lock", "_cache_lock")
+
+
+@contextmanager
+def _prepared_for_workers(backtesting: "Backtesting") -> Iterator[None]:
+    """
+    Temporarily remove non-picklable exchange objects, so backtesting can be sent to workers.
+    They're restored afterwards - the exchange remains usable in this process.
+    """
+    exchange = backtesting.exchange
+    removed = {attr: getattr(exchange, attr) for attr in _EXCHANGE_NON_PICKLABLE}
+    for strat in backtesting.strategylist:
+        _strategy_pickle_magic(strat.__class__.__bases__)
+    for attr in _EXCHANGE_NON_PICKLABLE:
+        setattr(exchange, attr, None)
+    try:
+        yield
+    finally:
+        for attr, value in removed.items():
+            setattr(exchange, attr, value)
+
+
+@delayed
+@wrap_non_picklable_objects
+def _backtest_strategy_worker(
+    backtesting: "Backtesting",
+    strategy_name: str,
+    data_spec: dict[str, Any],
+    detail_spec: dict[str, Any] | None,
+    timerange: TimeRange,
+) -> WorkerResult:
+    """
+    Backtest one strategy in a worker process.
+    """
+    LoggingMixin.show_output = False
+    data = _load_shared(data_spec)
+    if detail_spec is not None:
+        backtesting.detail_data = _load_shared(detail_spec)
+
+    strat = next(s for s in backtesting.strategylist if s.get_strategy_name() == strategy_name)
+    min_date, max_date = backtesting.backtest_one_strategy(strat, data, timerange)
+    analysis = {
+        key: results[strategy_name]
+        for key, results in backtesting.analysis_results.items()
+        if strategy_name in results
+    }
+    return strategy_name, backtesting.all_bt_content[strategy_name], analysis, min_date, max_date
+
+
+def _load_shared(spec: dict[str, Any]) -> dict[str, DataFrame]:
+    store = SharedDataStore.attach(spec)
+    try:
+        return store.to_dataframes()
+    finally:
+        store.close()
+
+
+def backtest_strategies_parallel(
+    backtesting: "Backtesting",
+    strategies: list[IStrategy],
+    data: dict[str, DataFrame],
+    timerange: TimeRange,
+    jobs: int,
+) -> tuple[datetime, datetime]:
+    """
+    Backtest strategies in parallel worker processes, and merge the results into
+    backtesting.all_bt_content / backtesting.analysis_results.
+    Results are merged in strategy order - identical to a sequential run.
+    :param backtesting: Backtesting instance with data loaded
+    :param strategies: Strategies to backtest
+    :param data: Loaded candle data (raw OHLCV)
+    :param timerange: Timerange to backtest
+    :param jobs: Number of worker processes (joblib semantics, -1 uses all CPUs)
+    :return: tuple of (min_date, max_date) of the backtested data
+    """
+    logger.info(f"Backtesting {len(strategies)} strategies in parallel (jobs: {jobs}).")
+    data_store = SharedDataStore.create(data)
+    detail_store = (
+        SharedDataStore.create(backtesting.detail_data) if backtesting.detail_data else None
+    )
+    # Detail data is shared via shared memory - don't pickle it for every worker.
+    detail_data, backtesting.detail_data = backtesting.detail_data, {}
+    try:
+        with _prepared_for_workers(backtesting), Parallel(n_jobs=jobs) as parallel:
+            results: list[WorkerResult] = parallel(
+                _backtest_strategy_worker(
+                    backtesting,
+                    strat.get_strategy_name(),
+                    data_store.spec,
+                    detail_store.spec if detail_store else None,
+                    timerange,
+                )
+                for strat in strategies
+            )
+    finally:
+        backtesting.detail_data = detail_data
+        data_store.unlink()
+        if detail_store:
+            detail_store.unlink()
+
+    for strategy_name, content, analysis, min_date, max_date in results:
+        backtesting.all_bt_content[strategy_name] = content
+        for key, value in analysis.items():
+            backtesting.analysis_results[key][strategy_name] = value
+    return min_date, max_date
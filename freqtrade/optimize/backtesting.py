@@ -10,7 +10,7 @@ from copy import deepcopy
 from datetime import datetime, timedelta
 
 from numpy import isnan, nan
-from pandas import DataFrame, Series
+from pandas import DataFrame, DatetimeIndex, Series
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -49,7 +49,16 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import (
+    BacktestSignalData,
+    ColumnarData,
+    ColumnarPairData,
+    DetailPairData,
+)
+from freqtrade.optimize.backtest_exits import ExitPlanner
+from freqtrade.optimize.backtest_parallel import backtest_strategies_parallel
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_caching import IndicatorCache
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -69,6 +78,7 @@ from freqtrade.persistence import (
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.resolvers.strategy_resolver import check_override
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import FtPrecise, dt_now
@@ -170,6 +180,7 @@ class Backtesting:
         self.timeframe_secs = timeframe_to_seconds(self.timeframe)
         self.timeframe_min = self.timeframe_secs // 60
         self.timeframe_td = timedelta(seconds=self.timeframe_secs)
+        self._timeframe_ns = self.timeframe_secs * 1_000_000_000
         self.disable_database_use()
         self.init_backtest_detail()
         self.pairlists = PairListManager(self.exchange, self.config, self.dataprovider)
@@ -212,6 +223,12 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        # Evaluate exits vectorized - only for reused signal data (see prepare_signal_data)
+        self.vectorized_exits = False
+        self._exit_planner: ExitPlanner | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -270,6 +287,9 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        self._detail_blocks: dict[str, DetailPairData] = {}
+        self._signal_analyzed: dict[str, DataFrame] = {}
+        self._signal_main_dates: dict[str, DatetimeIndex] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -306,7 +326,7 @@ class Backtesting:
         Loads backtest data and returns the data combined with the timerange
         as tuple.
         """
-        self.progress.init_step(BacktestState.DATALOAD, 1)
+        self.progress.init_step(BacktestState.DATALOAD, len(self.pairlists.whitelist))
 
         data = history.load_data(
             datadir=self.config["datadir"],
@@ -317,6 +337,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.config.get("data_load_workers", 1),
+            progress_callback=lambda loaded, _: self.progress.set_new_value(loaded),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -332,7 +354,6 @@ class Backtesting:
             timeframe_to_seconds(self.timeframe), self.required_startup, min_date
         )
 
-        self.progress.set_new_value(1)
         self._load_bt_data_detail()
         self.price_pair_prec = {}
         for pair in self.pairlists.whitelist:
@@ -355,6 +376,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                workers=self.config.get("data_load_workers", 1),
             )
         else:
             self.detail_data = {}
@@ -373,6 +395,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                workers=self.config.get("data_load_workers", 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -385,6 +408,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.config.get("data_load_workers", 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -456,20 +480,19 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_signal_dataframes(self, processed: dict[str, DataFrame]):
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
+        Helper generator populating entry/exit signals for each pair, and shifting them
+        by one candle to avoid using data from the future.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :return: generator of (pair, dataframe) tuples
         """
-
-        data: dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
-        # Create dict with data
         for pair in processed.keys():
             pair_data = processed[pair]
             self.check_abort()
@@ -483,6 +506,7 @@ class Backtesting:
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
             )
+            self._signal_analyzed[pair] = df_analyzed
 
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
@@ -491,7 +515,8 @@ class Backtesting:
 
             # Create a copy of the dataframe before shifting, that way the entry signal/tag
             # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
+            # Only the columns used by the backtest loop are needed.
+            df_analyzed = df_analyzed[[col for col in HEADERS if col in df_analyzed.columns]].copy()
 
             # To avoid using data from future, we use entry/exit signals shifted
             # from the previous candle
@@ -507,12 +532,103 @@ class Backtesting:
                     df_analyzed[col] = 0 if not tag_col else None
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            if pair in self.detail_data and not df_analyzed.empty:
+                main_dates = self._signal_main_dates[pair] = DatetimeIndex(df_analyzed["date"])
+                self._get_detail_block(pair).align(main_dates, self._timeframe_ns)
+            yield pair, df_analyzed
+
+    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, list[tuple]]:
+        """
+        Helper function to convert a processed dataframes into lists for performance reasons.
+
+        Used by backtest() - so keep this optimized for performance.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
 
+        data: dict = {}
+        for pair, df_analyzed in self._get_ohlcv_signal_dataframes(processed):
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_columnar(
+        self, processed: dict[str, DataFrame], start_date: datetime
+    ) -> ColumnarData:
+        """
+        Helper function to convert processed dataframes into numpy blocks, aligned on one
+        shared time grid starting at start_date.
+        Used by backtest() when using the columnar backtest engine.
+        Rows are only materialized for candles the backtest actually visits.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        """
+        data = ColumnarData()
+        for pair, df_analyzed in self._get_ohlcv_signal_dataframes(processed):
+            if not df_analyzed.empty:
+                data[pair] = ColumnarPairData(df_analyzed)
+        data.align(start_date, self.timeframe_td, self._can_short, self.required_startup)
+        self.dataprovider._set_dataframe_max_index_resolver(data.dataframe_max_index)
+        return data
+
+    def prepare_signal_data(
+        self, processed: dict[str, DataFrame], start_date: datetime
+    ) -> BacktestSignalData:
+        """
+        Populate entry / exit signals and convert all pairs to the format used by the
+        backtest loop.
+        The result can be passed to backtest() repeatedly, as long as the signals don't change.
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        """
+        self._signal_analyzed = {}
+        self._signal_main_dates = {}
+        data: dict[str, list[tuple]] | ColumnarData
+        if (
+            self.backtest_engine == "columnar"
+            or self.strategy.backtest_skip_idle_candles
+            or self.vectorized_exits
+        ):
+            data = self._get_ohlcv_as_columnar(processed, start_date)
+        else:
+            data = self._get_ohlcv_as_lists(processed)
+        return BacktestSignalData(data, processed, self._signal_analyzed, self._signal_main_dates)
+
+    def vectorized_exits_supported(self) -> bool:
+        """
+        Exits can be evaluated vectorized (see ExitPlanner) for spot backtests without
+        timeframe_detail, if the strategy doesn't influence exits through callbacks.
+        """
+        return (
+            self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and ExitPlanner.supported(self.strategy)
+        )
+
+    def _restore_signal_data(self, signal_data: BacktestSignalData, start_date: datetime) -> None:
+        """
+        Restore dataprovider and timeframe_detail state for previously prepared signal data.
+        """
+        for pair, df_analyzed in signal_data.analyzed.items():
+            self.dataprovider._set_cached_df(
+                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+            )
+        for pair, main_dates in signal_data.main_dates.items():
+            if pair in self.detail_data:
+                self._get_detail_block(pair).align(main_dates, self._timeframe_ns)
+        if isinstance(signal_data.data, ColumnarData):
+            signal_data.data.align(
+                start_date, self.timeframe_td, self._can_short, self.required_startup
+            )
+            self.dataprovider._set_dataframe_max_index_resolver(
+                signal_data.data.dataframe_max_index
+            )
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -926,6 +1042,8 @@ class Backtesting:
     def _check_trade_exit(
         self, trade: LocalTrade, row: tuple, current_time: datetime
     ) -> LocalTrade | None:
+        if self._exit_planner and not self._exit_planner.is_due(trade, row):
+            return None
         self._run_funding_fees(trade, current_time)
 
         # Check if we need to adjust our current positions
@@ -948,6 +1066,8 @@ class Backtesting:
                 t = self._get_exit_for_signal(trade, row, exit_, current_time)
                 if t:
                     return t
+            if self._exit_planner:
+                self._exit_planner.plan(trade, row)
         return None
 
     def _run_funding_fees(self, trade: LocalTrade, current_time: datetime, force: bool = False):
@@ -1222,7 +1342,9 @@ class Backtesting:
         return trade
 
     def handle_left_open(
-        self, open_trades: dict[str, list[LocalTrade]], data: dict[str, list[tuple]]
+        self,
+        open_trades: dict[str, list[LocalTrade]],
+        data: dict[str, list[tuple]] | ColumnarData,
     ) -> None:
         """
         Handling of left open trades at the end of backtesting
@@ -1236,6 +1358,8 @@ class Backtesting:
                     LocalTrade.remove_bt_trade(trade)
                     continue
 
+                if self._exit_planner:
+                    self._exit_planner.finish(trade)
                 exit_row = data[pair][-1]
                 self._exit_trade(
                     trade, exit_row, exit_row[OPEN_IDX], trade.amount, ExitType.FORCE_EXIT.value
@@ -1511,26 +1635,58 @@ class Backtesting:
             return exiting_dir
         return None
 
+    def _get_detail_block(self, pair: str) -> DetailPairData:
+        """
+        Numpy block of the detail data for this pair.
+        Created once per detail dataframe, and reused across backtests (e.g. hyperopt epochs).
+        """
+        block = self._detail_blocks.get(pair)
+        if block is None or block.source is not self.detail_data[pair]:
+            block = self._detail_blocks[pair] = DetailPairData(self.detail_data[pair])
+        return block
+
     def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        return self._get_detail_block(pair).rows(row, self._timeframe_ns)
 
-        if len(detail_data) == 0:
-            return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+    def _get_candle_pairs(
+        self, data: dict[str, list[tuple]] | ColumnarData, step: int, pairs: list[str]
+    ) -> list[str]:
+        """
+        Pairs to evaluate for the main candle at this step.
+        The columnar engine only visits pairs with an entry signal on this candle -
+        pairs with open trades are always added by _time_pair_generator_det.
+        """
+        if not isinstance(data, ColumnarData):
+            return pairs
+        data.step = step
+        return data.active_pairs(step, pairs)
+
+    def _get_main_candle_row(
+        self,
+        data: dict[str, list[tuple]] | ColumnarData,
+        indexes: dict[str, int],
+        pair: str,
+        step: int,
+        current_time: datetime,
+    ) -> tuple | None:
+        """
+        Get the main candle row for this pair, advancing the pair's row index.
+        """
+        if isinstance(data, ColumnarData):
+            # Dataframe limits are resolved lazily by ColumnarData.dataframe_max_index
+            row_index = data[pair].index_at(step)
+            return data[pair][row_index] if row_index >= 0 else None
+
+        row_index = indexes[pair]
+        row = self.validate_row(data, pair, row_index, current_time)
+        if row:
+            row_index += 1
+            indexes[pair] = row_index
+            self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index)
+        return row
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1538,6 +1694,50 @@ class Backtesting:
             yield current_time
             current_time += self.timeframe_td
 
+    def _time_step_generator(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        data: dict[str, list[tuple]] | ColumnarData,
+    ):
+        """
+        Loop for each main candle, yielding (step, current_time).
+        If the strategy allows it, jumps straight to the next candle where something can happen
+        (an entry signal on any pair, or an open trade to evaluate).
+        With vectorized exits, open trades are only evaluated on candles where they may exit -
+        and idle candles are skipped unless the strategy implements bot_loop_start().
+        Dynamic pairlists refresh on every candle, so no candle is skipped when they're enabled.
+        """
+        columnar = data if isinstance(data, ColumnarData) else None
+        skip_idle = columnar is not None and (
+            self.strategy.backtest_skip_idle_candles
+            or (
+                self._exit_planner is not None
+                and not check_override(self.strategy, IStrategy, "bot_loop_start")
+            )
+        )
+        if skip_idle and self.dynamic_pairlist:
+            logger.info("Dynamic pairlist enabled - not skipping idle candles.")
+            skip_idle = False
+        if columnar is None or not skip_idle:
+            yield from enumerate(self._time_generator(start_date, end_date), 1)
+            return
+
+        last_step = int((end_date - start_date) / self.timeframe_td)
+        next_step: int | None = 1
+        while next_step is not None and next_step <= last_step:
+            step = next_step
+            yield step, start_date + step * self.timeframe_td
+            next_step = columnar.next_signal_step(step + 1)
+            if LocalTrade.bt_trades_open:
+                # Open trades (or open orders) need evaluation on every candle - unless their
+                # exit is planned.
+                next_exit = (
+                    self._exit_planner.next_step(step + 1) if self._exit_planner else step + 1
+                )
+                if next_exit is not None and (next_step is None or next_exit < next_step):
+                    next_step = next_exit
+
     def _time_generator_det(self, start_date: datetime, end_date: datetime):
         """
         Loop for each detail candle.
@@ -1568,7 +1768,7 @@ class Backtesting:
         start_date: datetime,
         end_date: datetime,
         pairs: list[str],
-        data: dict[str, list[tuple]],
+        data: dict[str, list[tuple]] | ColumnarData,
     ):
         """
         Backtest time and pair generator
@@ -1582,7 +1782,7 @@ class Backtesting:
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
 
-        for current_time in self._time_generator(start_date, end_date):
+        for step, current_time in self._time_step_generator(start_date, end_date, data):
             # Loop for each main candle.
             self.check_abort()
 
@@ -1601,7 +1801,7 @@ class Backtesting:
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
 
             for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
-                current_time, pairs
+                current_time, self._get_candle_pairs(data, step, pairs)
             ):
                 # Loop for each detail candle (if necessary) and pair
                 # Yields only the main date if no detail timeframe is set.
@@ -1610,17 +1810,10 @@ class Backtesting:
                 trade_dir: LongShort | None = None
                 if is_first:
                     # Main candle
-                    row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
+                    row = self._get_main_candle_row(data, indexes, pair, step, current_time)
                     if not row:
                         continue
 
-                    row_index += 1
-                    indexes[pair] = row_index
-                    is_last_row = current_time == end_date
-                    self.dataprovider._set_dataframe_max_index(
-                        pair, self.required_startup + row_index
-                    )
                     trade_dir = self.check_for_trade_entry(row)
                     pair_tradedir_cache[pair] = trade_dir
 
@@ -1674,10 +1867,14 @@ class Backtesting:
                 is_last_row = current_time_det == end_date
 
                 yield current_time_det, pair, row, is_last_row, trade_dir
-            self.progress.increment()
+            self.progress.set_new_value(step)
 
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        signal_data: BacktestSignalData | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1690,6 +1887,8 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param signal_data: Signal data from prepare_signal_data() to reuse.
+            processed is ignored if provided.
         :return: DataFrame with trades (results of backtesting)
         """
         self.reset_backtest(self.enable_protections)
@@ -1697,7 +1896,16 @@ class Backtesting:
         self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        if signal_data is None:
+            signal_data = self.prepare_signal_data(processed, start_date)
+        else:
+            self._restore_signal_data(signal_data, start_date)
+        data = signal_data.data
+        self._exit_planner = (
+            ExitPlanner(self.strategy, data)
+            if self.vectorized_exits and isinstance(data, ColumnarData)
+            else None
+        )
 
         # Loop timerange and get candle for each pair at that point in time
         for (
@@ -1737,6 +1945,20 @@ class Backtesting:
             "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
         }
 
+    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs - using the indicator cache if enabled.
+        Not used with hyperopt's --analyze-per-epoch: parameters change every epoch,
+        so entries would hardly ever be reused.
+        """
+        if (
+            self.config.get("indicator_cache", False)
+            and not self.config.get("analyze_per_epoch", False)
+            and not self.config.get("freqai", {}).get("enabled", False)
+        ):
+            return IndicatorCache(self.config, self.strategy).advise_all_indicators(data)
+        return self.strategy.advise_all_indicators(data)
+
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
     ):
@@ -1747,7 +1969,7 @@ class Backtesting:
         self._set_strategy(strat)
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1832,12 +2054,22 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies: list[IStrategy] = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        backtest_jobs = self.config.get("backtest_jobs", 1)
+        if backtest_jobs != 1 and len(strategies) > 1:
+            min_date, max_date = backtest_strategies_parallel(
+                self, strategies, data, timerange, backtest_jobs
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
@@ -7,6 +7,7 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+import shutil
 from datetime import datetime
 from math import ceil
 from pathlib import Path
@@ -19,6 +20,10 @@ from optuna.trial import FrozenTrial, Trial, TrialState
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_epoch_cache import (
+    HyperoptEpochCache,
+    get_hyperopt_run_id,
+)
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
 from freqtrade.optimize.hyperopt_tools import (
@@ -56,8 +61,8 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.data_store_dir: Path = (
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
         self.total_epochs = config.get("epochs", 0)
 
@@ -76,8 +81,9 @@ class Hyperopt:
         self.hyperopt_table_header = 0
         self.print_json = self.config.get("print_json", False)
 
-        self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
+        self.hyperopter = HyperOptimizer(self.config, self.data_store_dir)
         self.count_skipped_epochs = 0
+        self.epoch_cache: HyperoptEpochCache | None = None
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -85,13 +91,14 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
-            p = Path(f)
-            if p.is_file():
-                logger.info(f"Removing `{p}`.")
-                p.unlink()
+        if self.data_store_dir.is_dir():
+            logger.info(f"Removing `{self.data_store_dir}`.")
+            shutil.rmtree(self.data_store_dir)
+        if self.results_file.is_file():
+            logger.info(f"Removing `{self.results_file}`.")
+            self.results_file.unlink()
 
     def _save_result(self, epoch: dict) -> None:
         """
@@ -134,7 +141,40 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def _init_epoch_cache(self) -> None:
+        """
+        Load the epoch cache for this run (if enabled).
+        Must be called once the configuration is final.
+        """
+        if not self.config.get("hyperopt_cache", False):
+            return
+        strategy = self.hyperopter.backtesting.strategy
+        run_id = get_hyperopt_run_id(strategy, self.hyperopter.custom_hyperoptloss)
+        self.epoch_cache = HyperoptEpochCache(
+            self.config["user_data_dir"] / "hyperopt_results" / "epoch_cache",
+            self.hyperopter.get_strategy_name(),
+            run_id,
+        )
+
+    def run_optimizer_cached(self, parallel: Parallel, asked: list[dict]) -> list[dict[str, Any]]:
+        """
+        Evaluate asked points - using cached results where available.
+        Only points without cached result are sent to the worker processes.
+        """
+        if self.epoch_cache is None:
+            return self.run_optimizer_parallel(parallel, asked)
+        cached = [self.epoch_cache.get(params) for params in asked]
+        to_run = [params for params, res in zip(asked, cached, strict=True) if res is None]
+        new_results = iter(self.run_optimizer_parallel(parallel, to_run) if to_run else [])
+        results = []
+        for params, res in zip(asked, cached, strict=True):
+            if res is None:
+                res = next(new_results)
+                self.epoch_cache.add(params, res)
+            results.append(res)
+        return results
+
+    def run_optimizer_parallel(self, parallel: Parallel, asked: list[dict]) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
 
         return parallel(self.hyperopter.generate_optimizer_wrapped(v) for v in asked)
@@ -228,6 +268,7 @@ class Hyperopt:
         logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
         self.opt = self.hyperopter.get_optimizer(self.random_state)
+        self._init_epoch_cache()
         try:
             with Parallel(n_jobs=config_jobs) as parallel:
                 jobs = parallel._effective_n_jobs()
@@ -246,6 +287,8 @@ class Hyperopt:
                             n_points=1, dimensions=self.hyperopter.o_dimensions
                         )
                         f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
+                        if self.epoch_cache is not None:
+                            self.epoch_cache.add(asked[0].params, f_val0)
                         self.opt.tell(asked[0], [f_val0["loss"]])
                         self.evaluate_result(f_val0, 1, is_random[0])
                         pbar.update(task, advance=1)
@@ -262,7 +305,7 @@ class Hyperopt:
                             n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
                         )
 
-                        f_val = self.run_optimizer_parallel(
+                        f_val = self.run_optimizer_cached(
                             parallel,
                             [asked1.params for asked1 in asked],
                         )
@@ -290,6 +333,11 @@ class Hyperopt:
         except KeyboardInterrupt:
             print("User interrupted..")
 
+        if self.epoch_cache is not None and self.epoch_cache.hits > 0:
+            logger.info(
+                f"{self.epoch_cache.hits} {plural(self.epoch_cache.hits, 'epoch')} "
+                f"loaded from the epoch cache."
+            )
         if self.count_skipped_epochs > 0:
             logger.info(
                 f"{self.count_skipped_epochs} {plural(self.count_skipped_epochs, 'epoch')} "
@@ -0,0 +1,143 @@
+"""
+Persistent cache for hyperopt epoch results.
+Results are keyed by the (normalized) parameters of the epoch, and stored per hyperopt run id -
+which covers strategy, loss function, configuration and data.
+"""
+
+import hashlib
+import logging
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+
+from freqtrade import __version__
+from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
+from freqtrade.optimize.hyperopt_tools import hyperopt_serializer
+from freqtrade.optimize.indicator_caching import get_class_source_file, get_datadir_stamp
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+NUMBER_MODE = rapidjson.NM_NATIVE | rapidjson.NM_NAN
+
+# Configuration keys which have no impact on the result of an individual epoch.
+NOT_EPOCH_RELEVANT_KEYS = (
+    "strategy_list",
+    "original_config",
+    "telegram",
+    "api_server",
+    "epochs",
+    "early_stop",
+    "hyperopt_jobs",
+    "hyperopt_random_state",
+    "hyperopt_cache",
+    "indicator_cache",
+    "backtest_jobs",
+    "print_all",
+    "print_json",
+    "print_colorized",
+    "disableparamexport",
+    "verbosity",
+    "logfile",
+)
+
+
+def get_hyperopt_run_id(strategy: IStrategy, loss: IHyperOptLoss) -> str:
+    """
+    Hash of everything (except the parameters) an epoch result depends on.
+    Includes the freqtrade version, the configuration, parameters loaded from file,
+    the source of strategy and loss function, and the data directory.
+    :param strategy: strategy object.
+    :param loss: hyperopt loss object.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    digest.update(__version__.encode("utf-8"))
+
+    config = deepcopy(strategy.config)
+    for k in NOT_EPOCH_RELEVANT_KEYS:
+        config.pop(k, None)
+    digest.update(
+        rapidjson.dumps(config, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    digest.update(
+        rapidjson.dumps(
+            strategy._ft_params_from_file, default=str, number_mode=rapidjson.NM_NAN
+        ).encode("utf-8")
+    )
+    for cls in (*type(strategy).__mro__, type(loss)):
+        if cls in (IStrategy, object):
+            continue
+        if source_file := get_class_source_file(cls):
+            digest.update(Path(source_file).read_bytes())
+    digest.update(get_datadir_stamp(Path(strategy.config["datadir"])).encode("utf-8"))
+    return digest.hexdigest().lower()
+
+
+def get_params_key(params: dict[str, Any]) -> str:
+    """
+    Normalized representation of the parameters of one epoch.
+    """
+    return rapidjson.dumps(params, default=hyperopt_serializer, sort_keys=True)
+
+
+class HyperoptEpochCache:
+    """
+    Cache of epoch results for one hyperopt run id.
+    Stored as one json line per epoch in user_data/hyperopt_results/epoch_cache/,
+    so results survive restarts of hyperopt.
+    """
+
+    def __init__(self, cache_dir: Path, strategy_name: str, run_id: str) -> None:
+        self.filename = cache_dir / f"{strategy_name}_{run_id}.jsonl"
+        self._results: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.filename.is_file():
+            return
+        with self.filename.open("r") as f:
+            for line in f:
+                try:
+                    entry = rapidjson.loads(line, number_mode=NUMBER_MODE)
+                except ValueError:
+                    # Partially written line of an interrupted run.
+                    continue
+                self._results[entry["key"]] = entry["result"]
+        logger.info(f"Loaded {len(self._results)} cached epoch results from {self.filename}.")
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, params: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Get the cached result for params.
+        :return: Copy of the cached result, or None if params were not evaluated before.
+        """
+        result = self._results.get(get_params_key(params))
+        if result is None:
+            return None
+        self.hits += 1
+        return deepcopy(result)
+
+    def add(self, params: dict[str, Any], result: dict[str, Any]) -> None:
+        """
+        Store the result of one epoch.
+        """
+        key = get_params_key(params)
+        if key in self._results:
+            return
+        line = rapidjson.dumps(
+            {"key": key, "result": result},
+            default=hyperopt_serializer,
+            number_mode=NUMBER_MODE,
+        )
+        # Store the serialized version - so cache hits look identical within and across runs.
+        self._results[key] = rapidjson.loads(line, number_mode=NUMBER_MODE)["result"]
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        with self.filename.open("a") as f:
+            f.write(line + "\n")
@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Any
 
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
@@ -22,10 +22,12 @@ from freqtrade.constants import DATETIME_PRINT_FORMAT, Config
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
+from freqtrade.data.shared_store import MmapDataStore
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.ft_types import BacktestContentType
 from freqtrade.misc import deep_merge_dicts, round_dict
+from freqtrade.optimize.backtest_columnar import BacktestSignalData
 from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
@@ -62,6 +64,11 @@ optuna_samplers_dict = {
 
 log_queue: Any
 
+# Data store of this (worker) process - loaded once and reused for all epochs.
+_data_store: MmapDataStore | None = None
+# Signals of this (worker) process - reused for all epochs if signals can't change.
+_signal_data: tuple[str | None, BacktestSignalData] | None = None
+
 
 class HyperOptimizer:
     """
@@ -69,7 +76,7 @@ class HyperOptimizer:
     This class is sent to the hyperopt worker processes.
     """
 
-    def __init__(self, config: Config, data_pickle_file: Path) -> None:
+    def __init__(self, config: Config, data_store_dir: Path) -> None:
         self.buy_space: list[DimensionProtocol] = []
         self.sell_space: list[DimensionProtocol] = []
         self.protection_space: list[DimensionProtocol] = []
@@ -88,6 +95,8 @@ class HyperOptimizer:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        if self.analyze_per_epoch and self.config.get("indicator_cache", False):
+            logger.info("Indicator cache is not used with `--analyze-per-epoch`.")
 
         self.custom_hyperopt = HyperOptAuto(self.config)
 
@@ -100,7 +109,8 @@ class HyperOptimizer:
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
-        self.data_pickle_file = data_pickle_file
+        self.data_store_dir = data_store_dir
+        self.data_store_id: str | None = None
 
         self.market_change = 0.0
 
@@ -111,6 +121,16 @@ class HyperOptimizer:
         if HyperoptTools.has_space(self.config, "sell"):
             # Make sure use_exit_signal is enabled
             self.config["use_exit_signal"] = True
+        # Entry / exit signals only depend on the parameters of the buy, sell and protection
+        # spaces - without these, signals are calculated once and reused for all epochs.
+        self.static_signals = not self.analyze_per_epoch and not any(
+            HyperoptTools.has_space(self.config, space) for space in ("buy", "sell", "protection")
+        )
+        if self.static_signals:
+            logger.info("Entry and exit signals don't depend on hyperopt spaces, reusing them.")
+            if self.backtesting.vectorized_exits_supported():
+                logger.info("Evaluating roi, stoploss and trailing stop exits vectorized.")
+                self.backtesting.vectorized_exits = True
         self._setup_logging_mp_workaround()
 
     def _setup_logging_mp_workaround(self) -> None:
@@ -338,14 +358,21 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-        if self.analyze_per_epoch:
-            # Data is not yet analyzed, rerun populate_indicators.
-            processed = self.advise_and_trim(processed)
+        signal_data: BacktestSignalData | None = None
+        if self.static_signals:
+            signal_data = self._get_signal_data()
+            processed = signal_data.processed
+        else:
+            processed = self._load_data()
+            if self.analyze_per_epoch:
+                # Data is not yet analyzed, rerun populate_indicators.
+                processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+            processed=processed,
+            start_date=self.min_date,
+            end_date=self.max_date,
+            signal_data=signal_data,
         )
         backtest_end_time = datetime.now(UTC)
         bt_results.update(
@@ -465,7 +492,7 @@ class HyperOptimizer:
         return optuna.create_study(sampler=sampler, direction="minimize")
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -478,6 +505,38 @@ class HyperOptimizer:
         # Real trimming will happen as part of backtesting.
         return preprocessed
 
+    def _store_data(self, data: dict[str, DataFrame]) -> None:
+        """
+        Store data for all epochs in a memory-mapped columnar store.
+        """
+        self.data_store_id = MmapDataStore.create(data, self.data_store_dir).spec["id"]
+
+    def _load_data(self) -> dict[str, DataFrame]:
+        """
+        Get fresh data for one epoch.
+        The store is loaded once per process. Each epoch gets copy-on-write mappings of its
+        columns - only columns modified by the strategy are copied.
+        """
+        global _data_store
+        if _data_store is None or _data_store.spec["id"] != self.data_store_id:
+            if _data_store is not None:
+                _data_store.close()
+            _data_store = MmapDataStore.load(self.data_store_dir)
+        return _data_store.to_cow_dataframes()
+
+    def _get_signal_data(self) -> BacktestSignalData:
+        """
+        Get signal data for static signals.
+        Signals are calculated once per process, and reused for all further epochs.
+        """
+        global _signal_data
+        if _signal_data is None or _signal_data[0] != self.data_store_id:
+            _signal_data = (
+                self.data_store_id,
+                self.backtesting.prepare_signal_data(self._load_data(), self.min_date),
+            )
+        return _signal_data[1]
+
     def prepare_hyperopt_data(self) -> None:
         HyperoptStateContainer.set_state(HyperoptState.DATALOAD)
         data, self.timerange = self.backtesting.load_bt_data()
@@ -495,6 +554,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self._store_data(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self._store_data(data)
@@ -0,0 +1,236 @@
+"""
+Persistent cache for populated indicators (the result of advise_all_indicators).
+Indicators are stored as feather files in user_data/indicator_cache/<strategy>/,
+keyed by the strategy source, parameters, indicator-relevant configuration and the candle data.
+The informative data used for an entry is recorded in a json file next to it.
+"""
+
+import hashlib
+import inspect
+import logging
+from copy import deepcopy
+from pathlib import Path
+
+import rapidjson
+from pandas import DataFrame, RangeIndex, read_feather
+from pandas.util import hash_pandas_object
+
+from freqtrade import __version__
+from freqtrade.constants import Config, PairWithTimeframe
+from freqtrade.data.history import get_datahandler
+from freqtrade.enums import CandleType
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Configuration keys which have no impact on populate_indicators.
+NOT_INDICATOR_RELEVANT_KEYS = (
+    "strategy_list",
+    "original_config",
+    "telegram",
+    "api_server",
+    "timerange",
+    "export",
+    "exportfilename",
+    "exportdirectory",
+    "backtest_cache",
+    "backtest_jobs",
+    "backtest_notes",
+    "backtest_breakdown",
+    "backtest_engine",
+    "indicator_cache",
+    "epochs",
+    "spaces",
+    "hyperopt_jobs",
+    "hyperopt_loss",
+    "hyperopt_random_state",
+    "hyperopt_min_trades",
+    "print_all",
+    "print_json",
+    "verbosity",
+    "logfile",
+)
+
+
+def get_strategy_indicator_hash(strategy: IStrategy) -> str:
+    """
+    Hash of everything (except the candle data) populate_indicators may depend on.
+    Includes the source of the strategy and its parent classes, parameter values,
+    the configuration (without keys irrelevant to indicators) and the freqtrade version.
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    digest.update(__version__.encode("utf-8"))
+
+    config = deepcopy(strategy.config)
+    for k in NOT_INDICATOR_RELEVANT_KEYS:
+        config.pop(k, None)
+    digest.update(
+        rapidjson.dumps(config, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    params = {
+        name: [param.value, param.in_space, param.optimize]
+        for name, param in strategy.enumerate_parameters()
+    }
+    digest.update(
+        rapidjson.dumps(
+            [params, strategy._ft_params_from_file], default=str, number_mode=rapidjson.NM_NAN
+        ).encode("utf-8")
+    )
+    # Strategy classes may inherit from other strategies - include all of them.
+    for cls in type(strategy).__mro__:
+        if cls is IStrategy:
+            break
+        if source_file := get_class_source_file(cls):
+            digest.update(Path(source_file).read_bytes())
+    return digest.hexdigest().lower()
+
+
+def get_class_source_file(cls: type) -> str | None:
+    """
+    Source file of a class.
+    Classes loaded by the resolvers are not registered in sys.modules, but carry __file__.
+    """
+    if source_file := cls.__dict__.get("__file__"):
+        return source_file
+    try:
+        return inspect.getsourcefile(cls)
+    except TypeError:
+        return None
+
+
+def get_datadir_stamp(datadir: Path) -> str:
+    """
+    Hash of name, size and modification time of all files in the data directory.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    for file in sorted(datadir.rglob("*")):
+        if file.is_file():
+            stat = file.stat()
+            digest.update(f"{file.relative_to(datadir)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest().lower()
+
+
+def get_dataframe_fingerprint(dataframe: DataFrame) -> str:
+    """
+    Content hash of a candle dataframe, covering row range, columns and values.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    digest.update(rapidjson.dumps(list(map(str, dataframe.columns))).encode("utf-8"))
+    digest.update(hash_pandas_object(dataframe, index=False).to_numpy().tobytes())
+    return digest.hexdigest().lower()
+
+
+class IndicatorCache:
+    """
+    Caches the result of IStrategy.advise_all_indicators on disk.
+    Only pairs without a valid cache entry are calculated.
+    Each entry records the data files loaded through the dataprovider (informative pairs)
+    while it was calculated - and is only valid while these files are unchanged.
+    """
+
+    def __init__(self, config: Config, strategy: IStrategy) -> None:
+        self._strategy = strategy
+        self._cache_dir: Path = (
+            config["user_data_dir"] / "indicator_cache" / strategy.get_strategy_name()
+        )
+        self._strategy_hash = get_strategy_indicator_hash(strategy)
+        self._datadir = Path(config["datadir"])
+        self._datahandler = get_datahandler(self._datadir, config.get("dataformat_ohlcv"))
+        self._data_stamps: dict[PairWithTimeframe, list] = {}
+
+    def _get_filename(self, pair: str, dataframe: DataFrame) -> Path:
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(self._strategy_hash.encode("utf-8"))
+        digest.update(pair.encode("utf-8"))
+        digest.update(get_dataframe_fingerprint(dataframe).encode("utf-8"))
+        return self._cache_dir / f"{digest.hexdigest().lower()}.feather"
+
+    def _get_data_stamp(self, pair: str, timeframe: str, candle_type: CandleType) -> list:
+        """
+        Name, size and modification time of the files the data of a pair is loaded from.
+        Files are only checked once per instance.
+        """
+        key = (pair, timeframe, candle_type)
+        if key not in self._data_stamps:
+            stamp = []
+            for file in self._datahandler.ohlcv_data_files(pair, timeframe, candle_type):
+                stat = file.stat()
+                stamp.append([str(file.relative_to(self._datadir)), stat.st_size, stat.st_mtime_ns])
+            self._data_stamps[key] = stamp
+        return self._data_stamps[key]
+
+    def _loaded_data_stamps(self) -> list:
+        """
+        Stamps of all data the dataprovider loaded from disk (informative pairs).
+        """
+        if not (dp := getattr(self._strategy, "dp", None)):
+            return []
+        return [
+            [pair, timeframe, candle_type.value, self._get_data_stamp(pair, timeframe, candle_type)]
+            for pair, timeframe, candle_type in dp._historic_ohlcv_pairs()
+        ]
+
+    def _load(self, filename: Path) -> DataFrame | None:
+        meta_file = filename.with_suffix(".json")
+        if not filename.is_file() or not meta_file.is_file():
+            return None
+        try:
+            meta = rapidjson.loads(meta_file.read_text())
+            for pair, timeframe, candle_type, stamp in meta["data"]:
+                if self._get_data_stamp(pair, timeframe, CandleType(candle_type)) != stamp:
+                    return None
+            return read_feather(filename)
+        except Exception as e:
+            logger.warning(f"Could not load cached indicators from {filename}: {e}")
+            return None
+
+    def _store(self, pair: str, filename: Path, dataframe: DataFrame, data_stamps: list) -> None:
+        if not dataframe.index.equals(RangeIndex(len(dataframe))):
+            logger.debug(f"Not caching indicators for {pair}, dataframe index was modified.")
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = filename.with_suffix(".tmp")
+        tmp_meta_file = filename.with_suffix(".json.tmp")
+        try:
+            tmp_meta_file.write_text(rapidjson.dumps({"data": data_stamps}))
+            dataframe.to_feather(tmp_file, compression="lz4")
+            # Rename is atomic - concurrent runs never see partially written files.
+            tmp_meta_file.replace(filename.with_suffix(".json"))
+            tmp_file.replace(filename)
+        except Exception as e:
+            tmp_file.unlink(missing_ok=True)
+            tmp_meta_file.unlink(missing_ok=True)
+            logger.info(f"Could not cache indicators for {pair}: {e}")
+
+    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Cached version of IStrategy.advise_all_indicators.
+        :param data: dict of candle dataframes, keyed by pair
+        :return: dict of dataframes with indicators, in the order of data
+        """
+        res: dict[str, DataFrame] = {}
+        missing: dict[str, Path] = {}
+        for pair, pair_data in data.items():
+            filename = self._get_filename(pair, pair_data)
+            cached = self._load(filename)
+            if cached is not None and len(cached) == len(pair_data):
+                res[pair] = cached
+            else:
+                missing[pair] = filename
+
+        logger.info(
+            f"Loaded indicators for {len(data) - len(missing)} of {len(data)} pairs from cache."
+        )
+        if missing:
+            calculated = self._strategy.advise_all_indicators(
+                {pair: data[pair] for pair in missing}
+            )
+            # Pairs share the dataprovider cache - record all data loaded for every entry.
+            data_stamps = self._loaded_data_stamps()
+            for pair, filename in missing.items():
+                self._store(pair, filename, calculated[pair], data_stamps)
+            res.update(calculated)
+        return {pair: res[pair] for pair in data}
@@ -8,9 +8,9 @@ import threading
 from contextvars import ContextVar
 from typing import Any, Final
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import Engine, create_engine, event, inspect
 from sqlalchemy.exc import NoSuchModuleError
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from freqtrade.exceptions import OperationalException
@@ -28,6 +28,8 @@ logger = logging.getLogger(__name__)
 
 REQUEST_ID_CTX_KEY: Final[str] = "request_id"
 _request_id_ctx_var: ContextVar[str | None] = ContextVar(REQUEST_ID_CTX_KEY, default=None)
+# Set for read-only (api) requests - which use the read engine if one is configured
+_read_only_ctx_var: ContextVar[bool] = ContextVar("read_only", default=False)
 
 
 def get_request_or_thread_id() -> str | None:
@@ -42,18 +44,31 @@ def get_request_or_thread_id() -> str | None:
     return request_id
 
 
+class _RoutingSession(Session):
+    """
+    Session using the read engine (if configured) while in a read-only context.
+    """
+
+    def get_bind(self, mapper=None, **kwargs):
+        read_engine = self.info.get("read_engine")
+        if read_engine is not None and _read_only_ctx_var.get():
+            return read_engine
+        return super().get_bind(mapper, **kwargs)
+
+
 _SQL_DOCS_URL = "http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls"
 
 
-def init_db(db_url: str, config: dict[str, Any] | None = None) -> None:
+def _sqlite_query_only(dbapi_connection, connection_record):
     """
-    Initializes this module with the given config,
-    registers all known command handlers
-    and starts polling for message updates
-    :param db_url: Database to use
-    :param config: Optional configuration dict for database pool settings
-    :return: None
+    Connect event handler, preventing writes through the read engine
     """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _create_engine(db_url: str, config: dict[str, Any] | None) -> Engine:
     kwargs: dict[str, Any] = {}
 
     if db_url == "sqlite:///":
@@ -114,23 +129,59 @@ def init_db(db_url: str, config: dict[str, Any] | None = None) -> None:
         )
 
     try:
-        engine = create_engine(db_url, future=True, **kwargs)
+        return create_engine(db_url, future=True, **kwargs)
     except NoSuchModuleError:
         raise OperationalException(
             f"Given value for db_url: '{db_url}' is no valid database URL! (See {_SQL_DOCS_URL})"
         )
 
+
+def _create_read_engine(engine: Engine, config: dict[str, Any] | None) -> Engine | None:
+    """
+    Create the engine used for read-only api requests, so they don't share
+    connections with the bot.
+    """
+    read_url = (config or {}).get("db_read_url")
+    if not read_url:
+        return None
+    if read_url == "sqlite://" or str(engine.url) == "sqlite://":
+        logger.warning("`db_read_url` is not supported for in-memory databases. Ignoring.")
+        return None
+    read_engine = _create_engine(read_url, config)
+    if read_engine.dialect.name == "sqlite":
+        # sqlite databases use WAL mode (see set_sqlite_to_wal) - reads don't block the bot.
+        event.listen(read_engine, "connect", _sqlite_query_only)
+    logger.info(f"Using separate database connections for api reads: {read_engine.url!r}.")
+    return read_engine
+
+
+def init_db(db_url: str, config: dict[str, Any] | None = None) -> None:
+    """
+    Initializes this module with the given config,
+    registers all known command handlers
+    and starts polling for message updates
+    :param db_url: Database to use
+    :param config: Optional configuration dict for database pool and read engine settings
+    :return: None
+    """
+    engine = _create_engine(db_url, config)
+    read_engine = _create_read_engine(engine, config)
+
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # Since we also use fastAPI, we need to make it aware of the request id, too
+    # Read-only requests are routed to the read engine by _RoutingSession
+    session_info = {"read_engine": read_engine}
     Trade.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
+        sessionmaker(class_=_RoutingSession, bind=engine, autoflush=False, info=session_info),
+        scopefunc=get_request_or_thread_id,
     )
     Order.session = Trade.session
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
     _CustomData.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=True), scopefunc=get_request_or_thread_id
+        sessionmaker(class_=_RoutingSession, bind=engine, autoflush=True, info=session_info),
+        scopefunc=get_request_or_thread_id,
     )
     StrategySnapshot.session = Trade.session
 
@@ -0,0 +1,223 @@
+import logging
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from math import isclose
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from sqlalchemy import case, func, select
+
+from freqtrade.persistence.trade_model import Trade
+
+
+logger = logging.getLogger(__name__)
+
+_OUTCOMES = ("wins", "losses", "draws")
+
+
+class ClosedTradeStatistics:
+    """
+    Statistics of closed trades, maintained in memory.
+    Every access compares a cheap aggregate of the closed trades in the database with
+    the cached state - only trades closed since the last access are loaded.
+    All closed trades are reloaded if they changed otherwise (deleted, reopened, profit updated).
+    All access happens under a lock, as API and Telegram requests run in different threads.
+    NOTE: Not supported in Backtesting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # Closed trades, ordered by trade id
+        self.ids = np.empty(0, dtype=np.int64)
+        self.open_dates = np.empty(0, dtype="datetime64[us]")
+        self.close_dates = np.empty(0, dtype="datetime64[us]")
+        self.profit_ratios = np.empty(0, dtype=np.float64)
+        self.profit_abs = np.empty(0, dtype=np.float64)
+        self.is_short = np.empty(0, dtype=bool)
+        # Closed profit and trade count per (UTC) day
+        self.daily: dict[date, list] = {}
+        # Outcome counts per exit reason
+        self.exit_reasons: dict[str | None, dict[str, int]] = {}
+        # Total duration in seconds and trade count per outcome
+        self.durations: dict[str, list] = {
+            outcome: [0.0, 0] for outcome in ("wins", "draws", "losses")
+        }
+
+    @staticmethod
+    def _db_fingerprint() -> tuple:
+        stmt = select(
+            func.count(Trade.id),
+            func.sum(Trade.id),
+            func.sum(case((Trade.is_short.is_(True), Trade.id), else_=0)),
+            func.max(Trade.close_date),
+            func.sum(Trade.close_profit),
+            func.sum(Trade.close_profit_abs),
+        ).filter(Trade.is_open.is_(False), Trade.close_date.is_not(None))
+        count, id_sum, short_sum, last_close, ratio_sum, abs_sum = Trade.session.execute(stmt).one()
+        return (count, id_sum or 0, short_sum or 0, last_close, ratio_sum or 0.0, abs_sum or 0.0)
+
+    def _fingerprint(self) -> tuple:
+        return (
+            len(self.ids),
+            int(self.ids.sum()),
+            int(self.ids[self.is_short].sum()),
+            self.close_dates.max().astype(datetime) if len(self.ids) else None,
+            float(np.nansum(self.profit_ratios)),
+            float(np.nansum(self.profit_abs)),
+        )
+
+    @staticmethod
+    def _matches(db_fingerprint: tuple, fingerprint: tuple) -> bool:
+        return db_fingerprint[:4] == fingerprint[:4] and all(
+            isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+            for a, b in zip(db_fingerprint[4:], fingerprint[4:], strict=True)
+        )
+
+    @staticmethod
+    def _load_trades(*trade_filter) -> Sequence:
+        stmt = select(
+            Trade.id,
+            Trade.open_date,
+            Trade.close_date,
+            Trade.close_profit,
+            Trade.close_profit_abs,
+            Trade.is_short,
+            Trade.exit_reason,
+        ).filter(Trade.is_open.is_(False), Trade.close_date.is_not(None), *trade_filter)
+        return Trade.session.execute(stmt).all()
+
+    def _add_trades(self, rows: Sequence) -> None:
+        if not rows:
+            return
+        ids, open_dates, close_dates, ratios, profits, is_short, exit_reasons = zip(
+            *rows, strict=True
+        )
+        self.ids = np.concatenate([self.ids, np.array(ids, dtype=np.int64)])
+        self.open_dates = np.concatenate(
+            [self.open_dates, np.array(open_dates, dtype="datetime64[us]")]
+        )
+        self.close_dates = np.concatenate(
+            [self.close_dates, np.array(close_dates, dtype="datetime64[us]")]
+        )
+        self.profit_ratios = np.concatenate([self.profit_ratios, np.array(ratios, dtype=float)])
+        self.profit_abs = np.concatenate([self.profit_abs, np.array(profits, dtype=float)])
+        self.is_short = np.concatenate([self.is_short, np.array(is_short, dtype=bool)])
+
+        order = np.argsort(self.ids, kind="stable")
+        for name in ("ids", "open_dates", "close_dates", "profit_ratios", "profit_abs", "is_short"):
+            setattr(self, name, getattr(self, name)[order])
+
+        for open_date, close_date, ratio, profit, exit_reason in zip(
+            open_dates, close_dates, ratios, profits, exit_reasons, strict=True
+        ):
+            bucket = self.daily.setdefault(close_date.date(), [0.0, 0])
+            bucket[0] += profit or 0.0
+            bucket[1] += 1
+
+            ratio = ratio or 0.0
+            outcome = "wins" if ratio > 0 else "losses" if ratio < 0 else "draws"
+            if exit_reason not in self.exit_reasons:
+                self.exit_reasons[exit_reason] = dict.fromkeys(_OUTCOMES, 0)
+            self.exit_reasons[exit_reason][outcome] += 1
+            duration = self.durations[outcome]
+            duration[0] += (close_date - open_date).total_seconds()
+            duration[1] += 1
+
+    def sync(self) -> None:
+        """
+        Update the statistics with the closed trades in the database
+        """
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        """
+        sync() - the caller holds self._lock.
+        """
+        try:
+            db_fingerprint = self._db_fingerprint()
+            if self._matches(db_fingerprint, self._fingerprint()):
+                return
+            if len(self.ids):
+                # Trades closed since the last sync - the last close date may be shared
+                last_close = self.close_dates.max().astype(datetime)
+                rows = self._load_trades(Trade.close_date >= last_close)
+                known = set(self.ids[self.close_dates == np.datetime64(last_close)].tolist())
+                self._add_trades([row for row in rows if row[0] not in known])
+                if self._matches(db_fingerprint, self._fingerprint()):
+                    return
+                logger.debug("Closed trades changed, reloading trade statistics.")
+                self._reset()
+            self._add_trades(self._load_trades())
+        finally:
+            Trade.session.remove()
+
+    def closed_trades(
+        self, start_date: datetime | None = None, direction: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Closed trades, ordered by trade id
+        :param start_date: Only trades closed at or after this date
+        :param direction: Only 'long' or 'short' trades
+        :return: Dict of numpy arrays, keyed by ids, open_dates, close_dates,
+            profit_ratios and profit_abs
+        """
+        if start_date is not None and start_date.tzinfo:
+            start_date = start_date.astimezone(UTC).replace(tzinfo=None)
+        # The snapshot is taken under the lock - a concurrent sync replaces the arrays.
+        with self._lock:
+            self._sync_locked()
+            mask = np.ones(len(self.ids), dtype=bool)
+            if start_date is not None:
+                mask &= self.close_dates >= np.datetime64(start_date, "us")
+            if direction == "long":
+                mask &= ~self.is_short
+            elif direction == "short":
+                mask &= self.is_short
+            return {
+                "ids": self.ids[mask],
+                "open_dates": self.open_dates[mask],
+                "close_dates": self.close_dates[mask],
+                "profit_ratios": self.profit_ratios[mask],
+                "profit_abs": self.profit_abs[mask],
+            }
+
+    def period_profits(self, periods: Sequence[tuple[date, date]]) -> list[tuple[float, int]]:
+        """
+        Closed profit and trade count of trades closed in each period
+        :param periods: List of (start, end) dates - start inclusive, end exclusive
+        """
+        result = []
+        with self._lock:
+            self._sync_locked()
+            for start, end in periods:
+                profit = 0.0
+                count = 0
+                day = start
+                while day < end:
+                    if bucket := self.daily.get(day):
+                        profit += bucket[0]
+                        count += bucket[1]
+                    day += timedelta(days=1)
+                result.append((profit, count))
+        return result
+
+    def outcome_stats(self) -> dict[str, Any]:
+        """
+        Outcome counts per exit reason and average duration (in seconds) per outcome
+        """
+        with self._lock:
+            self._sync_locked()
+            return {
+                "exit_reasons": {
+                    reason: dict(counts) for reason, counts in self.exit_reasons.items()
+                },
+                "durations": {
+                    outcome: total / count if count else None
+                    for outcome, (total, count) in self.durations.items()
+                },
+            }
@@ -1,11 +1,16 @@
 import logging
 from copy import deepcopy
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from freqtrade.configuration import validate_config_consistency
 from freqtrade.rpc.api_server.api_pairlists import handleExchangePayload
-from freqtrade.rpc.api_server.api_schemas import PairHistory, PairHistoryRequest
+from freqtrade.rpc.api_server.api_schemas import (
+    CandleDataLayout,
+    PairHistory,
+    PairHistoryRequest,
+)
+from freqtrade.rpc.api_server.arrow_response import candle_layout, candle_response
 from freqtrade.rpc.api_server.deps import get_config, get_exchange
 from freqtrade.rpc.rpc import RPC
 
@@ -17,11 +22,14 @@ router = APIRouter()
 
 @router.get("/pair_history", response_model=PairHistory, tags=["candle data"])
 def pair_history(
+    request: Request,
     pair: str,
     timeframe: str,
     timerange: str,
     strategy: str,
     freqaimodel: str | None = None,
+    since_ts: int | None = None,
+    layout: CandleDataLayout = "rows",
     config=Depends(get_config),
     exchange=Depends(get_exchange),
 ):
@@ -38,13 +46,26 @@ def pair_history(
     )
     validate_config_consistency(config_loc)
     try:
-        return RPC._rpc_analysed_history_full(config_loc, pair, timeframe, exchange, None, False)
+        return candle_response(
+            RPC._rpc_analysed_history_full(
+                config_loc,
+                pair,
+                timeframe,
+                exchange,
+                None,
+                False,
+                since_ts=since_ts,
+                layout=candle_layout(request, layout),
+            )
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
 
 @router.post("/pair_history", response_model=PairHistory, tags=["candle data"])
-def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config)):
+def pair_history_filtered(
+    request: Request, payload: PairHistoryRequest, config=Depends(get_config)
+):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
     config_loc = deepcopy(config)
@@ -64,13 +85,17 @@ def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config
     validate_config_consistency(config_loc)
 
     try:
-        return RPC._rpc_analysed_history_full(
-            config_loc,
-            payload.pair,
-            payload.timeframe,
-            exchange,
-            payload.columns,
-            payload.live_mode,
+        return candle_response(
+            RPC._rpc_analysed_history_full(
+                config_loc,
+                payload.pair,
+                payload.timeframe,
+                exchange,
+                payload.columns,
+                payload.live_mode,
+                since_ts=payload.since_ts,
+                layout=candle_layout(request, payload.layout),
+            )
         )
     except Exception as e:
         logger.exception("Error in pair_history_filtered")
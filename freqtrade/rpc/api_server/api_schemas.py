@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import AwareDatetime, BaseModel, RootModel, SerializeAsAny, model_validator
 
@@ -529,11 +529,16 @@ class AvailablePairs(BaseModel):
     pair_interval: list[list[str]]
 
 
+CandleDataLayout = Literal["rows", "columns"]
+
+
 class PairCandlesRequest(BaseModel):
     pair: str
     timeframe: str
     limit: int | None = None
     columns: list[str] | None = None
+    since_ts: int | None = None
+    layout: CandleDataLayout = "rows"
 
 
 class PairHistoryRequest(PairCandlesRequest, ExchangeModePayloadMixin):
@@ -550,7 +555,7 @@ class PairHistory(BaseModel):
     timeframe_ms: int
     columns: list[str]
     all_columns: list[str] = []
-    data: SerializeAsAny[list[Any]]
+    data: SerializeAsAny[list[Any] | dict[str, list[Any]]]
     annotations: list[AnnotationType] | None = None
     length: int
     buy_signals: int
@@ -643,6 +648,16 @@ class SysInfo(BaseModel):
     ram_pct: float
 
 
+class EndpointStats(BaseModel):
+    requests: int
+    active: int
+    waiting: int
+    max_concurrent: int
+    avg_time: float
+    max_time: float
+    avg_wait: float
+
+
 class Health(BaseModel):
     last_process: datetime | None = None
     last_process_ts: int | None = None
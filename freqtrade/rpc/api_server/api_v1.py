@@ -2,7 +2,7 @@ import logging
 from copy import deepcopy
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.exceptions import HTTPException
 
 from freqtrade import __version__
@@ -16,10 +16,12 @@ from freqtrade.rpc.api_server.api_schemas import (
     Balances,
     BlacklistPayload,
     BlacklistResponse,
+    CandleDataLayout,
     Count,
     DailyWeeklyMonthly,
     DeleteLockRequest,
     DeleteTrade,
+    EndpointStats,
     Entry,
     ExchangeListResponse,
     Exit,
@@ -54,7 +56,14 @@ from freqtrade.rpc.api_server.api_schemas import (
     Version,
     WhitelistResponse,
 )
-from freqtrade.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
+from freqtrade.rpc.api_server.arrow_response import candle_layout, candle_response
+from freqtrade.rpc.api_server.deps import (
+    get_config,
+    get_endpoint_limiter,
+    get_exchange,
+    get_rpc,
+    get_rpc_optional,
+)
 from freqtrade.rpc.rpc import RPCException
 
 
@@ -91,7 +100,9 @@ logger = logging.getLogger(__name__)
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
 # 2.43: Add /profit_all endpoint
-API_VERSION = 2.43
+# 2.44: pair_candles and pair_history: since_ts, columnar layout and Arrow responses
+# 2.45: Add /request_stats endpoint
+API_VERSION = 2.45
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -399,15 +410,36 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
 
 
 @router.get("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None)
+def pair_candles(
+    request: Request,
+    pair: str,
+    timeframe: str,
+    limit: int | None = None,
+    since_ts: int | None = None,
+    layout: CandleDataLayout = "rows",
+    rpc: RPC = Depends(get_rpc),
+):
+    return candle_response(
+        rpc._rpc_analysed_dataframe(
+            pair, timeframe, limit, None, since_ts, candle_layout(request, layout)
+        )
+    )
 
 
 @router.post("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
+def pair_candles_filtered(
+    request: Request, payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)
+):
     # Advanced pair_candles endpoint with column filtering
-    return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+    return candle_response(
+        rpc._rpc_analysed_dataframe(
+            payload.pair,
+            payload.timeframe,
+            payload.limit,
+            payload.columns,
+            payload.since_ts,
+            candle_layout(request, payload.layout),
+        )
     )
 
 
@@ -573,3 +605,9 @@ def sysinfo():
 @router.get("/health", response_model=Health, tags=["info"])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc.health()
+
+
+@router.get("/request_stats", response_model=dict[str, EndpointStats], tags=["info"])
+async def request_stats(limiter=Depends(get_endpoint_limiter)):
+    # async - as the endpoint limiter must only be used from the event loop
+    return limiter.stats()
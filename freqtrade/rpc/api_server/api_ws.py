@@ -12,6 +12,7 @@ from freqtrade.rpc.api_server.api_auth import validate_ws_token
 from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import get_ws_serializer
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSErrorMessage,
@@ -47,10 +48,12 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
     Iterate over messages in the message stream and send them
     """
     async for message, ts in message_stream:
+        # Filter by subscription first - messages are only encoded for subscribed channels
         if channel.subscribed_to(message.get("type")):
+            stream_lag = time.time() - ts
             # Log a warning if this channel is behind
             # on the message stream by a lot
-            if (time.time() - ts) > 60:
+            if stream_lag > 60:
                 logger.warning(
                     f"Channel {channel} is behind MessageStream by 1 minute,"
                     " this can cause a memory leak if you see this message"
@@ -58,7 +61,7 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
                     " consumers."
                 )
 
-            await channel.send(message, use_timeout=True)
+            await channel.send(message, use_timeout=True, stream_lag=stream_lag)
 
 
 async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
@@ -116,9 +119,10 @@ async def message_endpoint(
     token: str = Depends(validate_ws_token),
     rpc: RPC = Depends(get_rpc),
     message_stream: MessageStream = Depends(get_message_stream),
+    encoding: str = "json",
 ):
     if token:
-        async with create_channel(websocket) as channel:
+        async with create_channel(websocket, serializer_cls=get_ws_serializer(encoding)) as channel:
             await channel.run_channel_tasks(
                 channel_reader(channel, rpc), channel_broadcaster(channel, message_stream)
             )
@@ -0,0 +1,58 @@
+from typing import Any
+
+from fastapi import Request
+from pandas import DataFrame
+from starlette.responses import Response
+
+from freqtrade.rpc.api_server.api_schemas import CandleDataLayout, PairHistory
+from freqtrade.rpc.rpc import CandleLayout
+
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def candle_layout(request: Request, layout: CandleDataLayout) -> CandleLayout:
+    """
+    Layout to request candle data in - "dataframe" if the client accepts Arrow IPC streams
+    (and pyarrow is available), the requested JSON layout otherwise.
+    """
+    if pa is not None and ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+        return "dataframe"
+    return layout
+
+
+def candle_response(response: dict[str, Any]) -> Any:
+    """
+    Return the candle data response, encoded as Arrow IPC stream if it contains a DataFrame
+    """
+    if isinstance(response["data"], DataFrame):
+        return ArrowResponse(response)
+    return response
+
+
+class ArrowResponse(Response):
+    """
+    Candle data as Arrow IPC stream.
+    All other fields of the response are added as JSON to the schema metadata (key "freqtrade").
+    """
+
+    media_type = ARROW_STREAM_MEDIA_TYPE
+
+    def render(self, content: dict[str, Any]) -> bytes:
+        metadata = PairHistory.model_validate({**content, "data": []}).model_dump_json(
+            exclude={"data"}
+        )
+        table = pa.Table.from_pandas(content["data"], preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), b"freqtrade": metadata}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
@@ -1,13 +1,15 @@
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 from uuid import uuid4
 
 from fastapi import Depends, HTTPException
+from starlette.requests import HTTPConnection
 
 from freqtrade.constants import Config
 from freqtrade.enums import RunMode
 from freqtrade.persistence import Trade
-from freqtrade.persistence.models import _request_id_ctx_var
+from freqtrade.persistence.models import _read_only_ctx_var, _request_id_ctx_var
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.rpc.rpc import RPC, RPCException
 
@@ -20,17 +22,30 @@ def get_rpc_optional() -> RPC | None:
     return None
 
 
-async def get_rpc() -> AsyncIterator[RPC] | None:
+async def get_rpc(connection: HTTPConnection) -> AsyncIterator[RPC] | None:
     _rpc = get_rpc_optional()
     if _rpc:
-        request_id = str(uuid4())
-        ctx_token = _request_id_ctx_var.set(request_id)
-        Trade.rollback()
-        try:
-            yield _rpc
-        finally:
-            Trade.session.remove()
-            _request_id_ctx_var.reset(ctx_token)
+        limit: AbstractAsyncContextManager[None] = nullcontext()
+        read_only = False
+        if connection.scope["type"] == "http":
+            # Websocket connections are long-lived - and are therefore not limited.
+            method = connection.scope["method"]
+            route = connection.scope.get("route")
+            endpoint = f"{method} {getattr(route, 'path', connection.url.path)}"
+            limit = ApiServer._endpoint_limiter.limit(endpoint)
+            # Reading requests use the read engine (if configured)
+            read_only = method == "GET"
+        async with limit:
+            request_id = str(uuid4())
+            ctx_token = _request_id_ctx_var.set(request_id)
+            read_only_token = _read_only_ctx_var.set(read_only)
+            Trade.rollback()
+            try:
+                yield _rpc
+            finally:
+                Trade.session.remove()
+                _read_only_ctx_var.reset(read_only_token)
+                _request_id_ctx_var.reset(ctx_token)
 
     else:
         raise RPCException("Bot is not in the correct state")
@@ -61,6 +76,10 @@ def get_exchange(config=Depends(get_config)):
     return exchange
 
 
+def get_endpoint_limiter():
+    return ApiServer._endpoint_limiter
+
+
 def get_message_stream():
     return ApiServer._message_stream
 
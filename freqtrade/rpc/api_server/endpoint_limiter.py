@@ -0,0 +1,74 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    active: int = 0
+    waiting: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    total_wait: float = 0.0
+
+
+class EndpointLimiter:
+    """
+    Limits the number of concurrent requests per endpoint and keeps timing metrics.
+    Requests above the limit wait (in the event loop) for a free slot, so a burst of requests
+    to one endpoint can't occupy all worker threads and database connections.
+    Only used from the event loop - so no locking is necessary.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self._max_concurrent = max_concurrent
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, _EndpointStats] = {}
+
+    @asynccontextmanager
+    async def limit(self, endpoint: str) -> AsyncIterator[None]:
+        if endpoint not in self._semaphores:
+            self._semaphores[endpoint] = asyncio.Semaphore(self._max_concurrent)
+            self._stats[endpoint] = _EndpointStats()
+        semaphore = self._semaphores[endpoint]
+        stats = self._stats[endpoint]
+
+        queued = time.perf_counter()
+        stats.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+        start = time.perf_counter()
+        stats.total_wait += start - queued
+        stats.active += 1
+        try:
+            yield
+        finally:
+            semaphore.release()
+            duration = time.perf_counter() - start
+            stats.active -= 1
+            stats.requests += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Timing metrics per endpoint, in seconds
+        """
+        return {
+            endpoint: {
+                "requests": stats.requests,
+                "active": stats.active,
+                "waiting": stats.waiting,
+                "max_concurrent": self._max_concurrent,
+                "avg_time": stats.total_time / stats.requests if stats.requests else 0.0,
+                "max_time": stats.max_time,
+                "avg_wait": stats.total_wait / stats.requests if stats.requests else 0.0,
+            }
+            for endpoint, stats in self._stats.items()
+        }
@@ -11,9 +11,11 @@ from starlette.responses import JSONResponse
 from freqtrade.configuration import running_in_docker
 from freqtrade.constants import Config
 from freqtrade.exceptions import OperationalException
+from freqtrade.rpc.api_server.endpoint_limiter import EndpointLimiter
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import BroadcastMessage
 from freqtrade.rpc.rpc import RPC, RPCException, RPCHandler
 from freqtrade.rpc.rpc_types import RPCSendMsg
 
@@ -41,6 +43,7 @@ class ApiServer(RPCHandler):
     _config: Config = {}
     # websocket message stuff
     _message_stream: MessageStream | None = None
+    _endpoint_limiter: EndpointLimiter
 
     def __new__(cls, *args, **kwargs):
         """
@@ -62,6 +65,7 @@ class ApiServer(RPCHandler):
         ApiServer.__initialized = True
 
         api_config = self._config["api_server"]
+        ApiServer._endpoint_limiter = EndpointLimiter(api_config.get("max_concurrent_requests", 4))
 
         self.app = FastAPI(
             title="Freqtrade API",
@@ -107,7 +111,7 @@ class ApiServer(RPCHandler):
         Publish the message to the message stream
         """
         if ApiServer._message_stream:
-            ApiServer._message_stream.publish(msg)
+            ApiServer._message_stream.publish(BroadcastMessage(msg))
 
     def handle_rpc_exception(self, request, exc):
         logger.error(f"API Error calling: {exc}")
@@ -47,6 +47,10 @@ class WebSocketChannel:
         # High limit defaults to 3 to start
         self._send_high_limit = 3
         self._send_throttle = send_throttle
+        # Deque for the time broadcast messages waited in the MessageStream
+        self._stream_lags: deque[float] = deque([], maxlen=10)
+        self._messages_sent = 0
+        self._bytes_sent = 0
 
         # The subscribed message types
         self._subscriptions: list[str] = []
@@ -69,6 +73,24 @@ class WebSocketChannel:
     def avg_send_time(self):
         return sum(self._send_times) / len(self._send_times)
 
+    @property
+    def avg_stream_lag(self):
+        return sum(self._stream_lags) / len(self._stream_lags) if self._stream_lags else 0.0
+
+    @property
+    def send_stats(self) -> dict[str, float]:
+        """
+        Backpressure metrics of this channel
+        """
+        return {
+            "messages_sent": self._messages_sent,
+            "bytes_sent": self._bytes_sent,
+            "avg_send_time": self.avg_send_time if self._send_times else 0.0,
+            "send_high_limit": self._send_high_limit,
+            "avg_stream_lag": self.avg_stream_lag,
+            "max_stream_lag": max(self._stream_lags, default=0.0),
+        }
+
     def _calc_send_limit(self):
         """
         Calculate the send high limit for this channel
@@ -80,7 +102,12 @@ class WebSocketChannel:
             # maximum of 3 seconds per message
             self._send_high_limit = min(max(self.avg_send_time * 2, 1), 3)
 
-    async def send(self, message: WSMessageSchemaType | dict[str, Any], use_timeout: bool = False):
+    async def send(
+        self,
+        message: WSMessageSchemaType | dict[str, Any],
+        use_timeout: bool = False,
+        stream_lag: float | None = None,
+    ):
         """
         Send a message on the wrapped websocket. If the sending
         takes too long, it will raise a TimeoutError and
@@ -88,22 +115,30 @@ class WebSocketChannel:
 
         :param message: The message to send
         :param use_timeout: Enforce send high limit, defaults to False
+        :param stream_lag: Seconds the message waited in the MessageStream
         """
+        if stream_lag is not None:
+            self._stream_lags.append(stream_lag)
         try:
             _ = time.time()
+            encoded = self._wrapped_ws.serialize(message)
             # If the send times out, it will raise
             # a TimeoutError and bubble up to the
             # message_endpoint to close the connection
             await asyncio.wait_for(
-                self._wrapped_ws.send(message),
+                self._websocket.send(encoded),
                 timeout=self._send_high_limit if use_timeout else None,
             )
             total_time = time.time() - _
             self._send_times.append(total_time)
+            self._messages_sent += 1
+            self._bytes_sent += len(encoded)
 
             self._calc_send_limit()
         except TimeoutError:
-            logger.info(f"Connection for {self} timed out, disconnecting")
+            logger.info(
+                f"Connection for {self} timed out, disconnecting. Send stats: {self.send_stats}"
+            )
             raise
 
         # Explicitly give control back to event loop as
@@ -238,3 +273,4 @@ async def create_channel(websocket: WebSocketType, **kwargs) -> AsyncIterator[We
     finally:
         await channel.close()
         logger.info(f"Disconnected from channel - {channel}")
+        logger.debug(f"Send stats for {channel}: {channel.send_stats}")
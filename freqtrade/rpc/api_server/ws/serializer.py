@@ -1,10 +1,13 @@
 import logging
+import struct
 from abc import ABC, abstractmethod
+from itertools import compress
 from typing import Any
 
+import numpy as np
 import orjson
 import rapidjson
-from pandas import DataFrame
+from pandas import DataFrame, DatetimeIndex, DatetimeTZDtype, Index, RangeIndex, concat, isna
 
 from freqtrade.misc import dataframe_to_json, json_to_dataframe
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
@@ -13,6 +16,40 @@ from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
 logger = logging.getLogger(__name__)
 
+# Binary messages: magic, header length, JSON header, then length-prefixed column buffers
+_BINARY_MAGIC = b"FTB1"
+_HEADER_LEN = struct.Struct("<I")
+_BUFFER_LEN = struct.Struct("<Q")
+
+
+class BroadcastMessage(dict):
+    """
+    Message published to all channels of the MessageStream.
+    It is serialized once per encoding (and per connection state the encoding depends on),
+    all channels sending it share the encoded message.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._encoded: list[tuple[type, Any, str | bytes]] = []
+
+    def encode(self, serializer: "WebSocketSerializer") -> str | bytes:
+        """
+        Encoded message for the serializer, serialized only if no serializer
+        in the same state encoded it before.
+        """
+        serializer_cls = type(serializer)
+        state = serializer._encoding_state(self)
+        for encoded_cls, encoded_state, encoded in self._encoded:
+            if encoded_cls is serializer_cls and encoded_state is state:
+                serializer._mark_sent(self)
+                return encoded
+        encoded = serializer._serialize(self)
+        self._encoded.append((serializer_cls, state, encoded))
+        return encoded
+
 
 class WebSocketSerializer(ABC):
     def __init__(self, websocket: WebSocketProxy):
@@ -26,8 +63,29 @@ class WebSocketSerializer(ABC):
     def _deserialize(self, data):
         raise NotImplementedError()
 
+    def _encoding_state(self, data) -> Any:
+        """
+        State of this connection the serialized data depends on.
+        Serializers in the same state (compared by identity) produce the same encoding.
+        """
+        return None
+
+    def _mark_sent(self, data) -> None:
+        """
+        Update the connection state for data sent without serializing it again
+        """
+        return None
+
+    def serialize(self, data: WSMessageSchemaType | dict[str, Any]) -> str | bytes:
+        """
+        Serialize data - broadcast messages are only serialized once per encoding
+        """
+        if isinstance(data, BroadcastMessage):
+            return data.encode(self)
+        return self._serialize(data)
+
     async def send(self, data: WSMessageSchemaType | dict[str, Any]):
-        await self._websocket.send(self._serialize(data))
+        await self._websocket.send(self.serialize(data))
 
     async def recv(self) -> bytes:
         data = await self._websocket.recv()
@@ -38,11 +96,255 @@ class HybridJSONWebSocketSerializer(WebSocketSerializer):
     def _serialize(self, data) -> str:
         return str(orjson.dumps(data, default=_json_default), "utf-8")
 
-    def _deserialize(self, data: str):
-        # RapidJSON expects strings
+    def _deserialize(self, data: str | bytes):
+        # RapidJSON expects strings (or bytes)
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+class BinaryWebSocketSerializer(HybridJSONWebSocketSerializer):
+    """
+    Sends messages containing DataFrames as binary messages: a JSON header, followed by
+    the raw buffers of the numeric and date columns. Other messages are sent as JSON text -
+    so both sides understand each other's requests, even if only one side supports this.
+
+    Analyzed dataframes of a pair omit columns which are unchanged since the
+    last candle of the pair sent on this connection (delta frames).
+    The receiving side restores them from the last candle it received.
+    Connections which were sent the same last candle share the encoded broadcast messages.
+    """
+
+    def __init__(self, websocket: WebSocketProxy):
+        super().__init__(websocket)
+        self._sent_candles: dict[tuple, DataFrame] = {}
+        self._received_candles: dict[tuple, DataFrame] = {}
+
+    @staticmethod
+    def _candle_key(data) -> tuple | None:
+        """
+        Key of the pair, if data is a non-empty analyzed dataframe message
+        """
+        payload = data.get("data") if isinstance(data, dict) else None
+        if (
+            isinstance(payload, dict)
+            and "key" in payload
+            and isinstance(payload.get("df"), DataFrame)
+            and not payload["df"].empty
+        ):
+            return tuple(payload["key"])
+        return None
+
+    def _encoding_state(self, data) -> DataFrame | None:
+        key = self._candle_key(data)
+        return self._sent_candles.get(key) if key else None
+
+    def _mark_sent(self, data) -> None:
+        key = self._candle_key(data)
+        if key:
+            self._set_sent_candle(key, data["data"]["df"])
+
+    def _set_sent_candle(self, key: tuple, df: DataFrame) -> None:
+        # Single candles are kept as they are, so connections sent the same
+        # broadcast message can be matched by identity
+        self._sent_candles[key] = df if len(df) == 1 else df.tail(1)
+
+    def _serialize(self, data) -> str | bytes:  # type: ignore[override]
+        key = self._candle_key(data)
+        if key:
+            data = {**data, "data": self._delta_payload(key, data["data"])}
+
+        buffers: list[bytes] = []
+
+        def default(z):
+            if isinstance(z, DataFrame):
+                return dataframe_to_buffers(z, buffers)
+            return _json_default(z)
+
+        header = orjson.dumps(data, default=default)
+        if not buffers:
+            return str(header, "utf-8")
+        parts = [_BINARY_MAGIC, _HEADER_LEN.pack(len(header)), header]
+        for buffer in buffers:
+            parts.extend((_BUFFER_LEN.pack(len(buffer)), buffer))
+        return b"".join(parts)
+
+    def _deserialize(self, data: str | bytes):
+        header: str | bytes = data
+        buffers: list[memoryview] = []
+        if isinstance(data, bytes) and data.startswith(_BINARY_MAGIC):
+            view = memoryview(data)
+            offset = len(_BINARY_MAGIC)
+            (header_len,) = _HEADER_LEN.unpack_from(view, offset)
+            offset += _HEADER_LEN.size
+            header = bytes(view[offset : offset + header_len])
+            offset += header_len
+            while offset < len(view):
+                (buffer_len,) = _BUFFER_LEN.unpack_from(view, offset)
+                offset += _BUFFER_LEN.size
+                buffers.append(view[offset : offset + buffer_len])
+                offset += buffer_len
+
+        def object_hook(z):
+            if z.get("__type__") == "dataframe" and "__columns__" in z:
+                return buffers_to_dataframe(z, buffers)
+            return _json_object_hook(z)
+
+        message = rapidjson.loads(header, object_hook=object_hook)
+        payload = message.get("data") if isinstance(message, dict) else None
+        if isinstance(payload, dict) and isinstance(payload.get("df"), DataFrame):
+            self._restore_payload(payload)
+        return message
+
+    def _delta_payload(self, key: tuple, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Drop columns of the payload's dataframe which repeat the last candle sent for its key.
+        """
+        df: DataFrame = payload["df"]
+        last_candle = self._sent_candles.get(key)
+        self._set_sent_candle(key, df)
+        if last_candle is None:
+            return payload
+        repeated = _repeated_columns(df, last_candle)
+        if not repeated:
+            return payload
+        return {
+            **payload,
+            "df": df[[col for col in df.columns if col not in repeated]],
+            "__all_columns__": list(df.columns),
+        }
+
+    def _restore_payload(self, payload: dict[str, Any]) -> None:
+        """
+        Restore columns omitted by the sender from the last candle received for the key.
+        """
+        columns = payload.pop("__all_columns__", None)
+        df: DataFrame = payload["df"]
+        if "key" not in payload or df.empty:
+            return
+        key = tuple(payload["key"])
+        if columns is not None:
+            last_candle = self._received_candles[key]
+            missing = [col for col in columns if col not in df.columns]
+            repeated = last_candle.iloc[[-1] * len(df)][missing].set_axis(df.index)
+            df = concat([df, repeated], axis=1)[columns]
+            payload["df"] = df
+        self._received_candles[key] = df.tail(1)
+
+
+def _repeated_columns(df: DataFrame, last_candle: DataFrame) -> set[str]:
+    """
+    Columns of df, whose values all equal the value of the column in the last candle.
+    """
+    dtypes = df.dtypes
+    same_dtype = dtypes == last_candle.dtypes.reindex(dtypes.index)
+    common = dtypes.index[same_dtype].tolist()
+    floats = dtypes.index[same_dtype & (dtypes == np.float64)].tolist()
+    repeated: set[str] = set()
+    if floats:
+        values = df[floats].to_numpy()
+        last = last_candle[floats].to_numpy()[-1]
+        same = ((values == last) | (np.isnan(values) & np.isnan(last))).all(axis=0)
+        repeated.update(compress(floats, same))
+    for col in common:
+        if col in repeated or col in floats:
+            continue
+        last_value = last_candle[col].iat[-1]
+        if isna(last_value):
+            if df[col].isna().all():
+                repeated.add(col)
+        elif (df[col] == last_value).all():
+            repeated.add(col)
+    return repeated
+
+
+def dataframe_to_buffers(dataframe: DataFrame, buffers: list[bytes]) -> dict[str, Any]:
+    """
+    Serialize a DataFrame into a JSON header and raw buffers.
+    Numeric and boolean columns of the same dtype are sent as one buffer,
+    dates as int64 buffer - other columns as JSON values in the header.
+    :param buffers: List the buffers are appended to
+    :return: Header describing the DataFrame and the position of its buffers
+    """
+    index = dataframe.index
+    header: dict[str, Any] = {
+        "__type__": "dataframe",
+        "__columns__": dataframe.columns.tolist(),
+        "index": (
+            {"start": index.start, "stop": index.stop, "step": index.step}
+            if isinstance(index, RangeIndex)
+            else index.tolist()
+        ),
+        "blocks": [],
+        "dates": [],
+        "values": [],
+    }
+    groups: dict[str, list[int]] = {}
+    for pos, dtype in enumerate(dataframe.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            groups.setdefault(dtype.str, []).append(pos)
+        elif isinstance(dtype, DatetimeTZDtype) or (
+            isinstance(dtype, np.dtype) and dtype.kind == "M"
+        ):
+            values = dataframe.iloc[:, pos].values
+            header["dates"].append(
+                [pos, np.datetime_data(values.dtype)[0], str(getattr(dtype, "tz", "")) or None]
+            )
+            buffers.append(values.view(np.int64).tobytes())
+        else:
+            header["values"].append([pos, dataframe.iloc[:, pos].tolist()])
+    for dtype_str, positions in groups.items():
+        # Columns are stored as consecutive rows of the buffer
+        header["blocks"].append([dtype_str, positions])
+        buffers.append(dataframe.iloc[:, positions].to_numpy(dtype=dtype_str).T.tobytes())
+    return header
+
+
+def buffers_to_dataframe(header: dict[str, Any], buffers: list) -> DataFrame:
+    """
+    Deserialize a DataFrame from the header and buffers created by dataframe_to_buffers.
+    Buffers of the DataFrame follow each other, dates first.
+    """
+    index_spec = header["index"]
+    index = RangeIndex(**index_spec) if isinstance(index_spec, dict) else Index(index_spec)
+    # Columns are assembled by position, and named once all are in place
+    parts: list[DataFrame] = []
+    buffer_pos = 0
+    for position, unit, tz in header["dates"]:
+        values = np.frombuffer(buffers[buffer_pos], dtype=np.int64).view(f"M8[{unit}]")
+        buffer_pos += 1
+        dates = DatetimeIndex(values)
+        dates = dates.tz_localize("UTC").tz_convert(tz) if tz else dates
+        parts.append(DataFrame({position: dates}, index=index))
+    for dtype_str, positions in header["blocks"]:
+        values = np.frombuffer(buffers[buffer_pos], dtype=dtype_str)
+        buffer_pos += 1
+        parts.append(
+            DataFrame(values.reshape(len(positions), len(index)).T.copy(), index, positions)
+        )
+    if header["values"]:
+        parts.append(DataFrame(dict(header["values"]), index=index))
+    # Buffers of the following dataframe in the same message
+    del buffers[:buffer_pos]
+
+    names = header["__columns__"]
+    if not parts:
+        return DataFrame(index=index, columns=names)
+    df = concat(parts, axis=1) if len(parts) > 1 else parts[0]
+    return df.reindex(columns=range(len(names)), copy=False).set_axis(names, axis=1)
+
+
+WS_SERIALIZERS: dict[str, type[WebSocketSerializer]] = {
+    "json": HybridJSONWebSocketSerializer,
+    "binary": BinaryWebSocketSerializer,
+}
+
+
+def get_ws_serializer(encoding: str | None) -> type[WebSocketSerializer]:
+    """
+    Serializer for the requested message encoding - JSON for unknown encodings.
+    """
+    return WS_SERIALIZERS.get(encoding or "json", HybridJSONWebSocketSerializer)
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
@@ -21,6 +21,7 @@ from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import get_ws_serializer
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSAnalyzedDFRequest,
@@ -79,6 +80,10 @@ class ExternalMessageConsumer:
         # as the websockets client expects bytes.
         self.message_size_limit = self._emc_config.get("message_size_limit", 8) << 20
 
+        # Encoding requested for messages from producers.
+        # Producers not supporting it keep sending JSON, which is understood as well.
+        self.message_encoding = self._emc_config.get("message_encoding", "json")
+
         # Setting these explicitly as they probably shouldn't be changed by a user
         # Unless we somehow integrate this with the strategy to allow creating
         # callbacks for the messages
@@ -191,12 +196,19 @@ class ExternalMessageConsumer:
                 name = producer["name"]
                 scheme = "wss" if producer.get("secure", False) else "ws"
                 ws_url = f"{scheme}://{host}:{port}/api/v1/message/ws?token={token}"
+                if self.message_encoding != "json":
+                    ws_url += f"&encoding={self.message_encoding}"
 
                 # This will raise InvalidURI if the url is bad
                 async with websockets.connect(
                     ws_url, max_size=self.message_size_limit, ping_interval=None
                 ) as ws:
-                    async with create_channel(ws, channel_id=name, send_throttle=0.5) as channel:
+                    async with create_channel(
+                        ws,
+                        channel_id=name,
+                        send_throttle=0.5,
+                        serializer_cls=get_ws_serializer(self.message_encoding),
+                    ) as channel:
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
 
@@ -6,14 +6,16 @@ import logging
 from abc import abstractmethod
 from collections.abc import Generator, Sequence
 from datetime import UTC, date, datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from math import isinf
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
-from pandas import DataFrame, NaT
-from sqlalchemy import func, select
+from numpy import isnan, nan, nan_to_num, timedelta64
+from pandas import DataFrame, Series
+from sqlalchemy import ColumnElement, func, select
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
@@ -34,7 +36,14 @@ from freqtrade.exchange import Exchange, timeframe_to_minutes, timeframe_to_msec
 from freqtrade.exchange.exchange_utils import price_to_precision
 from freqtrade.ft_types import AnnotationType
 from freqtrade.loggers import bufferHandler
-from freqtrade.persistence import CustomDataWrapper, KeyValueStore, Order, PairLocks, Trade
+from freqtrade.persistence import (
+    ClosedTradeStatistics,
+    CustomDataWrapper,
+    KeyValueStore,
+    Order,
+    PairLocks,
+    Trade,
+)
 from freqtrade.persistence.models import PairLock, custom_data_rpc_wrapper
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
@@ -54,6 +63,8 @@ from freqtrade.wallets import PositionWallet, Wallet
 
 logger = logging.getLogger(__name__)
 
+CandleLayout = Literal["rows", "columns", "dataframe"]
+
 
 class RPCException(Exception):
     """
@@ -119,6 +130,7 @@ class RPC:
         """
         self._freqtrade = freqtrade
         self._config: Config = freqtrade.config
+        self._closed_trade_stats = ClosedTradeStatistics()
         if self._config.get("fiat_display_currency"):
             self._fiat_converter = CryptoToFiatConverter(self._config)
 
@@ -404,33 +416,21 @@ class RPC:
         profit_units: dict[date, dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            stmt = (
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-            )
-            try:
-                trades = Trade.session.execute(stmt).all()
-            finally:
-                Trade.session.remove()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+        periods = [
+            (start_date - time_offset(step), start_date - time_offset(step) + time_offset(1))
+            for step in range(0, timescale)
+        ]
+        period_profits = self._closed_trade_stats.period_profits(periods)
+        for (profitday, _), (curdayprofit, trade_count) in zip(
+            periods, period_profits, strict=True
+        ):
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": trade_count,
             }
 
         data = [
@@ -492,39 +492,7 @@ class RPC:
         """
         Generate generic stats for trades in database
         """
-
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
-                return "wins"
-            elif trade.close_profit < 0:
-                return "losses"
-            else:
-                return "draws"
-
-        result = Trade.get_trades([Trade.is_open.is_(False)])
-        try:
-            trades = result.all()
-            # Duration
-            dur: dict[str, list[float]] = {"wins": [], "draws": [], "losses": []}
-            # Exit reason
-            exit_reasons = {}
-            for trade in trades:
-                if trade.exit_reason not in exit_reasons:
-                    exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-                exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-                if trade.close_date is not None and trade.open_date is not None:
-                    trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                    dur[trade_win_loss(trade)].append(trade_dur)
-
-            wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
-            draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
-            losses_dur = sum(dur["losses"]) / len(dur["losses"]) if len(dur["losses"]) > 0 else None
-
-            durations = {"wins": wins_dur, "draws": draws_dur, "losses": losses_dur}
-            return {"exit_reasons": exit_reasons, "durations": durations}
-        finally:
-            Trade.session.remove()
+        return self._closed_trade_stats.outcome_stats()
 
     def _collect_trade_statistics_data(
         self,
@@ -603,12 +571,11 @@ class RPC:
         """
         Returns cumulative profit statistics, with optional direction filter (long/short)
         """
+        # Closed trades are served from the trade statistics, only open trades are priced
+        closed = self._closed_trade_stats.closed_trades(start_date, direction)
         start_date = datetime.fromtimestamp(0) if start_date is None else start_date
 
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
-
+        trade_filter: ColumnElement[bool] = Trade.is_open.is_(True)
         if direction == "long":
             dir_filter = Trade.is_short.is_(False)
             trade_filter = trade_filter & dir_filter
@@ -617,27 +584,25 @@ class RPC:
             trade_filter = trade_filter & dir_filter
 
         query = Trade.get_trades_query(trade_filter, include_orders=True).order_by(Trade.id)
-        trades: Sequence[Trade] = []
+        open_trades: Sequence[Trade] = []
         stats: dict[str, Any] = {}
         try:
-            trades = Trade.session.scalars(query).all()
+            open_trades = Trade.session.scalars(query).all()
             stats = self._collect_trade_statistics_data(
-                trades, stake_currency, fiat_display_currency
+                open_trades, stake_currency, fiat_display_currency
             )
         finally:
             Trade.session.remove()
 
-        profit_all_coin = stats["profit_all_coin"]
-        profit_all_ratio = stats["profit_all_ratio"]
-        profit_closed_coin = stats["profit_closed_coin"]
-        profit_closed_ratio = stats["profit_closed_ratio"]
-        durations = stats["durations"]
-        winning_trades = stats["winning_trades"]
-        losing_trades = stats["losing_trades"]
-        winning_profit = stats["winning_profit"]
-        losing_profit = stats["losing_profit"]
-
-        closed_trade_count = len([t for t in trades if not t.is_open])
+        profit_closed_coin = nan_to_num(closed["profit_abs"])
+        profit_closed_ratio = nan_to_num(closed["profit_ratios"])
+        closed_trade_count = len(closed["ids"])
+        winning = profit_closed_ratio >= 0
+        winning_trades = int(winning.sum())
+        losing_trades = closed_trade_count - winning_trades
+        winning_profit = float(profit_closed_coin[winning].sum())
+        losing_profit = float(profit_closed_coin[~winning].sum())
+        durations = (closed["close_dates"] - closed["open_dates"]) / timedelta64(1, "s")
 
         best_pair_filters = [Trade.close_date > start_date]
         trading_volume_filters = [Order.order_filled_date >= start_date]
@@ -650,9 +615,11 @@ class RPC:
         trading_volume = Trade.get_trading_volume(trading_volume_filters)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(float(profit_closed_coin.sum()), 8)
+        profit_closed_ratio_sum = float(profit_closed_ratio.sum())
+        profit_closed_ratio_mean = (
+            profit_closed_ratio_sum / closed_trade_count if closed_trade_count else 0.0
+        )
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -662,10 +629,13 @@ class RPC:
             else 0
         )
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_coin_sum = round(
+            float(profit_closed_coin.sum()) + sum(stats["profit_all_coin"]), 8
+        )
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(stats["profit_all_ratio"])
+        profit_all_count = closed_trade_count + len(stats["profit_all_ratio"])
+        profit_all_ratio_mean = profit_all_ratio_sum / profit_all_count if profit_all_count else 0.0
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0.0
         profit_all_ratio_fromstart = 0.0
@@ -678,15 +648,7 @@ class RPC:
         winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
         trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
+            {"close_date_dt": closed["close_dates"], "profit_abs": closed["profit_abs"]}
         )
 
         expectancy, expectancy_ratio = calculate_expectancy(trades_df)
@@ -712,9 +674,20 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
-        num = float(len(durations) or 1)
+        # Trades are ordered by id - the first and last trade is either closed or open
+        trade_dates = []
+        if closed_trade_count:
+            for pos in (0, -1):
+                open_date = closed["open_dates"][pos].astype(datetime).replace(tzinfo=UTC)
+                trade_dates.append((int(closed["ids"][pos]), open_date))
+        if open_trades:
+            trade_dates.extend(
+                (trade.id, trade.open_date_utc) for trade in (open_trades[0], open_trades[-1])
+            )
+        first_date = min(trade_dates)[1] if trade_dates else None
+        last_date = max(trade_dates)[1] if trade_dates else None
+        durations_sum = float(durations.sum()) + sum(stats["durations"])
+        num = float((len(durations) + len(stats["durations"])) or 1)
         bot_start = KeyValueStore.get_datetime_value("bot_start_time")
         return {
             "profit_closed_coin": profit_closed_coin_sum,
@@ -733,7 +706,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": closed_trade_count + len(open_trades),
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -741,7 +714,7 @@ class RPC:
             "latest_trade_date": format_date(last_date),
             "latest_trade_humanized": dt_humanize_delta(last_date) if last_date else "",
             "latest_trade_timestamp": dt_ts_def(last_date, 0),
-            "avg_duration": str(timedelta(seconds=sum(durations) / num)).split(".")[0],
+            "avg_duration": str(timedelta(seconds=durations_sum / num)).split(".")[0],
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
@@ -1461,6 +1434,31 @@ class RPC:
 
         return {"log_count": len(records), "logs": records}
 
+    @staticmethod
+    def _column_to_list(column: Series) -> list[Any]:
+        """
+        Convert a dataframe column to a JSON compatible list.
+        NaN, inf and NaT values are replaced with None.
+        """
+        dtype = column.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+            return column.tolist()
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            array = column.to_numpy()
+            invalid = ~np.isfinite(array)
+        else:
+            # Datetimes as Timestamp objects, like other object columns
+            array = column.to_numpy(dtype=object)
+            invalid = column.isna().to_numpy()
+            if dtype == np.dtype(object):
+                invalid |= np.fromiter(
+                    (isinstance(val, float) and isinf(val) for val in array), bool, len(array)
+                )
+        values = array.tolist()
+        for idx in np.flatnonzero(invalid).tolist():
+            values[idx] = None
+        return values
+
     @staticmethod
     def _convert_dataframe_to_dict(
         strategy: str,
@@ -1470,8 +1468,16 @@ class RPC:
         last_analyzed: datetime,
         selected_cols: list[str] | None,
         annotations: list[AnnotationType],
+        since_ts: int | None = None,
+        layout: CandleLayout = "rows",
     ) -> dict[str, Any]:
-        has_content = len(dataframe) != 0
+        """
+        Convert an analyzed dataframe to its API response.
+        The dataframe is not modified - columns and candles are selected before conversion.
+        :param since_ts: Only return candles newer than this timestamp (in ms)
+        :param layout: "rows" for a list of candles, "columns" for a dict of column lists,
+            "dataframe" to return the selected columns as DataFrame
+        """
         dataframe_columns = list(dataframe.columns)
         signals = {
             "enter_long": 0,
@@ -1479,30 +1485,41 @@ class RPC:
             "enter_short": 0,
             "exit_short": 0,
         }
-        if has_content:
-            if selected_cols is not None:
-                # Ensure OHLCV columns are always present
-                cols_set = set(DEFAULT_DATAFRAME_COLUMNS + list(signals.keys()) + selected_cols)
-                df_cols = [col for col in dataframe_columns if col in cols_set]
-                dataframe = dataframe.loc[:, df_cols]
+        date_ts = np.empty(0, dtype=np.int64)
+        if len(dataframe) != 0:
+            date_ts = dataframe["date"].to_numpy(dtype="datetime64[ms]").view(np.int64)
+            if since_ts is not None:
+                newer = date_ts > since_ts
+                dataframe = dataframe.loc[newer]
+                date_ts = date_ts[newer]
+        has_content = len(dataframe) != 0
 
-            dataframe.loc[:, "__date_ts"] = dataframe.loc[:, "date"].astype(int64) // 1000 // 1000
+        columns = dataframe_columns
+        if selected_cols is not None:
+            # Ensure OHLCV columns are always present
+            cols_set = set(DEFAULT_DATAFRAME_COLUMNS + list(signals.keys()) + selected_cols)
+            columns = [col for col in dataframe_columns if col in cols_set]
+        arrays: dict[str, Any] = {}
+        if has_content:
+            arrays = {col: dataframe[col] for col in columns}
+            arrays["__date_ts"] = Series(date_ts, index=dataframe.index)
             # Move signal close to separate column when signal for easy plotting
             for sig_type in signals.keys():
-                if sig_type in dataframe.columns:
-                    mask = dataframe[sig_type] == 1
+                if sig_type in arrays:
+                    mask = (dataframe[sig_type] == 1).to_numpy()
                     signals[sig_type] = int(mask.sum())
-                    dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
-
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
+                    arrays[f"_{sig_type}_signal_close"] = dataframe["close"].where(mask)
+            columns = list(arrays.keys())
 
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+        data: Any
+        if layout == "dataframe":
+            data = DataFrame(arrays, index=dataframe.index if has_content else None)
+        else:
+            column_lists = [RPC._column_to_list(array) for array in arrays.values()]
+            if layout == "columns":
+                data = dict(zip(columns, column_lists, strict=True))
+            else:
+                data = [list(row) for row in zip(*column_lists, strict=True)]
 
         res = {
             "pair": pair,
@@ -1510,8 +1527,8 @@ class RPC:
             "timeframe_ms": timeframe_to_msecs(timeframe),
             "strategy": strategy,
             "all_columns": dataframe_columns,
-            "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
+            "columns": columns,
+            "data": data,
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1530,16 +1547,22 @@ class RPC:
         if has_content:
             res.update(
                 {
-                    "data_start": str(dataframe.iloc[0]["date"]),
-                    "data_start_ts": int(dataframe.iloc[0]["__date_ts"]),
-                    "data_stop": str(dataframe.iloc[-1]["date"]),
-                    "data_stop_ts": int(dataframe.iloc[-1]["__date_ts"]),
+                    "data_start": str(dataframe["date"].iloc[0]),
+                    "data_start_ts": int(date_ts[0]),
+                    "data_stop": str(dataframe["date"].iloc[-1]),
+                    "data_stop_ts": int(date_ts[-1]),
                 }
             )
         return res
 
     def _rpc_analysed_dataframe(
-        self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        since_ts: int | None = None,
+        layout: CandleLayout = "rows",
     ) -> dict[str, Any]:
         """Analyzed dataframe in Dict form"""
 
@@ -1554,6 +1577,8 @@ class RPC:
             last_analyzed,
             selected_cols,
             annotations,
+            since_ts=since_ts,
+            layout=layout,
         )
 
     def __rpc_analysed_dataframe_raw(
@@ -1567,12 +1592,11 @@ class RPC:
         :param limit: The amount of candles in the dataframe
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
-        _data = _data.copy()
 
         if limit:
             _data = _data.iloc[-limit:]
 
-        return _data, last_analyzed
+        return _data.copy(), last_analyzed
 
     def _ws_all_analysed_dataframes(
         self, pairlist: list[str], limit: int | None
@@ -1613,6 +1637,8 @@ class RPC:
         exchange: Exchange,
         selected_cols: list[str] | None,
         live: bool,
+        since_ts: int | None = None,
+        layout: CandleLayout = "rows",
     ) -> dict[str, Any]:
         """
         Analyzed dataframe in Dict form, with full history loading and strategy analysis.
@@ -1679,10 +1705,12 @@ class RPC:
                 strategy_name,
                 pair,
                 timeframe,
-                df_analyzed.copy(),
+                df_analyzed,
                 dt_now(),
                 selected_cols,
                 annotations,
+                since_ts=since_ts,
+                layout=layout,
             )
 
     def _rpc_plot_config(self) -> dict[str, Any]:
@@ -9,12 +9,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
-from pandas import DataFrame
+from pandas import DataFrame, concat
 from pydantic import ValidationError
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
-from freqtrade.data.converter import populate_dataframe_with_trades
+from freqtrade.data.converter import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
@@ -31,7 +31,7 @@ from freqtrade.enums import (
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, timeframe_to_seconds
 from freqtrade.ft_types import AnnotationType
-from freqtrade.misc import remove_entry_exit_signals
+from freqtrade.misc import get_dataframe_differences, remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
 from freqtrade.strategy.informative_decorator import (
@@ -40,6 +40,7 @@ from freqtrade.strategy.informative_decorator import (
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
+from freqtrade.strategy.process_analysis import AnalysisProcessPool
 from freqtrade.strategy.strategy_validation import StrategyResultValidator
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now, dt_ts
@@ -127,6 +128,15 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Count of candles the strategy requires before producing valid signals
     startup_candle_count: int = 0
 
+    # Backtesting: skip candles without entry signal or open trade.
+    # bot_loop_start() is then only called for candles that are evaluated.
+    backtest_skip_idle_candles: bool = False
+
+    # Dry/live: analyze only new candles, plus this many prior candles as warm-up (0 disables).
+    incremental_analysis_candles: int = 0
+    # Verify incremental analysis against a full analysis every N new candles (0 disables).
+    incremental_analysis_verify_interval: int = 0
+
     # Protections
     protections: list = []
 
@@ -148,12 +158,17 @@ class IStrategy(ABC, HyperStrategyMixin):
     market_direction: MarketDirection = MarketDirection.NONE
 
     # Global cache dictionary
-    _cached_grouped_trades_per_pair: dict[str, DataFrame] = {}
+    _cached_grouped_trades_per_pair: dict[str, OrderflowCache | None] = {}
 
     def __init__(self, config: Config) -> None:
         self.config = config
         # Dict to determine if analysis is necessary
         self.__last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Previous analyzed dataframe and analysis count per pair (incremental analysis)
+        self.__incremental_analyzed: dict[str, DataFrame] = {}
+        self.__incremental_count: dict[str, int] = {}
+        # Worker processes for process based analysis - started on first use
+        self._analysis_pool: AnalysisProcessPool | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -221,9 +236,12 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     def ft_bot_cleanup(self) -> None:
         """
-        Clean up FreqAI and child threads
+        Clean up FreqAI, child threads and analysis worker processes
         """
         self.freqai.shutdown()
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown()
+            self._analysis_pool = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -289,6 +307,27 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         pass
 
+    def analysis_worker_state(self, **kwargs) -> dict:
+        """
+        Only used with process based analysis (`strategy_process_workers`).
+        Called in the main process before each analysis round.
+        The returned dict (must be picklable) is passed to load_analysis_worker_state()
+        in the worker processes before they analyze a pair.
+        :param **kwargs: Ensure to keep this here so updates to this won't break your strategy.
+        :return: State to transfer to the worker processes
+        """
+        return {}
+
+    def load_analysis_worker_state(self, state: dict, **kwargs) -> None:
+        """
+        Only used with process based analysis (`strategy_process_workers`).
+        Called in the worker processes with the result of analysis_worker_state(),
+        before populate_indicators() is called for a pair.
+        :param state: State as returned by analysis_worker_state() in the main process
+        :param **kwargs: Ensure to keep this here so updates to this won't break your strategy.
+        """
+        pass
+
     def check_buy_timeout(
         self, pair: str, trade: Trade, order: Order, current_time: datetime, **kwargs
     ) -> bool:
@@ -1199,6 +1238,100 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
+    def _analyze_ticker_incremental(
+        self, dataframe: DataFrame, metadata: dict, new_candle: bool
+    ) -> DataFrame:
+        """
+        Analyze only new candles (plus `incremental_analysis_candles` warm-up candles),
+        and append them to the previously analyzed dataframe.
+        Falls back to a full analysis if the previous analysis can't be extended.
+        Every `incremental_analysis_verify_interval` new candles, a full analysis is compared
+        to the incremental result (ignoring the first `startup_candle_count` candles).
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :param new_candle: True if the dataframe contains a new candle
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        pair = str(metadata.get("pair"))
+        previous = self.__incremental_analyzed.get(pair)
+        result = None
+        if previous is not None and new_candle:
+            result = self._extend_analyzed_dataframe(previous, dataframe, metadata)
+
+        if result is None:
+            result = self.analyze_ticker(dataframe, metadata)
+            self.__incremental_count[pair] = 0
+        elif self.incremental_analysis_verify_interval > 0:
+            count = self.__incremental_count.get(pair, 0) + 1
+            self.__incremental_count[pair] = count
+            if count >= self.incremental_analysis_verify_interval:
+                full_result = self.analyze_ticker(dataframe, metadata)
+                # Startup candles of a full analysis are incomplete - they don't count.
+                startup = self.startup_candle_count
+                if differences := get_dataframe_differences(
+                    full_result.iloc[startup:], result.iloc[startup:]
+                ):
+                    logger.warning(
+                        f"Incremental analysis for {pair} differs from full analysis "
+                        f"in columns {differences}. "
+                        "Please increase `incremental_analysis_candles`."
+                    )
+                result = full_result
+                self.__incremental_count[pair] = 0
+
+        self.__incremental_analyzed[pair] = result
+        return result
+
+    def _extend_analyzed_dataframe(
+        self, previous: DataFrame, dataframe: DataFrame, metadata: dict
+    ) -> DataFrame | None:
+        """
+        Extend the previously analyzed dataframe by the new candles in dataframe.
+        :return: Analyzed dataframe aligned to dataframe - or None if a full analysis is required.
+        """
+        warmup = self.incremental_analysis_candles
+        dates = dataframe["date"]
+        last_date = previous["date"].iloc[-1]
+        # Position of the last previously analyzed candle in the new dataframe
+        last_idx = int(dates.searchsorted(last_date))
+        if last_idx >= len(dates) or dates.iloc[last_idx] != last_date:
+            return None
+        new_count = len(dates) - last_idx - 1
+        if new_count > warmup:
+            return None
+
+        # Candles within the warm-up period must not have changed (e.g. refreshed data).
+        overlap = min(warmup, last_idx + 1, len(previous))
+        columns = ["date", "open", "high", "low", "close", "volume"]
+        if not (
+            dataframe[columns].iloc[last_idx + 1 - overlap : last_idx + 1].to_numpy()
+            == previous[columns].iloc[-overlap:].to_numpy()
+        ).all():
+            return None
+
+        window = dataframe.iloc[max(0, len(dataframe) - new_count - warmup) :].copy()
+        analyzed = self.analyze_ticker(window, metadata)
+        result = concat(
+            [
+                previous.loc[previous["date"] >= dates.iloc[0]],
+                analyzed.iloc[len(analyzed) - new_count :],
+            ]
+        )
+        if len(result) != len(dataframe):
+            return None
+        result.index = dataframe.index
+        return result
+
+    def _set_analyzed_dataframe(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to consumers.
+        """
+        self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
+
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -1215,13 +1348,12 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
-
-            self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
+            if self.incremental_analysis_candles > 0:
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata, new_candle)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._set_analyzed_dataframe(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1271,6 +1403,10 @@ class IStrategy(ABC, HyperStrategyMixin):
         if not pairs:
             return
 
+        if self.config.get("strategy_process_workers", 0) > 0:
+            self._analyze_in_processes(pairs)
+            return
+
         max_workers = self.config.get("strategy_thread_workers")
         enable_threading = self.config.get("strategy_threading", True)
         if not isinstance(max_workers, int) or max_workers <= 0:
@@ -1291,6 +1427,50 @@ class IStrategy(ABC, HyperStrategyMixin):
                 except Exception as exc:
                     logger.error("Unable to analyze pair %s: %s", pair, exc, exc_info=True)
 
+    def _analyze_in_processes(self, pairs: list[str]) -> None:
+        """
+        Analyze pairs in worker processes (`strategy_process_workers`).
+        Results are stored in the order of pairs - independent of worker completion order.
+        :param pairs: List of pairs to analyze
+        """
+        if self._analysis_pool is None:
+            self._analysis_pool = AnalysisProcessPool(
+                self.config, self.config["strategy_process_workers"]
+            )
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        to_analyze: list[tuple[str, DataFrame, bool]] = []
+        for pair in pairs:
+            dataframe = self.dp.ohlcv(pair, self.timeframe, candle_type=candle_type)
+            if not isinstance(dataframe, DataFrame) or dataframe.empty:
+                logger.warning("Empty candle (OHLCV) data for pair %s", pair)
+                continue
+            new_candle = (
+                self.__last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]["date"]
+            )
+            if not self.process_only_new_candles or new_candle:
+                to_analyze.append((pair, dataframe, new_candle))
+            else:
+                logger.debug("Skipping TA Analysis for already analyzed candle")
+
+        if not to_analyze:
+            return
+        results = self._analysis_pool.analyze(self, [pair for pair, _, _ in to_analyze])
+        for pair, dataframe, new_candle in to_analyze:
+            analyzed = results[pair]
+            try:
+                if not isinstance(analyzed, DataFrame):
+                    raise StrategyError(str(analyzed))
+                StrategyResultValidator(
+                    dataframe, warn_only=not self.disable_dataframe_checks
+                ).assert_df(analyzed)
+            except StrategyError as error:
+                logger.warning(f"Unable to analyze candle (OHLCV) data for pair {pair}: {error}")
+                continue
+            if analyzed.empty:
+                logger.warning("Empty dataframe for pair %s", pair)
+                continue
+            self._set_analyzed_dataframe(pair, analyzed, new_candle)
+
     def get_latest_candle(
         self,
         pair: str,
@@ -1799,15 +1979,10 @@ class IStrategy(ABC, HyperStrategyMixin):
 
             trades = self.dp.trades(pair=pair, copy=False, timerange=timerange)
 
-            cached_grouped_trades: DataFrame | None = self._cached_grouped_trades_per_pair.get(pair)
-            dataframe, cached_grouped_trades = populate_dataframe_with_trades(
-                cached_grouped_trades, self.config, dataframe, trades
+            dataframe, orderflow_cache = populate_dataframe_with_trades(
+                self._cached_grouped_trades_per_pair.get(pair), self.config, dataframe, trades
             )
-
-            # dereference old cache
-            if pair in self._cached_grouped_trades_per_pair:
-                del self._cached_grouped_trades_per_pair[pair]
-            self._cached_grouped_trades_per_pair[pair] = cached_grouped_trades
+            self._cached_grouped_trades_per_pair[pair] = orderflow_cache
 
             logger.debug("Populated dataframe with trades.")
         return dataframe
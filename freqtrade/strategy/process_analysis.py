@@ -0,0 +1,183 @@
+"""
+Process based pair analysis (``strategy_process_workers``).
+Candle data is placed in shared memory once per analysis round, long-lived worker processes
+hold their own copy of the strategy and analyze one pair per task.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from pandas import DataFrame
+
+from freqtrade.constants import Config, ListPairsWithTimeframes, PairWithTimeframe
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.shared_store import SharedDataStore
+from freqtrade.enums import CandleType
+from freqtrade.exceptions import OperationalException
+from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+
+
+if TYPE_CHECKING:
+    from freqtrade.strategy.interface import IStrategy
+
+logger = logging.getLogger(__name__)
+
+# Strategy instance of the worker process - set by _init_worker.
+_worker_strategy: "IStrategy | None" = None
+
+
+class WorkerDataProvider(DataProvider):
+    """
+    DataProvider for analysis worker processes.
+    Serves candles from the shared memory store of the current analysis round -
+    there is no exchange connection in worker processes.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        data_spec: dict[str, Any],
+        markets: dict[str, dict[str, Any] | None],
+        whitelist: list[str],
+    ) -> None:
+        super().__init__(config, None)
+        self._store = SharedDataStore.attach(data_spec)
+        self._candles: dict[PairWithTimeframe, DataFrame] = {}
+        self._markets = markets
+        self._whitelist = whitelist
+
+    def close(self) -> None:
+        self._store.close()
+
+    @property
+    def available_pairs(self) -> ListPairsWithTimeframes:
+        return list(self._store.spec["keys"])
+
+    def ohlcv(
+        self, pair: str, timeframe: str | None = None, copy: bool = True, candle_type: str = ""
+    ) -> DataFrame:
+        _candle_type = (
+            CandleType.from_string(candle_type)
+            if candle_type != ""
+            else self._config["candle_type_def"]
+        )
+        key = (pair, timeframe or self._config["timeframe"], _candle_type)
+        if key not in self._candles:
+            if key not in self._store.spec["keys"]:
+                return DataFrame()
+            self._candles[key] = self._store.to_dataframe(key)
+        return self._candles[key].copy() if copy else self._candles[key]
+
+    def current_whitelist(self) -> list[str]:
+        return self._whitelist.copy()
+
+    def market(self, pair: str) -> dict[str, Any] | None:
+        return self._markets.get(pair)
+
+    def ticker(self, pair: str):
+        raise OperationalException("Ticker data is not available in analysis worker processes.")
+
+    def orderbook(self, pair: str, maximum: int):
+        raise OperationalException("Orderbooks are not available in analysis worker processes.")
+
+
+def _init_worker(config: Config) -> None:
+    """
+    Initialize the strategy once per worker process.
+    bot_start() is not called - state is transferred with analysis_worker_state().
+    """
+    # Import here to avoid circular imports (the resolver imports IStrategy).
+    from freqtrade.resolvers import StrategyResolver
+
+    global _worker_strategy
+    strategy = StrategyResolver.load_strategy(config)
+    strategy.ft_load_hyper_params()
+    _worker_strategy = strategy
+
+
+def _analyze_pair_worker(
+    data_spec: dict[str, Any], context: dict[str, Any], pair: str, timeframe: str
+) -> DataFrame:
+    """
+    Analyze one pair in a worker process.
+    """
+    strategy = _worker_strategy
+    if strategy is None:
+        raise OperationalException("Analysis worker was not initialized.")
+    dp = WorkerDataProvider(strategy.config, data_spec, context["markets"], context["whitelist"])
+    try:
+        strategy.dp = dp
+        strategy_safe_wrapper(strategy.load_analysis_worker_state, supress_error=True)(
+            context["state"]
+        )
+        dataframe = dp.ohlcv(pair, timeframe, copy=False)
+        return strategy_safe_wrapper(strategy.analyze_ticker, message="")(dataframe, {"pair": pair})
+    finally:
+        dp.close()
+
+
+class AnalysisProcessPool:
+    """
+    Pool of long-lived worker processes analyzing pairs for the strategy.
+    """
+
+    def __init__(self, config: Config, workers: int) -> None:
+        if config.get("freqai", {}).get("enabled", False):
+            raise OperationalException("`strategy_process_workers` is not supported with FreqAI.")
+        logger.info(f"Starting {workers} strategy analysis worker processes.")
+        # Spawn - forking the bot (with running threads and event loops) is not safe.
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config,),
+        )
+
+    def analyze(
+        self, strategy: "IStrategy", pairs: list[str]
+    ) -> dict[str, DataFrame | BaseException]:
+        """
+        Analyze pairs in the worker processes.
+        All candles currently available in the dataprovider are shared with the workers,
+        so informative pairs work as usual.
+        :param strategy: Strategy of the main process, providing data and worker state
+        :param pairs: Pairs to analyze (in the strategy timeframe)
+        :return: Analyzed dataframe (or the exception raised during analysis) per pair
+        """
+        dp = strategy.dp
+        candles = {
+            key: dp.ohlcv(key[0], key[1], copy=False, candle_type=key[2])
+            for key in dp.available_pairs
+        }
+        try:
+            whitelist = dp.current_whitelist()
+        except OperationalException:
+            whitelist = list(pairs)
+        context = {
+            "markets": {pair: dp.market(pair) for pair in {*whitelist, *(k[0] for k in candles)}},
+            "whitelist": whitelist,
+            "state": strategy_safe_wrapper(strategy.analysis_worker_state, default_retval={})(),
+        }
+
+        store = SharedDataStore.create(candles)
+        results: dict[str, DataFrame | BaseException] = {}
+        try:
+            futures: dict[str, Future] = {
+                pair: self._executor.submit(
+                    _analyze_pair_worker, store.spec, context, pair, strategy.timeframe
+                )
+                for pair in pairs
+            }
+            for pair, future in futures.items():
+                try:
+                    results[pair] = future.result()
+                except Exception as e:
+                    results[pair] = e
+        finally:
+            store.unlink()
+        return results
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -454,13 +454,14 @@ class FtRestClient:
             },
         )
 
-    def pair_candles(self, pair, timeframe, limit=None, columns=None):
+    def pair_candles(self, pair, timeframe, limit=None, columns=None, since_ts=None):
         """Return live dataframe for <pair><timeframe>.
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param limit: Limit result to the last n candles.
         :param columns: List of dataframe columns to return. Empty list will return OHLCV.
+        :param since_ts: Only return candles newer than this timestamp (in ms).
         :return: json object
         """
         params = {
@@ -469,6 +470,8 @@ class FtRestClient:
         }
         if limit:
             params["limit"] = limit
+        if since_ts is not None:
+            params["since_ts"] = since_ts
 
         if columns is not None:
             params["columns"] = columns
@@ -510,3 +513,10 @@ class FtRestClient:
         :return: json object
         """
         return self._get("health")
+
+    def request_stats(self):
+        """Provides request timing metrics per API endpoint.
+
+        :return: json object
+        """
+        return self._get("request_stats")
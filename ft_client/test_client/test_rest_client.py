@@ -126,6 +126,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("pair_candles", ["XRP/USDT", "5m"], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {"columns": ["close_time,close"]}),
+        ("pair_candles", ["XRP/USDT", "5m"], {"since_ts": 1511686200000}),
         ("pair_history", ["XRP/USDT", "5m", "SampleStrategy"], {}),
         ("pair_history", ["XRP/USDT", "5m"], {"strategy": "SampleStrategy"}),
         ("trades", [], {"order_by_id": True}),
@@ -134,6 +135,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("trades", [5, 5], {"order_by_id": True}),
         ("sysinfo", [], {}),
         ("health", [], {}),
+        ("request_stats", [], {}),
     ],
 )
 def test_FtRestClient_call_explicit_methods(method, args, kwargs):
@@ -9,6 +9,7 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (
+    clean_ohlcv_dataframe,
     convert_ohlcv_format,
     convert_trades_format,
     convert_trades_to_ohlcv,
@@ -16,6 +17,7 @@ from freqtrade.data.converter import (
     ohlcv_to_dataframe,
     order_book_to_dataframe,
     reduce_dataframe_footprint,
+    trades_df_after_last,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
@@ -192,6 +194,63 @@ def test_ohlcv_fill_up_missing_data2(caplog):
     )
 
 
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "1d", "3d"])
+def test_clean_ohlcv_dataframe_fast_path(timeframe):
+    tf_ms = timeframe_to_seconds(timeframe) * 1000
+    start = 1511654400000 // tf_ms * tf_ms
+    ticks = [
+        [start + i * tf_ms, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10 * i]
+        for i in range(20)
+        if i not in (3, 7, 8)
+    ]
+    data = ohlcv_to_dataframe(ticks, timeframe, "UNITTEST/BTC", fill_missing=True)
+    assert len(data) == 19
+    assert data["date"].diff().iloc[1:].eq(pd.Timedelta(milliseconds=tf_ms)).all()
+
+    # Shuffled ticks with duplicates are grouped
+    shuffled = ticks[::-1] + ticks[2:4]
+    assert_frame_equal(
+        ohlcv_to_dataframe(shuffled, timeframe, "UNITTEST/BTC", fill_missing=True), data
+    )
+
+    # Reindexing matches resampling
+    resampled = (
+        ohlcv_to_dataframe(
+            ticks, timeframe, "UNITTEST/BTC", fill_missing=False, drop_incomplete=False
+        )
+        .resample(f"{timeframe_to_seconds(timeframe)}s", on="date")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+    )
+    resampled["close"] = resampled["close"].ffill()
+    for col in ("open", "high", "low"):
+        resampled[col] = resampled[col].fillna(resampled["close"])
+    assert_frame_equal(
+        ohlcv_to_dataframe(ticks, timeframe, "UNITTEST/BTC", drop_incomplete=False),
+        resampled.reset_index(),
+    )
+
+
+def test_clean_ohlcv_dataframe_readonly():
+    ticks = [[1511686200000 + i * 300_000, 1.0, 2.0, 0.5, 1.5, 10] for i in range(10)]
+    data = ohlcv_to_dataframe(ticks, "5m", "UNITTEST/BTC", fill_missing=False)
+    readonly = data.copy()
+    for col in readonly.columns:
+        readonly[col].values.flags.writeable = False
+
+    res = clean_ohlcv_dataframe(
+        readonly, "5m", "UNITTEST/BTC", fill_missing=False, drop_incomplete=False
+    )
+    assert_frame_equal(res, data)
+    res.loc[0, "close"] = 5.0
+    assert readonly.loc[0, "close"] == 1.5
+
+    # Writeable columns are not copied
+    res = clean_ohlcv_dataframe(
+        data, "5m", "UNITTEST/BTC", fill_missing=False, drop_incomplete=False
+    )
+    assert np.shares_memory(res["close"].values, data["close"].values)
+
+
 @pytest.mark.parametrize(
     "timeframe",
     ["1s", "1m", "5m", "15m", "1h", "2h", "4h", "8h", "12h", "1d", "7d", "1w", "1M", "3M", "1y"],
@@ -408,6 +467,25 @@ def test_trades_df_remove_duplicates(trades_history_df):
     assert res.equals(trades_history_df)
 
 
+def test_trades_df_after_last(trades_history_df):
+    known = trades_history_df.iloc[:3]
+    # Overlapping trades, including duplicates of the new trades
+    new = pd.concat([trades_history_df.iloc[1:], trades_history_df.iloc[-2:]])
+    res = trades_df_after_last(known, new)
+    assert_frame_equal(
+        res.reset_index(drop=True), trades_history_df.iloc[3:].reset_index(drop=True)
+    )
+
+    # Unknown trade with the same timestamp as the last known trade
+    same_ts = trades_history_df.iloc[2:3].copy()
+    same_ts["id"] = "unknown"
+    res = trades_df_after_last(known, pd.concat([trades_history_df.iloc[2:3], same_ts]))
+    assert res["id"].tolist() == ["unknown"]
+
+    assert trades_df_after_last(known, trades_history_df.iloc[:2]).empty
+    assert_frame_equal(trades_df_after_last(known.iloc[:0], new), trades_df_remove_duplicates(new))
+
+
 def test_trades_dict_to_list(fetch_trades_result):
     res = trades_dict_to_list(fetch_trades_result)
     assert isinstance(res, list)
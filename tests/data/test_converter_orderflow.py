@@ -1,12 +1,16 @@
+from datetime import timedelta
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS
-from freqtrade.data.converter import populate_dataframe_with_trades
+from freqtrade.data.converter import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -502,7 +506,7 @@ def test_analyze_with_orderflow(
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
     import freqtrade.data.converter.orderflow as orderflow_module
 
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "_orderflow_per_candle")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -529,7 +533,9 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    # All candles are calculated at once
+    assert spy.call_count == 1
+    assert len(spy.spy_return[0]) == 5
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
@@ -537,7 +543,11 @@ def test_analyze_with_orderflow(
         if col not in ("stacked_imbalances_bid", "stacked_imbalances_ask"):
             assert df1[col].count() == 5, f"Column {col} has {df1[col].count()} non-NaN values"
 
-    assert len(strategy._cached_grouped_trades_per_pair[pair]) == 5
+    # The last candle is still forming if there are no trades of a later candle
+    last_candle_forming = populate_dataframe_with_trades_trades["date"].max() < ohlcv_history[
+        "date"
+    ].iat[-1] + timedelta(minutes=5)
+    assert len(strategy._cached_grouped_trades_per_pair[pair]) == 5 - last_candle_forming
 
     lastval_trades = df1.at[len(df1) - 1, "trades"]
     assert isinstance(lastval_trades, list)
@@ -551,7 +561,8 @@ def test_analyze_with_orderflow(
     df2 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df2) == len(ohlcv_history)
     assert "open" in df2.columns
-    assert spy.call_count == 0
+    # Only the forming candle is calculated again
+    assert spy.call_count == int(last_candle_forming)
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df2.columns, f"Round2: Column {col} not found in df.columns"
 
@@ -568,6 +579,102 @@ def test_analyze_with_orderflow(
     assert isinstance(lastval_of2, dict)
 
 
+def test_populate_dataframe_with_trades_per_candle():
+    """
+    Orderflow of all candles is calculated at once -
+    results must match calculating each candle on its own.
+    """
+    dates = pd.date_range("2024-01-01", periods=6, freq="5min", tz="UTC")
+    dataframe = pd.DataFrame(
+        {"date": dates, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}
+    )
+    rng = np.random.default_rng(42)
+    timestamps = np.sort(
+        rng.integers(dates[0].value // 10**6 - 300_000, dates[-1].value // 10**6 + 300_000, 300)
+    )
+    trades = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "id": [str(i) for i in range(300)],
+            "type": None,
+            "side": rng.choice(["buy", "sell"], 300),
+            "price": np.round(100 + rng.random(300), 2),
+            "amount": np.round(rng.random(300) * 10, 3),
+            "cost": 1.0,
+        }
+    )
+    trades["date"] = pd.to_datetime(trades["timestamp"], unit="ms", utc=True)
+    config = {
+        "timeframe": "5m",
+        "orderflow": {
+            "cache_size": 3,
+            "max_candles": 5,
+            "scale": 0.1,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 1.5,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    df, cache = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    # Candles 1-4 are finished, the 3 most recent ones are cached
+    assert len(cache) == 3
+    assert cache.get(dates[1].value) is None
+    assert cache.get(dates[4].value)[1] is df.at[4, "orderflow"]
+    assert cache.get(dates[5].value) is None
+    # Only the last max_candles candles are populated
+    assert df.loc[0, ORDERFLOW_ADDED_COLUMNS[5:]].isna().all()
+
+    trades["candle_start"] = trades["date"].dt.floor("5min")
+    for idx in range(1, len(df)):
+        candle_trades = trades.loc[trades["candle_start"] == df.at[idx, "date"]]
+        row = df.iloc[idx]
+        assert row["trades"] == candle_trades.drop(columns=["candle_start"]).to_dict("records")
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.1)
+        assert row["orderflow"] == orderflow.to_dict(orient="index")
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=1.5, imbalance_volume=0
+        )
+        assert row["imbalances"] == imbalances.to_dict(orient="index")
+        assert row["stacked_imbalances_bid"] == stacked_imbalance(imbalances, "bid", 2)
+        assert row["stacked_imbalances_ask"] == stacked_imbalance(imbalances, "ask", 2)
+        bid = candle_trades.loc[candle_trades["side"] == "sell", "amount"].sum()
+        ask = candle_trades.loc[candle_trades["side"] == "buy", "amount"].sum()
+        assert pytest.approx(row["bid"]) == bid
+        assert pytest.approx(row["ask"]) == ask
+        assert pytest.approx(row["delta"]) == ask - bid
+        assert row["total_trades"] == len(candle_trades)
+        cum_delta = np.where(candle_trades["side"] == "buy", 1, -1) * candle_trades["amount"]
+        assert pytest.approx(row["max_delta"]) == cum_delta.cumsum().max()
+        assert pytest.approx(row["min_delta"]) == cum_delta.cumsum().min()
+
+    # Cached candles are reused
+    df2, _ = populate_dataframe_with_trades(cache, config, dataframe.copy(), trades.copy())
+    assert df2.at[4, "orderflow"] is df.at[4, "orderflow"]
+    assert df2.at[1, "orderflow"] is not df.at[1, "orderflow"]
+    assert df2.at[1, "orderflow"] == df.at[1, "orderflow"]
+
+    # The forming candle is calculated again with new trades
+    new_trade = trades.iloc[[-1]].assign(id="new", amount=100.0, side="buy")
+    trades = pd.concat([trades, new_trade], ignore_index=True).drop(columns=["candle_start"])
+    df3, cache = populate_dataframe_with_trades(cache, config, dataframe.copy(), trades)
+    assert df3.at[5, "total_trades"] == df.at[5, "total_trades"] + 1
+    assert pytest.approx(df3.at[5, "ask"]) == df.at[5, "ask"] + 100
+    assert df3.at[3, "orderflow"] is df.at[3, "orderflow"]
+    assert cache.get(dates[5].value) is None
+
+
+def test_orderflow_cache():
+    cache = OrderflowCache(maxsize=2)
+    cache.update({3: (3,), 1: (1,)})
+    assert len(cache) == 2
+    cache.update({2: (2,)})
+    # Oldest candles are evicted
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(2) == (2,)
+    assert cache.get(3) == (3,)
+
+
 def test_stacked_imbalances_multiple_prices():
     """Test that stacked imbalances correctly returns multiple price levels when present"""
     # Test with empty result
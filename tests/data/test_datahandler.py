@@ -1,7 +1,7 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
 import re
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -10,7 +10,7 @@ from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.data.history.datahandlers.arrowdatahandler import ArrowDataHandler
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -290,7 +290,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -302,13 +302,204 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["feather", "parquet", "arrow"])
+def test_chunked_datahandler_ohlcv_append(datahandler, mocker, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"UNITTEST_NEW-5m.{dh._get_file_extension()}"
+    dh.ohlcv_append("UNITTEST/NEW", "5m", DataFrame(), CandleType.SPOT)
+    assert not file.exists()
+
+    # Appending without existing data stores the data
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[:3000], CandleType.SPOT)
+    assert file.is_file()
+    assert dh._segment_files(file) == []
+
+    # Overlapping candles are replaced by appended candles
+    changed = ohlcv.iloc[2990:4000].copy()
+    changed["volume"] = 1.0
+    dh.ohlcv_append("UNITTEST/NEW", "5m", changed, CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[3995:], CandleType.SPOT)
+    assert [f.name for f in dh._segment_files(file)] == [
+        f"{file.name}.0001",
+        f"{file.name}.0002",
+    ]
+    assert dh.ohlcv_data_files("UNITTEST/NEW", "5m", CandleType.SPOT) == [
+        file,
+        *dh._segment_files(file),
+    ]
+    expected = ohlcv.copy()
+    expected.loc[2990:3994, "volume"] = 1.0
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected, check_dtype=False)
+
+    timerange = TimeRange.parse_timerange("20180120-20180125")
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", timerange=timerange, candle_type=CandleType.SPOT)
+    assert loaded.iloc[0]["date"] == Timestamp("2018-01-20", tz="UTC")
+    assert loaded.iloc[-1]["date"] == Timestamp("2018-01-25", tz="UTC")
+
+    # Segments are merged once too many exist
+    mocker.patch("freqtrade.data.history.datahandlers.chunkeddatahandler.MAX_APPEND_SEGMENTS", 2)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-10:], CandleType.SPOT)
+    assert dh._segment_files(file) == []
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected, check_dtype=False)
+
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-10:], CandleType.SPOT)
+    assert len(dh._segment_files(file)) == 1
+    assert dh.ohlcv_purge("UNITTEST/NEW", "5m", CandleType.SPOT)
+    assert not file.exists()
+    assert dh._segment_files(file) == []
+    assert dh.ohlcv_data_files("UNITTEST/NEW", "5m", CandleType.SPOT) == []
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_chunked_datahandler_timerange_load(datahandler, mocker, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    mocker.patch(
+        f"freqtrade.data.history.datahandlers.{datahandler}datahandler.OHLCV_CHUNK_SIZE", 500
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv, CandleType.SPOT)
+
+    for timerange, start, end in [
+        ("20180120-20180125", "2018-01-20", "2018-01-25"),
+        ("20180120-", "2018-01-20", None),
+        ("-20180115", None, "2018-01-15"),
+        ("20190101-", None, None),
+    ]:
+        loaded = dh._ohlcv_load(
+            "UNITTEST/NEW", "5m", TimeRange.parse_timerange(timerange), CandleType.SPOT
+        )
+        assert len(loaded) < len(ohlcv)
+        if start:
+            assert loaded.iloc[0]["date"] <= Timestamp(start, tz="UTC")
+            assert loaded.iloc[0]["date"] > Timestamp(start, tz="UTC") - timedelta(minutes=2500)
+        if end:
+            assert loaded.iloc[-1]["date"] >= Timestamp(end, tz="UTC")
+            assert loaded.iloc[-1]["date"] < Timestamp(end, tz="UTC") + timedelta(minutes=2500)
+        if not start and not end:
+            assert loaded.empty
+
+
+def test_arrow_datahandler_ohlcv(testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = ArrowDataHandler(tmp_path)
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv, CandleType.SPOT)
+    assert (tmp_path / "UNITTEST_NEW-5m.arrow").is_file()
+
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv)
+    # Columns are read-only views of the memory-mapped file
+    assert not loaded["close"].to_numpy().flags.writeable
+
+    timerange = TimeRange.parse_timerange("20180120-20180125")
+    loaded_tr = dh._ohlcv_load("UNITTEST/NEW", "5m", timerange, candle_type=CandleType.SPOT)
+    assert loaded_tr.iloc[0]["date"] == Timestamp("2018-01-20", tz="UTC")
+    assert loaded_tr.iloc[-1]["date"] == Timestamp("2018-01-25", tz="UTC")
+    assert dh._ohlcv_load(
+        "UNITTEST/NEW", "5m", TimeRange.parse_timerange("20190101-"), CandleType.SPOT
+    ).empty
+
+    # Replacing the file keeps previously loaded data valid
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv.iloc[:10], CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv)
+    assert len(dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=CandleType.SPOT)) == 10
+    assert not (tmp_path / "UNITTEST_NEW-5m.arrow.tmp").exists()
+
+
+def test_arrow_datahandler_trades(tmp_path, trades_full, timerange_mid):
+    dh = ArrowDataHandler(tmp_path)
+    dh.trades_store("XRP/ETH", trades_full, TradingMode.SPOT)
+    assert (tmp_path / "XRP_ETH-trades.arrow").is_file()
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades_full)
+
+    subset = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange_mid)
+    assert not subset.empty
+    assert subset["timestamp"].min() >= timerange_mid.startts
+    assert subset["timestamp"].max() <= timerange_mid.stopts
+    assert len(subset) < len(trades_full)
+    assert dh.trades_load("XRP/NONEXIST", TradingMode.SPOT).empty
+
+
+def test_parquet_datahandler_trades_timerange(tmp_path, trades_full, timerange_mid):
+    dh = get_datahandler(tmp_path, "parquet")
+    dh.trades_store("XRP/ETH", trades_full, TradingMode.SPOT)
+    subset = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange_mid)
+    expected = trades_full.loc[
+        (trades_full["timestamp"] >= timerange_mid.startts)
+        & (trades_full["timestamp"] <= timerange_mid.stopts)
+    ]
+    assert_frame_equal(subset, expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
         dh.trades_append("UNITTEST/ETH", DataFrame())
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet", "arrow"])
+def test_chunked_datahandler_trades_append(datahandler, mocker, tmp_path, trades_full):
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_ETH-trades.{dh._get_file_extension()}"
+    dh.trades_append("XRP/ETH", DataFrame(), TradingMode.SPOT)
+    assert not file.exists()
+
+    # Appending without existing data stores the data
+    dh.trades_append("XRP/ETH", trades_full.iloc[:500], TradingMode.SPOT)
+    assert file.is_file()
+    assert dh._segment_files(file) == []
+
+    dh.trades_append("XRP/ETH", trades_full.iloc[500:800], TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades_full.iloc[800:], TradingMode.SPOT)
+    assert [f.name for f in dh._segment_files(file)] == [
+        f"{file.name}.0001",
+        f"{file.name}.0002",
+    ]
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades_full)
+    assert dh.trades_get_pairs(tmp_path) == ["XRP/ETH"]
+
+    # Segments are merged once too many exist - record batch by record batch
+    mocker.patch("freqtrade.data.history.datahandlers.chunkeddatahandler.MAX_APPEND_SEGMENTS", 2)
+    load_mock = mocker.spy(dh, "_trades_load")
+    dh.trades_append("XRP/ETH", trades_full.iloc[-1:], TradingMode.SPOT)
+    assert dh._segment_files(file) == []
+    assert load_mock.call_count == 0
+    assert not file.with_name(f"{file.name}.tmp").exists()
+    # The duplicate trade is removed on load
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades_full)
+
+    # Overlapping segments are merged in memory
+    dh.trades_store("XRP/ETH", trades_full.iloc[500:], TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades_full.iloc[-1:], TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades_full.iloc[-1:], TradingMode.SPOT)
+    load_mock.reset_mock()
+    dh.trades_append("XRP/ETH", trades_full.iloc[:500], TradingMode.SPOT)
+    assert dh._segment_files(file) == []
+    assert load_mock.call_count == 1
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades_full)
+
+    # Storing replaces appended segments
+    dh.trades_append("XRP/ETH", trades_full.iloc[-1:], TradingMode.SPOT)
+    assert len(dh._segment_files(file)) == 1
+    dh.trades_store("XRP/ETH", trades_full, TradingMode.SPOT)
+    assert dh._segment_files(file) == []
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades_full)
+
+    dh.trades_append("XRP/ETH", trades_full.iloc[-1:], TradingMode.SPOT)
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert not file.exists()
+    assert dh._segment_files(file) == []
+
+
 @pytest.mark.parametrize(
     "datahandler,expected",
     [
@@ -443,7 +634,8 @@ def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
 
     mocker.patch.object(Path, "exists", MagicMock(return_value=True))
     assert dh.trades_purge("UNITTEST/NONEXIST", TradingMode.SPOT)
-    assert unlinkmock.call_count == 1
+    # Trades file and bulk download manifest
+    assert unlinkmock.call_count == 2
 
 
 def test_datahandler_trades_get_available_data(testdatadir):
@@ -495,6 +687,10 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("arrow")
+    assert cl == ArrowDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
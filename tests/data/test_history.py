@@ -1,5 +1,6 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
 import uuid
@@ -14,13 +15,14 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
-from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_list_to_df
 from freqtrade.data.history import get_datahandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
     _download_all_pairs_history_parallel,
     _download_pair_history,
     _download_trades_history,
+    _DownloadProgress,
     _load_cached_data_for_updating,
     get_timerange,
     load_data,
@@ -32,6 +34,7 @@ from freqtrade.data.history.history_utils import (
 )
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes
+from freqtrade.exchange.exchange_types import TradesArchiveDay
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util import dt_ts, dt_utc
@@ -358,6 +361,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -381,7 +388,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing data is appended to
+    assert json_dump_mock.call_count == 2
+    assert append_mock.call_count == 1
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -394,6 +403,27 @@ def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_p
     assert log_has('Failed to download history data for pair: "MEME/BTC", timeframe: 1m.', caplog)
 
 
+def test_load_data_workers(testdatadir) -> None:
+    pairs = ["UNITTEST/BTC", "XLM/BTC", "NOPAIR/BTC", "ETH/BTC", "TRX/BTC"]
+    timerange = TimeRange.parse_timerange("20180115-20180120")
+    expected = load_data(testdatadir, "5m", pairs, timerange=timerange, startup_candles=20)
+    progress = MagicMock()
+    data = load_data(
+        testdatadir,
+        "5m",
+        pairs,
+        timerange=timerange,
+        startup_candles=20,
+        workers=3,
+        progress_callback=progress,
+    )
+    assert list(data.keys()) == ["UNITTEST/BTC", "XLM/BTC", "ETH/BTC", "TRX/BTC"]
+    for pair, df in expected.items():
+        assert_frame_equal(data[pair], df)
+    assert progress.call_count == 5
+    assert [c[0] for c in progress.call_args_list] == [(i, 5) for i in range(1, 6)]
+
+
 def test_load_partial_missing(testdatadir, caplog) -> None:
     # Make sure we start fresh - test missing data at start
     start = dt_utc(2018, 1, 1)
@@ -583,6 +613,114 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+def test_refresh_backtest_ohlcv_data_workers(
+    mocker, default_conf, markets, caplog, tmp_path, ohlcv_history
+):
+    caplog.set_level(logging.DEBUG)
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    ex._ft_has["download_data_concurrency"] = 2
+    dh = get_datahandler(tmp_path, "feather")
+
+    fetching = 0
+    max_fetching = 0
+
+    async def historic_ohlcv_chunks(pair, timeframe, **kwargs):
+        nonlocal fetching, max_fetching
+        fetching += 1
+        max_fetching = max(max_fetching, fetching)
+        await asyncio.sleep(0.01)
+        fetching -= 1
+        if pair == "XRP/BTC" and timeframe == "5m":
+            raise ValueError("Download failed")
+        return [ohlcv_history.iloc[:10], ohlcv_history.iloc[10:]]
+
+    get_chunks = mocker.patch.object(
+        ex, "get_historic_ohlcv_chunks", side_effect=historic_ohlcv_chunks
+    )
+    get_historic = mocker.patch.object(ex, "get_historic_ohlcv")
+
+    stored_when_done = []
+    progress_done = _DownloadProgress.done
+
+    def done(self, index):
+        pair, timeframe, candle_type = self._jobs[index]
+        stored_when_done.append(
+            not dh.ohlcv_load(pair, timeframe, candle_type=candle_type, fill_missing=False).empty
+        )
+        progress_done(self, index)
+
+    mocker.patch.object(_DownloadProgress, "done", done)
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC"]
+    unav_pairs = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=[*pairs, "FOO/BAR"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        trading_mode="spot",
+        workers=3,
+        no_parallel_download=True,
+    )
+    assert unav_pairs == ["FOO/BAR: Pair not available on exchange."]
+    assert get_historic.call_count == 0
+    assert get_chunks.call_count == 8
+    assert {(c.kwargs["pair"], c.kwargs["timeframe"]) for c in get_chunks.call_args_list} == {
+        (p, tf) for p in pairs for tf in ["1m", "5m"]
+    }
+    # Downloads run concurrently - bounded by the exchange's download_data_concurrency
+    assert max_fetching == 2
+    # Jobs are only done once their data is written
+    assert stored_when_done.count(True) == 7
+    assert len(stored_when_done) == 8
+    assert log_has_re(
+        r'Failed to download history data for pair: "XRP/BTC", timeframe: 5m\.', caplog
+    )
+
+    for pair in pairs:
+        for timeframe in ["1m", "5m"]:
+            data = dh.ohlcv_load(pair, timeframe, candle_type=CandleType.SPOT, fill_missing=False)
+            if pair == "XRP/BTC" and timeframe == "5m":
+                assert data.empty
+            else:
+                assert_frame_equal(data, ohlcv_history, check_dtype=False)
+    assert log_has_re(r"Downloaded 21 candles \(.* MB\) in .*s: .* candles/s, .* MB/s\.", caplog)
+
+
+def test_refresh_backtest_ohlcv_data_sequential(
+    mocker, default_conf, markets, caplog, tmp_path, ohlcv_history
+):
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+
+    def historic_ohlcv(pair, timeframe, **kwargs):
+        if pair == "XRP/BTC" and timeframe == "5m":
+            raise ValueError("Download failed")
+        return ohlcv_history
+
+    get_historic = mocker.patch.object(ex, "get_historic_ohlcv", side_effect=historic_ohlcv)
+    get_chunks = mocker.patch.object(ex, "get_historic_ohlcv_chunks")
+    pairs = ["ETH/BTC", "XRP/BTC"]
+    refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=pairs,
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        trading_mode="spot",
+        no_parallel_download=True,
+    )
+    assert get_chunks.call_count == 0
+    # Downloads happen in the order of pairs
+    assert [c.kwargs["pair"] for c in get_historic.call_args_list] == [
+        p for p in pairs for _ in range(2)
+    ]
+    assert log_has_re(
+        r'Failed to download history data for pair: "XRP/BTC", timeframe: 5m\.', caplog
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    data = dh.ohlcv_load("ETH/BTC", "5m", candle_type=CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(data, ohlcv_history, check_dtype=False)
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
@@ -712,6 +850,166 @@ def test_download_trades_history(
     _clean_test_file(file2)
 
 
+def test_download_trades_history_bulk(mocker, default_conf, caplog, tmp_path, time_machine) -> None:
+    time_machine.move_to(dt_utc(2023, 1, 5), tick=False)
+
+    def day_trades(day: int, ids: range) -> TradesArchiveDay:
+        start = dt_ts(dt_utc(2023, 1, day))
+        trades = [[start + i * 60_000, str(i), None, "buy", 1.0, 2.0, 2.0] for i in ids]
+        return TradesArchiveDay(f"2023-01-{day:02d}", f"sha{day}", trades_list_to_df(trades))
+
+    archive = [day_trades(1, range(0, 5)), day_trades(2, range(5, 10))]
+    exchange = get_patched_exchange(mocker, default_conf)
+    archive_mock = mocker.patch.object(
+        exchange,
+        "get_historic_trades_archive",
+        side_effect=lambda pair, since, until=None: (
+            d for d in archive if dt_ts(dt_utc(2023, 1, int(d.day[-2:]))) >= since
+        ),
+    )
+    last_ts = int(archive[-1].trades["timestamp"].iat[-1])
+    rest_trades = [
+        [last_ts - 60_000, "8", None, "buy", 1.0, 2.0, 2.0],
+        [last_ts, "9", None, "buy", 1.0, 2.0, 2.0],
+        [last_ts + 60_000, "10", None, "buy", 1.0, 2.0, 2.0],
+    ]
+    ght_mock = mocker.patch.object(
+        exchange, "get_historic_trades", return_value=("ETH/BTC", rest_trades)
+    )
+    data_handler = get_datahandler(tmp_path, data_format="feather")
+    timerange = TimeRange("date", None, dt_ts(dt_utc(2023, 1, 1)) // 1000, 0)
+
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        timerange=timerange,
+        trading_mode=TradingMode.SPOT,
+        bulk=True,
+    )
+    assert log_has("Stored 5 archived trades of ETH/BTC for 2023-01-02.", caplog)
+    # REST download continues after the last archived trade
+    assert ght_mock.call_args[1]["since"] == last_ts - 5000
+    assert ght_mock.call_args[1]["from_id"] == "9"
+    trades = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert list(trades["id"]) == [str(i) for i in range(11)]
+
+    manifest_file = data_handler.trades_manifest_filename("ETH/BTC", TradingMode.SPOT)
+    manifest = json.loads(manifest_file.read_text())
+    assert list(manifest["days"]) == ["2023-01-01", "2023-01-02"]
+    assert manifest["days"]["2023-01-02"] == {"sha256": "sha2", "trades": 5}
+    trades_file = data_handler._pair_trades_filename(tmp_path, "ETH/BTC", TradingMode.SPOT)
+    stored_files = sorted(tmp_path.glob(f"{trades_file.name}*"))
+
+    # REST download continues after the last stored trade - not after the last archived trade
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        timerange=timerange,
+        trading_mode=TradingMode.SPOT,
+        bulk=True,
+    )
+    assert ght_mock.call_args[1]["since"] == last_ts + 60_000 - 5000
+    assert ght_mock.call_args[1]["from_id"] == "10"
+    assert sorted(tmp_path.glob(f"{trades_file.name}*")) == stored_files
+    assert len(data_handler._trades_load("ETH/BTC", TradingMode.SPOT)) == 11
+
+    # Days stored by an interrupted run (without manifest entry) are not stored again
+    archive.append(day_trades(3, range(11, 13)))
+    data_handler.trades_append("ETH/BTC", archive[-1].trades.iloc[:1], TradingMode.SPOT)
+    caplog.clear()
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        timerange=timerange,
+        trading_mode=TradingMode.SPOT,
+        bulk=True,
+    )
+    assert archive_mock.call_args[1]["since"] == dt_ts(dt_utc(2023, 1, 3))
+    assert log_has("Continuing trade archive download for ETH/BTC after 2023-01-02.", caplog)
+    assert not log_has_re(r"Stored .* for 2023-01-0[12]\.", caplog)
+    assert log_has("Stored 1 archived trades of ETH/BTC for 2023-01-03.", caplog)
+    assert ght_mock.call_args[1]["from_id"] == "12"
+    assert len(data_handler._trades_load("ETH/BTC", TradingMode.SPOT)) == 13
+
+    with pytest.raises(ValueError, match=r"Start .* earlier than available data"):
+        _download_trades_history(
+            data_handler=data_handler,
+            exchange=exchange,
+            pair="ETH/BTC",
+            timerange=TimeRange("date", None, dt_ts(dt_utc(2022, 12, 31)) // 1000, 0),
+            trading_mode=TradingMode.SPOT,
+            bulk=True,
+        )
+
+    # Purging the trades removes the manifest
+    data_handler.trades_purge("ETH/BTC", TradingMode.SPOT)
+    assert not manifest_file.exists()
+
+    # Trades stored without bulk mode are not mixed with the archive
+    data_handler.trades_store(
+        "ETH/BTC", trades_list_to_df(rest_trades), trading_mode=TradingMode.SPOT
+    )
+    archive_mock.reset_mock()
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        trading_mode=TradingMode.SPOT,
+        bulk=True,
+    )
+    assert log_has_re(r"Trades of ETH/BTC were not downloaded in bulk mode.*", caplog)
+    assert archive_mock.call_count == 0
+
+
+@pytest.mark.parametrize("data_format", ["feather", "parquet", "arrow"])
+def test_download_trades_history_bulk_many_days(mocker, default_conf, tmp_path, data_format):
+    start = dt_utc(2023, 1, 1)
+    archive = [
+        TradesArchiveDay(
+            f"{start + timedelta(days=day):%Y-%m-%d}",
+            f"sha{day}",
+            trades_list_to_df(
+                [
+                    [
+                        dt_ts(start + timedelta(days=day, hours=i)),
+                        str(day * 3 + i),
+                        None,
+                        "buy",
+                        1.0,
+                        2.0,
+                        2.0,
+                    ]
+                    for i in range(3)
+                ]
+            ),
+        )
+        for day in range(40)
+    ]
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch.object(exchange, "get_historic_trades_archive", return_value=iter(archive))
+    mocker.patch.object(exchange, "get_historic_trades", return_value=("ETH/BTC", []))
+    data_handler = get_datahandler(tmp_path, data_format=data_format)
+    load_mock = mocker.spy(data_handler, "_trades_load")
+
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        timerange=TimeRange("date", None, dt_ts(start) // 1000, 0),
+        trading_mode=TradingMode.SPOT,
+        bulk=True,
+    )
+    # Segments are merged without loading the stored trades
+    assert load_mock.call_count == 1
+    trades_file = data_handler._pair_trades_filename(tmp_path, "ETH/BTC", TradingMode.SPOT)
+    assert len(data_handler._segment_files(trades_file)) < 32
+    trades = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert list(trades["id"]) == [str(i) for i in range(120)]
+
+
 def test_download_all_pairs_history_parallel(mocker, default_conf_usdt):
     pairs = ["PAIR1/BTC", "PAIR2/USDT"]
     timeframe = "5m"
@@ -830,6 +1128,7 @@ def test_download_pair_history_with_pair_candles(mocker, default_conf, tmp_path,
     data_handler_mock = MagicMock()
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
+    data_handler_mock.ohlcv_append = MagicMock(side_effect=NotImplementedError())
     mocker.patch(
         "freqtrade.data.history.history_utils.get_datahandler", return_value=data_handler_mock
     )
@@ -925,6 +1224,7 @@ def test_download_pair_history_with_pair_candles_no_overlap(
     data_handler_mock = MagicMock()
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
+    data_handler_mock.ohlcv_append = MagicMock(side_effect=NotImplementedError())
     mocker.patch(
         "freqtrade.data.history.history_utils.get_datahandler", return_value=data_handler_mock
     )
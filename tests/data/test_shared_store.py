@@ -0,0 +1,113 @@
+# pragma pylint: disable=missing-docstring, C0103
+from multiprocessing import resource_tracker
+
+import numpy as np
+import pytest
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.shared_store import MmapDataStore, SharedDataStore
+from tests.conftest import generate_test_data
+
+
+def test_shared_data_store_roundtrip():
+    data = {
+        "UNITTEST/BTC": generate_test_data("5m", 50, "2022-01-03 12:00:00+00:00"),
+        "ETH/BTC": generate_test_data("5m", 20, "2022-01-03 12:00:00+00:00"),
+        "XRP/BTC": generate_test_data("5m", 0, "2022-01-03 12:00:00+00:00"),
+    }
+    for df in data.values():
+        df["enter_tag"] = "tag"
+    store = SharedDataStore.create(data)
+    try:
+        assert store.spec["keys"] == ["UNITTEST/BTC", "ETH/BTC", "XRP/BTC"]
+        assert store.spec["offsets"] == [0, 50, 70, 70]
+        attached = SharedDataStore.attach(store.spec)
+        close = attached.column("close")
+        assert len(close) == 70
+        assert not close.flags.writeable
+        np.testing.assert_array_equal(close[50:], data["ETH/BTC"]["close"].to_numpy())
+        with pytest.raises(KeyError):
+            attached.column("enter_tag")
+
+        result = attached.to_dataframes()
+        attached.close()
+        assert list(result.keys()) == list(data.keys())
+        for pair, df in data.items():
+            assert_frame_equal(result[pair], df, check_dtype=False)
+            assert result[pair]["date"].dtype == df["date"].dtype
+    finally:
+        store.unlink()
+
+
+def test_shared_data_store_attach_untracked(mocker):
+    store = SharedDataStore.create({"UNITTEST/BTC": generate_test_data("5m", 5)})
+    try:
+        register = mocker.spy(resource_tracker, "register")
+        unregister = mocker.spy(resource_tracker, "unregister")
+        attached = SharedDataStore.attach(store.spec)
+        attached.close()
+        # Worker processes share the creator's resource tracker - attaching must neither
+        # register the blocks (unlinking them when the worker exits), nor unregister them
+        # (dropping the creator's registration).
+        assert register.call_count == 0
+        assert unregister.call_count == 0
+        assert resource_tracker.register is register
+        assert store.column("close").sum() > 0
+    finally:
+        store.unlink()
+
+
+def test_shared_data_store_columns_differ():
+    data = {
+        "UNITTEST/BTC": generate_test_data("5m", 5),
+        "ETH/BTC": generate_test_data("5m", 5).drop(columns=["volume"]),
+    }
+    data["ETH/BTC"]["rsi"] = 50
+    store = SharedDataStore.create(data)
+    try:
+        result = store.to_dataframes()
+        for pair, df in data.items():
+            assert list(result[pair].columns) == list(df.columns)
+            assert_frame_equal(result[pair], df, check_dtype=False)
+    finally:
+        store.unlink()
+
+
+def test_mmap_data_store(tmp_path):
+    data = {
+        "UNITTEST/BTC": generate_test_data("5m", 50, "2022-01-03 12:00:00+00:00"),
+        "ETH/BTC": generate_test_data("5m", 20, "2022-01-03 12:00:00+00:00"),
+    }
+    data["ETH/BTC"]["enter_tag"] = "tag"
+    store = MmapDataStore.create(data, tmp_path / "store")
+    assert (tmp_path / "store" / MmapDataStore.SPEC_FILE).is_file()
+    assert isinstance(store.column("close"), np.memmap)
+    assert not store.column("close").flags.writeable
+
+    loaded = MmapDataStore.load(tmp_path / "store")
+    assert loaded.spec["id"] == store.spec["id"]
+    result = loaded.to_dataframes()
+    for pair, df in data.items():
+        assert_frame_equal(result[pair], df, check_dtype=False)
+    # Dataframes are independent copies
+    result["ETH/BTC"].loc[0, "close"] = -1
+    assert loaded.column("close")[50] == data["ETH/BTC"].loc[0, "close"]
+
+    cow = loaded.to_cow_dataframes()
+    for pair, df in data.items():
+        assert_frame_equal(cow[pair], df, check_dtype=False)
+    # Copy-on-write - writes don't reach the store, nor other dataframes
+    cow["ETH/BTC"].loc[0, "close"] = -1
+    cow["ETH/BTC"].loc[0, "enter_tag"] = "other"
+    assert loaded.column("close")[50] == data["ETH/BTC"].loc[0, "close"]
+    cow2 = loaded.to_cow_dataframes()
+    assert cow2["ETH/BTC"].loc[0, "close"] == data["ETH/BTC"].loc[0, "close"]
+    assert cow2["ETH/BTC"].loc[0, "enter_tag"] == "tag"
+
+    # Creating a new store in the same directory replaces the old one
+    new_store = MmapDataStore.create({"ETH/BTC": data["ETH/BTC"]}, tmp_path / "store")
+    assert new_store.spec["id"] != store.spec["id"]
+    assert list(MmapDataStore.load(tmp_path / "store").to_dataframes().keys()) == ["ETH/BTC"]
+    # Columns of the previous store are removed
+    files = {file.name for file in (tmp_path / "store").glob("column_*.npy")}
+    assert files == {col[2] for col in new_store.spec["columns"] if col[2] is not None}
@@ -8,8 +8,10 @@ import pandas as pd
 import pytest
 
 from freqtrade.data.converter.trade_converter import trades_dict_to_list
+from freqtrade.data.history.history_utils import _ohlcv_chunks_to_dataframe
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import DependencyException, InvalidOrderException, OperationalException
+from freqtrade.exchange.exchange_types import TradesArchiveDay
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
 from freqtrade.persistence import Trade
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts, dt_utc
@@ -782,8 +784,12 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
             (archive_storage["date"] >= since) & (archive_storage["date"] < until)
         ]
 
+    async def get_historic_ohlcv_chunks(*args, **kwargs):
+        return [get_historic_ohlcv(*args, **kwargs)]
+
     candle_mock = mocker.patch(f"{EXMS}._async_get_candle_history", return_value=candle_history)
     api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    mocker.patch(f"{EXMS}.get_historic_ohlcv_chunks", side_effect=get_historic_ohlcv_chunks)
     archive_mock = mocker.patch(
         "freqtrade.exchange.binance.download_archive_ohlcv", side_effect=download_archive_ohlcv
     )
@@ -975,6 +981,15 @@ def test_get_historic_ohlcv_binance(
     if api_called:
         api_mock.assert_called_once()
 
+    # The coroutine variant used by download-data returns the same candles
+    chunks = exchange.run_download(
+        exchange.get_historic_ohlcv_chunks(
+            pair, timeframe, since_ms, candle_type, is_new_pair, until_ms
+        )
+    )
+    chunks_df = _ohlcv_chunks_to_dataframe(chunks, pair, timeframe)
+    assert chunks_df["date"].tolist() == df["date"].tolist()
+
 
 @pytest.mark.parametrize(
     "pair,notional_value,mm_ratio,amt",
@@ -1111,6 +1126,44 @@ async def test__async_get_trade_history_id_binance_fast(
     exchange.close()
 
 
+def test_get_historic_trades_archive_binance(default_conf_usdt, mocker):
+    exchange = get_patched_exchange(mocker, default_conf_usdt, exchange="binance")
+    days = [
+        TradesArchiveDay("2024-01-01", "sha1", pd.DataFrame()),
+        TradesArchiveDay("2024-01-02", "sha2", pd.DataFrame()),
+    ]
+    closed = []
+
+    async def iter_archive_trades(candle_type, pair, *, since_ms, until_ms, markets):
+        try:
+            for day in days:
+                yield day
+        finally:
+            closed.append(pair)
+
+    iter_mock = mocker.patch(
+        "freqtrade.exchange.binance.iter_archive_trades", side_effect=iter_archive_trades
+    )
+    since = dt_ts(dt_utc(2024, 1, 1))
+    assert list(exchange.get_historic_trades_archive("ETH/USDT", since=since)) == days
+    assert iter_mock.call_args[0] == (CandleType.SPOT, "ETH/USDT")
+    assert iter_mock.call_args[1]["since_ms"] == since
+    assert closed == ["ETH/USDT"]
+
+    # Stopping early closes the archive stream
+    archive = exchange.get_historic_trades_archive("ETH/USDT", since=since)
+    assert next(archive) == days[0]
+    archive.close()
+    assert closed == ["ETH/USDT", "ETH/USDT"]
+
+    exchange._config["exchange"]["only_from_ccxt"] = True
+    iter_mock.reset_mock()
+    assert list(exchange.get_historic_trades_archive("ETH/USDT", since=since)) == []
+    assert iter_mock.call_count == 0
+
+    exchange.close()
+
+
 def test_check_delisting_time_binance(default_conf_usdt, mocker):
     exchange = get_patched_exchange(mocker, default_conf_usdt, exchange="binance")
     exchange._config["runmode"] = RunMode.BACKTEST
@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+import hashlib
 import io
 import re
 import sys
@@ -13,6 +14,7 @@ import pytest
 from freqtrade.enums import CandleType
 from freqtrade.exchange.binance_public_data import (
     BadHttpStatus,
+    ChecksumMismatch,
     Http404,
     binance_vision_trades_zip_url,
     binance_vision_zip_name,
@@ -20,6 +22,8 @@ from freqtrade.exchange.binance_public_data import (
     download_archive_trades,
     get_daily_ohlcv,
     get_daily_trades,
+    get_daily_trades_archive,
+    iter_archive_trades,
 )
 from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from ft_client.test_client.test_rest_client import log_has_re
@@ -494,3 +498,101 @@ async def test_get_daily_trades(mocker, testdatadir):
         with pytest.raises(zipfile.BadZipFile):
             await get_daily_trades(symbol, CandleType.SPOT, date, session)
         assert get.call_count == 4  # 1 + 3 default retries
+
+
+async def test_get_daily_trades_archive(mocker, testdatadir):
+    symbol = "PEPEUSDT"
+    date = dt_utc(2024, 10, 27).date()
+    content = (
+        testdatadir / "binance/binance_public_data/spot-PEPEUSDT-aggTrades-2024-10-27.zip"
+    ).read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    def make_get(checksum: bytes, checksum_status: int = 200):
+        def get(url):
+            if url.endswith(".CHECKSUM"):
+                return MockResponse(checksum, checksum_status)
+            return MockResponse(content, 200)
+
+        return get
+
+    async with aiohttp.ClientSession() as session:
+        get = mocker.patch(
+            "freqtrade.exchange.binance_public_data.aiohttp.ClientSession.get",
+            side_effect=make_get(f"{sha256}  {symbol}-aggTrades-2024-10-27.zip\n".encode()),
+        )
+        res = await get_daily_trades_archive(symbol, CandleType.SPOT, date, session)
+        assert get.call_count == 2
+        assert res.day == "2024-10-27"
+        assert res.sha256 == sha256
+        assert res.trades["timestamp"].iat[0] == 1729987202368
+        assert res.trades["timestamp"].iat[-1] == 1730073596350
+        assert res.trades.to_records(index=False).tolist() == await get_daily_trades(
+            symbol, CandleType.SPOT, date, session
+        )
+
+        # No published checksum
+        mocker.patch(
+            "freqtrade.exchange.binance_public_data.aiohttp.ClientSession.get",
+            side_effect=make_get(b"", 404),
+        )
+        res = await get_daily_trades_archive(symbol, CandleType.SPOT, date, session)
+        assert res.sha256 == sha256
+
+        mocker.patch(
+            "freqtrade.exchange.binance_public_data.aiohttp.ClientSession.get",
+            side_effect=make_get(b"abcd  PEPEUSDT-aggTrades-2024-10-27.zip"),
+        )
+        with pytest.raises(ChecksumMismatch, match=r"expected abcd"):
+            await get_daily_trades_archive(symbol, CandleType.SPOT, date, session)
+
+
+async def test_iter_archive_trades(mocker, caplog):
+    pair = "BTC/USDT"
+    markets = {"BTC/USDT": {"id": "BTCUSDT"}}
+    since_ms = dt_ts(dt_utc(2020, 1, 1))
+    until_ms = dt_ts(dt_utc(2020, 1, 5))
+
+    async def get_day(symbol, candle_type, date, session):
+        if date == dt_utc(2020, 1, 3):
+            raise Http404("xxx", date, "http://example.com/something")
+        return date
+
+    get_mock = mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_archive", side_effect=get_day
+    )
+    res = [
+        day
+        async for day in iter_archive_trades(
+            CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets, prefetch=2
+        )
+    ]
+    # Stops at the first missing day - without gaps
+    assert res == [dt_utc(2020, 1, 1), dt_utc(2020, 1, 2)]
+    assert get_mock.call_count == 4
+    assert log_has_re(r"Binance trades archive for BTC/USDT stopped at 2020-01-03", caplog)
+
+    caplog.clear()
+    get_mock = mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_archive",
+        side_effect=ChecksumMismatch("Checksum mismatch"),
+    )
+    res = [
+        day
+        async for day in iter_archive_trades(
+            CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets
+        )
+    ]
+    assert res == []
+    assert log_has_re(r"Binance trades archive for BTC/USDT stopped: Checksum mismatch", caplog)
+
+    # Downloads ahead at most `prefetch` days
+    get_mock = mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_archive", side_effect=get_day
+    )
+    days = iter_archive_trades(
+        CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets, prefetch=1
+    )
+    assert await anext(days) == dt_utc(2020, 1, 1)
+    assert get_mock.call_count == 2
+    await days.aclose()
@@ -11,6 +11,8 @@ from numpy import nan
 from pandas import DataFrame, to_datetime
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.converter import trades_list_to_df
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import (
     ConfigurationError,
@@ -2190,6 +2192,20 @@ def test_get_historic_ohlcv(default_conf, mocker, caplog, exchange_name, candle_
     assert log_has_re(r"Async code raised an exception: .*", caplog)
 
 
+async def test_get_historic_ohlcv_chunks(default_conf, mocker, caplog):
+    caplog.set_level(logging.DEBUG)
+    exchange = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    ohlcv = [[dt_ts(dt_now() - timedelta(minutes=10)), 1, 2, 3, 4, 5]]
+    exchange._async_get_historic_ohlcv = get_mock_coro(
+        return_value=("ETH/BTC", "5m", CandleType.SPOT, ohlcv, True)
+    )
+    chunks = await exchange.get_historic_ohlcv_chunks("ETH/BTC", "5m", 0, CandleType.SPOT)
+    # Candles are returned unconverted
+    assert chunks == [ohlcv]
+    assert exchange._async_get_historic_ohlcv.call_args.kwargs["raise_"] is True
+    assert log_has_re(r"Downloaded data for .* from ccxt with length 1\.", caplog)
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 @pytest.mark.parametrize("candle_type", [CandleType.MARK, CandleType.SPOT])
 async def test__async_get_historic_ohlcv(default_conf, mocker, caplog, exchange_name, candle_type):
@@ -2497,6 +2513,68 @@ def test_refresh_latest_trades(
     caplog.clear()
 
 
+def test_refresh_latest_trades_cache_append(mocker, default_conf, tmp_path, time_machine) -> None:
+    time_machine.move_to(dt_now(), tick=False)
+    default_conf["exchange"]["use_public_trades"] = True
+    default_conf["datadir"] = tmp_path
+    default_conf["dataformat_trades"] = "feather"
+    default_conf["orderflow"] = {"max_candles": 1500}
+    exchange = get_patched_exchange(mocker, default_conf)
+    pairwt = ("ETH/BTC", "5m", CandleType.SPOT)
+    first_ms = exchange.needed_candle_for_trades_ms("5m", CandleType.SPOT)
+
+    def ticks(start: int, end: int) -> list[list]:
+        return [
+            [first_ms + i * 1000, str(i), None, "buy", 1.0 + i, 1.0, 1.0 + i]
+            for i in range(start, end)
+        ]
+
+    history = mocker.patch(
+        f"{EXMS}._async_get_trade_history", return_value=["ETH/BTC", ticks(1, 10)]
+    )
+    mocker.patch(f"{EXMS}._now_is_time_to_refresh_trades", return_value=True)
+    store = mocker.spy(FeatherDataHandler, "trades_store")
+    append = mocker.spy(FeatherDataHandler, "trades_append")
+
+    res = exchange.refresh_latest_trades([pairwt])
+    assert res[pairwt]["id"].tolist() == [str(i) for i in range(1, 10)]
+    assert store.call_count == 1
+    assert append.call_count == 0
+
+    # Overlapping trades - only new trades are appended
+    history.return_value = ["ETH/BTC", ticks(8, 15)]
+    res = exchange.refresh_latest_trades([pairwt])
+    assert res[pairwt]["id"].tolist() == [str(i) for i in range(1, 15)]
+    assert store.call_count == 1
+    assert append.call_count == 1
+    assert append.call_args[0][2]["id"].tolist() == [str(i) for i in range(10, 15)]
+
+    # No new trades - nothing is written
+    history.return_value = ["ETH/BTC", ticks(12, 15)]
+    exchange.refresh_latest_trades([pairwt])
+    assert store.call_count == 1
+    assert append.call_count == 1
+
+    dh = FeatherDataHandler(tmp_path)
+    stored = dh.trades_load("ETH/BTC-cached", TradingMode.SPOT)
+    assert stored["id"].tolist() == [str(i) for i in range(1, 15)]
+
+    # The retained trades are rewritten regularly
+    exchange._trades_cache_appends["ETH/BTC"] = 24
+    history.return_value = ["ETH/BTC", ticks(15, 16)]
+    exchange.refresh_latest_trades([pairwt])
+    assert store.call_count == 2
+    assert append.call_count == 1
+    assert dh._segment_files(tmp_path / "ETH_BTC-cached-trades.feather") == []
+
+    # Trades before the first required candle are aged out
+    new = exchange._append_trades(
+        pairwt, trades_list_to_df(ticks(14, 18)), first_required_candle_date=first_ms + 5000
+    )
+    assert new["id"].tolist() == ["16", "17"]
+    assert exchange._trades[pairwt]["id"].tolist() == [str(i) for i in range(6, 18)]
+
+
 @pytest.mark.parametrize("candle_type", [CandleType.FUTURES, CandleType.MARK, CandleType.SPOT])
 def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=UTC)
@@ -0,0 +1,86 @@
+# pragma pylint: disable=missing-docstring, W0212
+import numpy as np
+import pytest
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange import timeframe_to_msecs
+from freqtrade.exchange.kline_cache import KlineCache
+
+
+START = 1_699_833_600_000  # 2023-11-13 00:00 (Monday)
+
+
+def _ticks(timeframe: str, positions: list[int], seed: int) -> list[list]:
+    rng = np.random.default_rng(seed)
+    tf_ms = timeframe_to_msecs(timeframe)
+    return [[START + p * tf_ms, *rng.random(5).tolist()] for p in positions]
+
+
+def _concat_clean(old: DataFrame, ticks: list[list], timeframe: str, capacity: int, drop: bool):
+    """Previous implementation of the cache update"""
+    new = ohlcv_to_dataframe(ticks, timeframe, "ETH/BTC", fill_missing=False, drop_incomplete=drop)
+    df = clean_ohlcv_dataframe(
+        concat([old, new], axis=0), timeframe, "ETH/BTC", fill_missing=True, drop_incomplete=False
+    )
+    return df.tail(capacity).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("timeframe", ["5m", "1d", "1w", "1M"])
+def test_kline_cache_update(timeframe):
+    capacity = 20
+    key = ("ETH/BTC", timeframe, "spot")
+    cache = KlineCache()
+    first = _ticks(timeframe, [0, 1, 2, 4, 5, 6], 0)
+    expected = ohlcv_to_dataframe(first, timeframe, "ETH/BTC", drop_incomplete=False)
+    cache[key] = expected
+    assert cache[key] is expected
+
+    updates = [
+        # Update of the last candle, new candle
+        ([6, 7], False),
+        # Duplicate candles, gap, incomplete candle
+        ([7, 7, 10, 11, 12], True),
+        # Candles older than the cached candles
+        ([-3, -2, 0, 1], False),
+        # Exceeds capacity - oldest candles are aged out
+        (list(range(5, 30)), True),
+        ([29, 30], False),
+        # Only an incomplete candle
+        ([31], True),
+        # Gap larger than the capacity
+        ([70, 71, 72], False),
+        ([72, 73], False),
+    ]
+    if timeframe == "1M":
+        # Monthly candles are not evenly spaced
+        updates = updates[:3]
+    for i, (positions, drop) in enumerate(updates):
+        ticks = _ticks(timeframe, positions, i + 1)
+        expected = _concat_clean(expected, ticks, timeframe, capacity, drop)
+        cache.update_candles(key, ticks, drop, capacity)
+        assert_frame_equal(cache[key], expected)
+        # Dataframe is reused until the next update
+        assert cache[key] is cache[key]
+
+
+def test_kline_cache_mapping():
+    cache = KlineCache()
+    df = ohlcv_to_dataframe(_ticks("5m", list(range(5)), 0), "5m", "ETH/BTC")
+    cache[("ETH/BTC", "5m", "spot")] = df
+    cache[("LTC/BTC", "5m", "spot")] = df
+    assert ("ETH/BTC", "5m", "spot") in cache
+    assert len(cache) == 2
+    assert list(cache.keys()) == [("ETH/BTC", "5m", "spot"), ("LTC/BTC", "5m", "spot")]
+
+    before = cache[("ETH/BTC", "5m", "spot")]
+    cache.update_candles(("ETH/BTC", "5m", "spot"), _ticks("5m", [4, 5], 1), False, 10)
+    # Dataframes handed out are not modified by updates
+    assert_frame_equal(before, df)
+    assert len(cache[("ETH/BTC", "5m", "spot")]) == 6
+
+    del cache[("ETH/BTC", "5m", "spot")]
+    assert ("ETH/BTC", "5m", "spot") not in cache
+    cache.clear()
+    assert not cache
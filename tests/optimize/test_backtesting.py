@@ -10,6 +10,7 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import numpy as np
 import pandas as pd
 import pytest
+from joblib import Parallel
 
 from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
@@ -19,11 +20,13 @@ from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
+from freqtrade.data.shared_store import SharedDataStore
 from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_parallel import _prepared_for_workers
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
@@ -1586,6 +1589,55 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("aligned", [True, False])
+def test_get_detail_data(default_conf_usdt, mocker, aligned) -> None:
+    default_conf_usdt["timeframe"] = "5m"
+    default_conf_usdt["timeframe_detail"] = "1m"
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf_usdt)
+    pair = "UNITTEST/USDT"
+    data_1m = generate_test_data("1m", 100, "2022-01-03 12:00:00+00:00")
+    # Candles 12:10 - 12:14 are missing
+    data_1m = data_1m.drop(data_1m.index[10:15]).reset_index(drop=True)
+    backtesting.detail_data = {pair: data_1m}
+    data_5m = generate_test_data("5m", 20, "2022-01-03 12:00:00+00:00")
+    if aligned:
+        backtesting._get_detail_block(pair).align(
+            pd.DatetimeIndex(data_5m["date"]), backtesting._timeframe_ns
+        )
+
+    row = (data_5m["date"].iloc[3], *data_5m.iloc[3][["open", "high", "low", "close"]])
+    row = (*row, 1, 0, 0, 0, "enter_tag", None)
+    detail = backtesting.get_detail_data(pair, row)
+    assert len(detail) == 5
+    expected = data_1m[
+        (data_1m["date"] >= row[0]) & (data_1m["date"] < row[0] + timedelta(minutes=5))
+    ]
+    for detail_row, (_, candle) in zip(detail, expected.iterrows(), strict=True):
+        assert detail_row == (
+            candle["date"],
+            candle["open"],
+            candle["high"],
+            candle["low"],
+            candle["close"],
+            1,
+            0,
+            0,
+            0,
+            "enter_tag",
+            None,
+        )
+    # 12:10 - no detail candles
+    row = (data_5m["date"].iloc[2], *row[1:])
+    assert backtesting.get_detail_data(pair, row) is None
+
+    # Detail block is reused - and recreated if detail data is replaced
+    block = backtesting._get_detail_block(pair)
+    assert backtesting._get_detail_block(pair) is block
+    backtesting.detail_data = {pair: data_1m.copy()}
+    assert backtesting._get_detail_block(pair) is not block
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
@@ -1840,6 +1892,237 @@ def test_backtest_multi_pair_detail_simplified(
     assert len(evaluate_result_multi(results["results"], "1m", 1)) == 0
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+@pytest.mark.parametrize("tres", [0, 30])
+def test_backtest_columnar_engine(default_conf_usdt, fee, mocker, tres, use_detail):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -200)
+    if tres > 0:
+        data["LTC/USDT"] = data["LTC/USDT"][tres:].reset_index()
+
+    results = {}
+    loop_calls = {}
+    for engine in ("default", "columnar"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs} if use_detail else {}
+        bl_spy = mocker.spy(backtesting, "backtest_loop")
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )["results"]
+        loop_calls[engine] = bl_spy.call_count
+        assert (
+            len(backtesting.dataprovider.get_analyzed_dataframe("LTC/USDT", "5m")[0])
+            == len(data["LTC/USDT"]) - 1
+        )
+
+    assert len(results["default"]) > 0
+    pd.testing.assert_frame_equal(results["default"], results["columnar"])
+    # Candles without signal and open trade are skipped
+    assert loop_calls["columnar"] < loop_calls["default"]
+
+
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_skip_idle_candles(default_conf_usdt, fee, mocker, use_detail):
+    def _sparse_signals(dataframe=None, metadata=None):
+        multi = 40 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 36
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 6) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "minimal_roi": {"0": 100},
+            "stoploss": -1.0,
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+
+    results = {}
+    loop_starts = {}
+    for skip_idle in (False, True):
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs} if use_detail else {}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.backtest_skip_idle_candles = skip_idle
+        backtesting.strategy.bot_loop_start = MagicMock()
+        backtesting.strategy.advise_entry = _sparse_signals  # Override
+        backtesting.strategy.advise_exit = _sparse_signals  # Override
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[skip_idle] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )["results"]
+        loop_starts[skip_idle] = backtesting.strategy.bot_loop_start.call_count
+
+    assert len(results[False]) > 0
+    pd.testing.assert_frame_equal(results[False], results[True])
+    assert loop_starts[False] == 199
+    # Idle candles are skipped entirely
+    assert loop_starts[True] < loop_starts[False]
+
+    # Dynamic pairlists refresh on every candle - no candle is skipped
+    backtesting.dynamic_pairlist = True
+    backtesting.pairlists = MagicMock(whitelist=pairs)
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )["results"]
+    pd.testing.assert_frame_equal(results[False], result)
+    assert backtesting.pairlists.refresh_pairlist.call_count == 199
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {},
+        {"minimal_roi": {"0": 0.03, "20": 0.01, "60": -1}, "stoploss": -0.01},
+        {"trailing_stop": True},
+        {"trailing_stop": True, "trailing_stop_positive": 0.005},
+        {
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.005,
+            "trailing_stop_positive_offset": 0.01,
+            "trailing_only_offset_is_reached": True,
+        },
+        {"exit_profit_only": True, "exit_profit_offset": 0.002, "ignore_roi_if_entry_signal": True},
+        {"use_exit_signal": False, "minimal_roi": {"0": 100}, "stoploss": -1.0},
+    ],
+)
+@pytest.mark.parametrize("tick_size", [None, 0.003])
+def test_backtest_vectorized_exits(default_conf_usdt, fee, mocker, settings, tick_size):
+    def _sparse_signals(dataframe=None, metadata=None):
+        multi = 40 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 36
+        dataframe["enter_long"] = np.where(dataframe.index % multi < 2, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 25) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "minimal_roi": {"0": 0.02, "30": 0.005},
+            "stoploss": -0.02,
+        }
+    )
+    default_conf_usdt.update(settings)
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    # Random walk - trades stay open for a while
+    rng = np.random.default_rng(42)
+    close = 20 * np.cumprod(1 + rng.normal(0, 0.003, 2000))
+    open_ = np.concatenate([[20], close[:-1]])
+    raw_candles = pd.DataFrame(
+        {
+            "date": pd.date_range("2022-01-03 12:00:00", periods=2000, freq="5min", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, 2000))),
+            "low": np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, 2000))),
+            "close": close,
+            "volume": 100.0,
+        }
+    )
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+
+    results = {}
+    exit_checks = {}
+    for vectorized in (False, True):
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _sparse_signals  # Override
+        backtesting.strategy.advise_exit = _sparse_signals  # Override
+        assert backtesting.vectorized_exits_supported()
+        backtesting.vectorized_exits = vectorized
+        if tick_size:
+            # Stops are rounded up to the tick size
+            mocker.patch.object(
+                backtesting, "get_pair_precision", return_value=(tick_size, TICK_SIZE)
+            )
+        should_exit = mocker.spy(backtesting.strategy, "should_exit")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[vectorized] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )["results"]
+        exit_checks[vectorized] = should_exit.call_count
+
+    assert len(results[False]) > 0
+    pd.testing.assert_frame_equal(results[False], results[True])
+    # Exits are only checked on candles where trades may exit
+    assert exit_checks[True] < exit_checks[False]
+
+
+def test_backtest_vectorized_exits_supported(default_conf_usdt, mocker) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting.vectorized_exits_supported()
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting.vectorized_exits_supported()
+    backtesting.strategy.use_custom_stoploss = False
+
+    mocker.patch.object(type(backtesting.strategy), "custom_exit", MagicMock())
+    assert not backtesting.vectorized_exits_supported()
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_multi_pair_long_short_switch(
     default_conf_usdt,
@@ -2528,6 +2811,61 @@ def test_backtest_start_multi_strat_nomock_detail(
 
 
 @pytest.mark.filterwarnings("ignore:deprecated")
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch("freqtrade.optimize.backtesting.show_backtest_results")
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    # Run workers in-process - mocks are not available in separate processes.
+    mocker.patch(
+        "freqtrade.optimize.backtest_parallel.Parallel",
+        side_effect=lambda n_jobs: Parallel(n_jobs=1),
+    )
+    attach_spy = mocker.spy(SharedDataStore, "attach")
+    default_conf.update(
+        {
+            "strategy_list": [CURRENT_TEST_STRATEGY, "StrategyTestV2"],
+            "strategy_path": str(Path(__file__).parents[1] / "strategy/strats"),
+            "datadir": testdatadir,
+            "timeframe": "1m",
+            "tradable_balance_ratio": 1.0,
+            "amend_last_stake_amount": False,
+            "export": "none",
+            "backtest_cache": "none",
+        }
+    )
+
+    results = {}
+    for jobs in (1, 2):
+        default_conf["backtest_jobs"] = jobs
+        backtesting = Backtesting(deepcopy(default_conf))
+        backtesting.start()
+        results[jobs] = backtesting.results
+        assert list(backtesting.results["strategy"].keys()) == default_conf["strategy_list"]
+
+    # Data is attached once per strategy
+    assert attach_spy.call_count == 2
+    # Non-picklable exchange objects are only removed while workers run
+    exchange = backtesting.exchange
+    api = exchange._api
+    assert api is not None
+    assert not exchange.loop.is_closed()
+    with _prepared_for_workers(backtesting):
+        assert exchange._api is None
+        assert exchange.loop is None
+    assert exchange._api is api
+    assert not exchange.loop.is_closed()
+    for strategy in default_conf["strategy_list"]:
+        assert results[2]["strategy"][strategy]["total_trades"] > 0
+        assert (
+            results[2]["strategy"][strategy]["trades"] == results[1]["strategy"][strategy]["trades"]
+        )
+
+
 @pytest.mark.parametrize("run_id", ["2", "changed"])
 @pytest.mark.parametrize("start_delta", [{"days": 0}, {"days": 1}, {"weeks": 1}, {"weeks": 4}])
 @pytest.mark.parametrize("cache", constants.BACKTEST_CACHE_AGE)
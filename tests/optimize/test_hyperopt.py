@@ -10,6 +10,7 @@ from filelock import Timeout
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
+from freqtrade.data.shared_store import MmapDataStore
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
@@ -22,6 +23,7 @@ from freqtrade.util import dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_args,
     get_markets,
     log_has,
@@ -357,7 +359,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -558,10 +560,10 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         return_value=(dt_utc(2017, 12, 10), dt_utc(2017, 12, 13)),
     )
     patch_exchange(mocker)
-    mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.HyperOptimizer._load_data",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -637,15 +639,104 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
         MagicMock(return_value={}),
     )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_file", MagicMock(return_value=True))
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_dir", MagicMock(return_value=True))
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
+    rmtreemock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.shutil.rmtree", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert unlinkmock.call_count == 1
+    assert rmtreemock.call_count == 1
+    assert log_has(f"Removing `{h.data_store_dir}`.", caplog)
+    assert log_has(f"Removing `{h.results_file}`.", caplog)
+
+
+def test_hyperopt_data_store(mocker, hyperopt_conf, tmp_path):
+    patch_exchange(mocker)
+    hyperopt_conf["user_data_dir"] = tmp_path
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._data_store", None)
+    load_mock = mocker.spy(MmapDataStore, "load")
+    hyperopter = Hyperopt(hyperopt_conf).hyperopter
+    data = {"UNITTEST/BTC": generate_test_data("5m", 50, "2022-01-03 12:00:00+00:00")}
+
+    hyperopter._store_data(data)
+    assert load_mock.call_count == 1
+    res = hyperopter._load_data()
+    assert load_mock.call_count == 2
+    pd.testing.assert_frame_equal(res["UNITTEST/BTC"], data["UNITTEST/BTC"])
+
+    # Following epochs reuse the loaded store, and get independent copies of the data
+    res["UNITTEST/BTC"]["close"] = 0
+    res = hyperopter._load_data()
+    assert load_mock.call_count == 2
+    pd.testing.assert_frame_equal(res["UNITTEST/BTC"], data["UNITTEST/BTC"])
+
+    # New data is loaded from the new store
+    hyperopter._store_data({"ETH/BTC": data["UNITTEST/BTC"]})
+    res = hyperopter._load_data()
+    assert load_mock.call_count == 4
+    assert list(res.keys()) == ["ETH/BTC"]
+
+
+def test_hyperopt_static_signals(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._data_store", None)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._signal_data", None)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "spaces": ["roi", "stoploss", "trailing"]})
+    opt = Hyperopt(hyperopt_conf).hyperopter
+    assert opt.static_signals is True
+    assert opt.backtesting.vectorized_exits is True
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    signals_mock = mocker.spy(opt.backtesting.strategy, "ft_advise_signals")
+
+    epochs = [
+        {"roi_t1": 60, "roi_t2": 30, "roi_t3": 20, "roi_p1": 0.01, "roi_p2": 0.01, "roi_p3": 0.1},
+        {
+            "roi_t1": 10,
+            "roi_t2": 10,
+            "roi_t3": 10,
+            "roi_p1": 0.002,
+            "roi_p2": 0.001,
+            "roi_p3": 0.001,
+        },
+    ]
+    for params in epochs:
+        params.update(
+            {
+                "stoploss": -0.05,
+                "trailing_stop": False,
+                "trailing_stop_positive": 0.01,
+                "trailing_stop_positive_offset_p1": 0.02,
+                "trailing_only_offset_is_reached": False,
+            }
+        )
+    static_results = [opt.generate_optimizer(epochs[0])]
+    signal_calls = signals_mock.call_count
+    assert signal_calls > 0
+    static_results.append(opt.generate_optimizer(epochs[1]))
+    # Signals are only calculated once
+    assert signals_mock.call_count == signal_calls
+    assert (
+        static_results[0]["results_metrics"]["total_trades"]
+        != static_results[1]["results_metrics"]["total_trades"]
+    )
+
+    # Results match epochs calculating signals and checking exits on every candle
+    opt.static_signals = False
+    opt.backtesting.vectorized_exits = False
+    for params, static_result in zip(epochs, static_results, strict=True):
+        result = opt.generate_optimizer(params)
+        assert result["loss"] == static_result["loss"]
+        assert result["results_explanation"] == static_result["results_explanation"]
+    assert signals_mock.call_count == 3 * signal_calls
+
+    hyperopt_conf["spaces"] = ["roi", "buy"]
+    assert Hyperopt(hyperopt_conf).hyperopter.static_signals is False
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -712,7 +803,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -769,7 +860,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -824,7 +915,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -878,7 +969,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -917,7 +1008,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -971,7 +1062,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1037,7 +1128,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.MmapDataStore.create", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -0,0 +1,98 @@
+# pragma pylint: disable=missing-docstring, W0212
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt.hyperopt_epoch_cache import (
+    HyperoptEpochCache,
+    get_hyperopt_run_id,
+    get_params_key,
+)
+from tests.conftest import log_has, patch_exchange
+
+
+def test_get_hyperopt_run_id(mocker, hyperopt_conf):
+    patch_exchange(mocker)
+    hyperopter = Hyperopt(hyperopt_conf).hyperopter
+    strategy = hyperopter.backtesting.strategy
+    loss = hyperopter.custom_hyperoptloss
+    run_id = get_hyperopt_run_id(strategy, loss)
+    assert run_id == get_hyperopt_run_id(strategy, loss)
+
+    # Keys irrelevant to epoch results don't change the run id
+    strategy.config["epochs"] = 5000
+    strategy.config["hyperopt_random_state"] = 42
+    strategy.config["hyperopt_jobs"] = 8
+    assert run_id == get_hyperopt_run_id(strategy, loss)
+
+    strategy.config["hyperopt_min_trades"] = 20
+    assert run_id != get_hyperopt_run_id(strategy, loss)
+
+
+def test_get_params_key():
+    assert get_params_key({"b": 1, "a": 0.5}) == get_params_key({"a": 0.5, "b": np.int64(1)})
+    assert get_params_key({"a": 0.5}) != get_params_key({"a": 0.6})
+
+
+def test_hyperopt_epoch_cache(tmp_path, caplog):
+    cache = HyperoptEpochCache(tmp_path, "StrategyTestV3", "abc")
+    assert cache.filename == tmp_path / "StrategyTestV3_abc.jsonl"
+    assert len(cache) == 0
+    assert cache.get({"buy_rsi": 30}) is None
+
+    result = {"loss": 0.5, "params_dict": {"buy_rsi": 30}, "results_metrics": {"trades": 5}}
+    cache.add({"buy_rsi": 30}, result)
+    cache.add({"buy_rsi": 30}, {"loss": 1.0})
+    cached = cache.get({"buy_rsi": 30})
+    assert cached == result
+    # Results are copies
+    cached["loss"] = 5
+    assert cache.get({"buy_rsi": 30}) == result
+    assert cache.hits == 2
+
+    # Interrupted write of a line
+    with cache.filename.open("a") as f:
+        f.write('{"key": "{\\"buy_rsi\\":40}", "res')
+
+    cache = HyperoptEpochCache(tmp_path, "StrategyTestV3", "abc")
+    assert log_has(f"Loaded 1 cached epoch results from {cache.filename}.", caplog)
+    assert cache.get({"buy_rsi": 30}) == result
+    assert HyperoptEpochCache(tmp_path, "StrategyTestV3", "def").get({"buy_rsi": 30}) is None
+
+
+def test_run_optimizer_cached(mocker, hyperopt_conf, tmp_path):
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "hyperopt_cache": True})
+    hyperopt = Hyperopt(hyperopt_conf)
+    parallel_mock = mocker.patch.object(
+        hyperopt,
+        "run_optimizer_parallel",
+        side_effect=lambda parallel, asked: [{"loss": p["buy_rsi"]} for p in asked],
+    )
+    asked = [{"buy_rsi": 10}, {"buy_rsi": 20}]
+
+    # Cache disabled
+    res = hyperopt.run_optimizer_cached(MagicMock(), asked)
+    assert res == [{"loss": 10}, {"loss": 20}]
+
+    hyperopt._init_epoch_cache()
+    assert hyperopt.epoch_cache is not None
+    cache_dir = tmp_path / "hyperopt_results" / "epoch_cache"
+    assert hyperopt.epoch_cache.filename.parent == cache_dir
+    res = hyperopt.run_optimizer_cached(MagicMock(), asked)
+    assert res == [{"loss": 10}, {"loss": 20}]
+    assert parallel_mock.call_count == 2
+
+    # Only new points are evaluated, results keep the order of asked points
+    res = hyperopt.run_optimizer_cached(MagicMock(), [{"buy_rsi": 30}, {"buy_rsi": 20}])
+    assert res == [{"loss": 30}, {"loss": 20}]
+    assert parallel_mock.call_args[0][1] == [{"buy_rsi": 30}]
+
+    # Cached results survive restarts
+    parallel_mock.reset_mock()
+    hyperopt._init_epoch_cache()
+    res = hyperopt.run_optimizer_cached(MagicMock(), [{"buy_rsi": 10}, {"buy_rsi": 30}])
+    assert res == [{"loss": 10}, {"loss": 30}]
+    assert parallel_mock.call_count == 0
+    assert hyperopt.epoch_cache.hits == 2
@@ -0,0 +1,167 @@
+# pragma pylint: disable=missing-docstring, W0212
+import os
+import shutil
+
+from pandas.testing import assert_frame_equal
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data import history
+from freqtrade.enums import RunMode
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.indicator_caching import (
+    IndicatorCache,
+    get_dataframe_fingerprint,
+    get_strategy_indicator_hash,
+)
+from tests.conftest import log_has, patch_exchange
+
+
+def test_get_strategy_indicator_hash(default_conf, mocker):
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    strategy = backtesting.strategylist[0]
+    backtesting._set_strategy(strategy)
+    strategy_hash = get_strategy_indicator_hash(strategy)
+    assert strategy_hash == get_strategy_indicator_hash(strategy)
+
+    # Config keys irrelevant to indicators don't change the hash
+    strategy.config["timerange"] = "20200101-"
+    strategy.config["epochs"] = 500
+    assert strategy_hash == get_strategy_indicator_hash(strategy)
+
+    timeframe = strategy.config["timeframe"]
+    strategy.config["timeframe"] = "1h"
+    assert strategy_hash != get_strategy_indicator_hash(strategy)
+    strategy.config["timeframe"] = timeframe
+    assert strategy_hash == get_strategy_indicator_hash(strategy)
+
+    strategy.buy_rsi.value = 40
+    assert strategy_hash != get_strategy_indicator_hash(strategy)
+
+
+def test_indicator_cache(default_conf, mocker, testdatadir, tmp_path, caplog):
+    default_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "datadir": testdatadir,
+            "indicator_cache": True,
+        }
+    )
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=["UNITTEST/BTC", "XRP/ETH"],
+        timerange=TimeRange("date", None, 1517227800, 0),
+    )
+    advise_mock = mocker.spy(backtesting.strategy, "advise_indicators")
+
+    expected = backtesting.strategy.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+    advise_mock.reset_mock()
+
+    res = backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+    assert log_has("Loaded indicators for 0 of 2 pairs from cache.", caplog)
+    assert len(list((tmp_path / "indicator_cache" / "StrategyTestV3").glob("*.feather"))) == 2
+    assert list(res.keys()) == ["UNITTEST/BTC", "XRP/ETH"]
+    advise_mock.reset_mock()
+
+    res = backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 0
+    assert log_has("Loaded indicators for 2 of 2 pairs from cache.", caplog)
+    for pair in data:
+        assert_frame_equal(res[pair], expected[pair])
+
+    # Changed data for one pair - only this pair is recalculated
+    data["XRP/ETH"] = data["XRP/ETH"].iloc[:-10].reset_index(drop=True)
+    res = backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    assert len(res["XRP/ETH"]) == len(data["XRP/ETH"])
+    assert list(res.keys()) == ["UNITTEST/BTC", "XRP/ETH"]
+
+    # Not used for hyperopt with --analyze-per-epoch
+    advise_mock.reset_mock()
+    backtesting.config["analyze_per_epoch"] = True
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+    del backtesting.config["analyze_per_epoch"]
+
+    # Cache disabled
+    advise_mock.reset_mock()
+    backtesting.config["indicator_cache"] = False
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+
+
+def test_indicator_cache_informative_data(default_conf, mocker, testdatadir, tmp_path):
+    datadir = tmp_path / "data"
+    datadir.mkdir()
+    for file in ("UNITTEST_BTC-5m.feather", "XRP_ETH-5m.feather"):
+        shutil.copy2(testdatadir / file, datadir / file)
+    default_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "datadir": datadir,
+            "runmode": RunMode.BACKTEST,
+            "indicator_cache": True,
+        }
+    )
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    strategy = backtesting.strategy
+    data = history.load_data(
+        datadir=datadir,
+        timeframe="5m",
+        pairs=["UNITTEST/BTC"],
+        timerange=TimeRange("date", None, 1517227800, 0),
+    )
+
+    def _informative(dataframe, metadata):
+        dataframe["inf_close"] = strategy.dp.get_pair_dataframe("XRP/ETH", "5m")["close"].iloc[-1]
+        return dataframe
+
+    advise_mock = mocker.patch.object(strategy, "populate_indicators", side_effect=_informative)
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    meta_files = list((tmp_path / "indicator_cache" / "StrategyTestV3").glob("*.json"))
+    assert len(meta_files) == 1
+    assert "XRP_ETH-5m.feather" in meta_files[0].read_text()
+
+    # Unrelated files don't invalidate the cache
+    (datadir / "ETH_BTC-5m.feather").write_bytes(b"")
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+
+    # Changed informative data does
+    stat = (datadir / "XRP_ETH-5m.feather").stat()
+    os.utime(datadir / "XRP_ETH-5m.feather", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+
+
+def test_indicator_cache_unsupported_dataframe(default_conf, mocker, testdatadir, tmp_path):
+    default_conf.update({"user_data_dir": tmp_path, "datadir": testdatadir})
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    strategy = backtesting.strategylist[0]
+    data = history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=["UNITTEST/BTC"],
+        timerange=TimeRange("date", None, 1517227800, 0),
+    )
+    assert len(get_dataframe_fingerprint(data["UNITTEST/BTC"])) == 40
+
+    def _set_index(dataframe, metadata):
+        return dataframe.set_index("date", drop=False)
+
+    mocker.patch.object(strategy, "populate_indicators", side_effect=_set_index)
+    cache = IndicatorCache(backtesting.config, strategy)
+    res = cache.advise_all_indicators(data)
+    assert len(res["UNITTEST/BTC"]) == len(data["UNITTEST/BTC"])
+    # Dataframes with a modified index are not cached
+    assert not (tmp_path / "indicator_cache").exists()
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.schema import CreateTable
 
 from freqtrade.constants import DEFAULT_DB_PROD_URL
@@ -14,7 +15,7 @@ from freqtrade.exceptions import OperationalException
 from freqtrade.persistence import Trade, init_db
 from freqtrade.persistence.base import ModelBase
 from freqtrade.persistence.migrations import get_last_sequence_ids, set_sequence_ids
-from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.models import PairLock, _read_only_ctx_var
 from freqtrade.persistence.trade_model import Order
 from tests.conftest import log_has
 
@@ -42,6 +43,35 @@ def test_init_custom_db_url(default_conf, tmp_path):
     assert r.first() == ("wal",)
 
 
+def test_init_db_read_url(tmp_path, caplog):
+    db_url = f"sqlite:///{tmp_path / 'tradesv3.sqlite'}"
+    init_db(db_url, {"db_read_url": db_url})
+    engine = Trade.session.get_bind()
+    Trade.session.execute(text("DELETE FROM trades"))
+    Trade.commit()
+
+    token = _read_only_ctx_var.set(True)
+    try:
+        read_engine = Trade.session.get_bind()
+        assert read_engine is not engine
+        assert str(read_engine.url) == db_url
+        assert Trade.session.execute(text("PRAGMA query_only")).first() == (1,)
+        with pytest.raises(OperationalError, match=r".*readonly database.*"):
+            Trade.session.execute(text("DELETE FROM trades"))
+    finally:
+        Trade.session.remove()
+        _read_only_ctx_var.reset(token)
+    assert Trade.session.get_bind() is engine
+
+    init_db("sqlite://", {"db_read_url": "sqlite://"})
+    assert log_has("`db_read_url` is not supported for in-memory databases. Ignoring.", caplog)
+    token = _read_only_ctx_var.set(True)
+    try:
+        assert str(Trade.session.get_bind().url) == "sqlite://"
+    finally:
+        _read_only_ctx_var.reset(token)
+
+
 def test_init_invalid_db_url():
     # Update path to a value other than default, but still in-memory
     with pytest.raises(OperationalException, match=r".*no valid database URL*"):
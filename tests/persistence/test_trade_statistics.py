@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from freqtrade.persistence import ClosedTradeStatistics, Trade
+from tests.conftest import create_mock_trades
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_closed_trade_statistics(fee, mocker):
+    create_mock_trades(fee, is_short=None)
+    trades = Trade.get_trades([Trade.is_open.is_(False)]).all()
+    trade_ids = sorted(t.id for t in trades)
+    profit_sum = sum(t.close_profit_abs for t in trades)
+    short_count = sum(t.is_short for t in trades)
+
+    stats = ClosedTradeStatistics()
+    load_mock = mocker.spy(ClosedTradeStatistics, "_load_trades")
+
+    closed = stats.closed_trades()
+    assert load_mock.call_count == 1
+    assert closed["ids"].tolist() == trade_ids
+    assert pytest.approx(closed["profit_abs"].sum()) == profit_sum
+    assert len(stats.closed_trades(direction="short")["ids"]) == short_count
+
+    # Nothing changed - nothing is loaded
+    stats.closed_trades()
+    assert load_mock.call_count == 1
+
+    # Trades closed since the last sync are added
+    trade = Trade.session.scalars(Trade.get_trades_query([Trade.is_open.is_(True)])).first()
+    trade_id = trade.id
+    close_date = datetime.now(UTC) + timedelta(minutes=5)
+    trade.is_open = False
+    trade.close_date = close_date
+    trade.close_profit = -0.05
+    trade.close_profit_abs = -0.5
+    trade.exit_reason = "stop_loss"
+    Trade.commit()
+    closed = stats.closed_trades()
+    assert load_mock.call_count == 2
+    assert closed["ids"].tolist() == sorted([*trade_ids, trade_id])
+
+    outcomes = stats.outcome_stats()
+    assert outcomes["exit_reasons"]["stop_loss"]["losses"] == 1
+    assert sum(sum(c.values()) for c in outcomes["exit_reasons"].values()) == len(trade_ids) + 1
+
+    day = close_date.date()
+    closed_on_day = closed["close_dates"].astype("datetime64[D]") == np.datetime64(day)
+    profit, count = stats.period_profits([(day, day + timedelta(days=1))])[0]
+    assert count == closed_on_day.sum()
+    assert pytest.approx(profit) == np.nansum(closed["profit_abs"][closed_on_day])
+
+    # Other changes reload all trades
+    Trade.session.delete(Trade.session.get(Trade, trade_ids[0]))
+    Trade.commit()
+    closed = stats.closed_trades()
+    assert load_mock.call_count == 4
+    assert closed["ids"].tolist() == sorted([*trade_ids[1:], trade_id])
+    start = close_date - timedelta(minutes=1)
+    assert stats.closed_trades(start_date=start)["ids"].tolist() == [trade_id]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_closed_trade_statistics_lock(fee, mocker):
+    create_mock_trades(fee, is_short=None)
+    stats = ClosedTradeStatistics()
+    stats.sync()
+    locked = []
+    sync_mock = mocker.patch.object(
+        stats, "_sync_locked", side_effect=lambda: locked.append(stats._lock.locked())
+    )
+
+    # Results are built while holding the lock - a concurrent sync can't replace attributes
+    today = datetime.now(UTC).date()
+    assert len(stats.closed_trades()["ids"]) > 0
+    stats.period_profits([(today, today + timedelta(days=1))])
+    stats.outcome_stats()
+    assert sync_mock.call_count == 3
+    assert locked == [True, True, True]
+    assert not stats._lock.locked()
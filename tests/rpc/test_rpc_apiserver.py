@@ -8,7 +8,7 @@ import time
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import ANY, MagicMock, PropertyMock
+from unittest.mock import ANY, AsyncMock, MagicMock, PropertyMock
 
 import pandas as pd
 import pytest
@@ -29,8 +29,16 @@ from freqtrade.persistence import CustomDataWrapper, Trade
 from freqtrade.rpc import RPC
 from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
+from freqtrade.rpc.api_server.endpoint_limiter import EndpointLimiter
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.ws.channel import WebSocketChannel
+from freqtrade.rpc.api_server.ws.serializer import (
+    BinaryWebSocketSerializer,
+    BroadcastMessage,
+    HybridJSONWebSocketSerializer,
+    get_ws_serializer,
+)
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -2202,6 +2210,75 @@ def test_api_pair_candles(botclient, ohlcv_history, annotations, expected):
     ]
 
 
+def test_api_pair_candles_layouts(botclient, ohlcv_history):
+    ftbot, client = botclient
+    timeframe = "5m"
+    ohlcv_history["sma"] = ohlcv_history["close"].rolling(2).mean()
+    ohlcv_history["enter_long"] = 0
+    ohlcv_history.loc[1, "enter_long"] = 1
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    url = f"{BASE_URI}/pair_candles?limit=3&pair=XRP%2FBTC&timeframe={timeframe}"
+
+    rows = client_get(client, url).json()
+    rc = client_get(client, f"{url}&layout=columns")
+    assert_response(rc)
+    columnar = rc.json()
+    assert columnar["columns"] == rows["columns"]
+    assert columnar["data"] == {
+        col: [row[idx] for row in rows["data"]] for idx, col in enumerate(rows["columns"])
+    }
+
+    # Only candles newer than since_ts
+    since_ts = rows["data"][1][rows["columns"].index("__date_ts")]
+    rc = client_post(
+        client,
+        f"{BASE_URI}/pair_candles",
+        data={
+            "pair": "XRP/BTC",
+            "timeframe": timeframe,
+            "limit": 3,
+            "columns": ["sma"],
+            "since_ts": since_ts,
+            "layout": "columns",
+        },
+    )
+    assert_response(rc)
+    resp = rc.json()
+    assert resp["length"] == 1
+    assert resp["data_start_ts"] == rows["data_stop_ts"]
+    assert "sma" in resp["data"]
+    assert resp["data"]["__date_ts"] == [rows["data_stop_ts"]]
+
+    rc = client_get(client, f"{url}&since_ts={rows['data_stop_ts']}")
+    assert_response(rc)
+    assert rc.json()["length"] == 0
+    assert rc.json()["data"] == []
+
+    # Arrow IPC stream
+    pa = pytest.importorskip("pyarrow")
+    rc = client.get(
+        url,
+        headers={
+            "Authorization": _basic_auth_str(_TEST_USER, _TEST_PASS),
+            "Accept": "application/vnd.apache.arrow.stream",
+        },
+    )
+    assert rc.status_code == 200
+    assert rc.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(rc.content).read_all()
+    assert table.column_names == rows["columns"]
+    assert table.column("__date_ts").to_pylist() == columnar["data"]["__date_ts"]
+    # NaN values are sent as nulls
+    assert (
+        table.column("_enter_long_signal_close").to_pylist()
+        == columnar["data"]["_enter_long_signal_close"]
+    )
+    metadata = rapidjson.loads(table.schema.metadata[b"freqtrade"])
+    assert metadata["pair"] == "XRP/BTC"
+    assert metadata["enter_long_signals"] == 1
+    assert "data" not in metadata
+
+
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -3142,6 +3219,48 @@ def test_health(botclient):
     assert ret["last_process"] is None
 
 
+def test_api_request_stats(botclient):
+    _ftbot, client = botclient
+
+    assert_response(client_get(client, f"{BASE_URI}/health"))
+    assert_response(client_get(client, f"{BASE_URI}/health"))
+    assert_response(client_get(client, f"{BASE_URI}/trade/22"), 404)
+
+    rc = client_get(client, f"{BASE_URI}/request_stats")
+    assert_response(rc)
+    ret = rc.json()
+    assert ret["GET /api/v1/health"]["requests"] == 2
+    assert ret["GET /api/v1/health"]["active"] == 0
+    assert ret["GET /api/v1/health"]["max_concurrent"] == 4
+    assert ret["GET /api/v1/trade/{tradeid}"]["requests"] == 1
+    assert ret["GET /api/v1/trade/{tradeid}"]["max_time"] >= 0
+
+
+def test_endpoint_limiter():
+    limiter = EndpointLimiter(2)
+    running = {"active": 0, "max": 0}
+
+    async def request(endpoint):
+        async with limiter.limit(endpoint):
+            running["active"] += 1
+            running["max"] = max(running["max"], running["active"])
+            await asyncio.sleep(0.01)
+            running["active"] -= 1
+
+    async def run():
+        await asyncio.gather(*(request("GET /status") for _ in range(5)), request("GET /count"))
+
+    asyncio.run(run())
+    # 2 /status requests + 1 /count request
+    assert running["max"] == 3
+    stats = limiter.stats()
+    assert stats["GET /status"]["requests"] == 5
+    assert stats["GET /status"]["waiting"] == 0
+    assert stats["GET /status"]["avg_wait"] > 0
+    assert stats["GET /count"]["requests"] == 1
+    assert stats["GET /count"]["avg_wait"] < stats["GET /status"]["avg_wait"]
+
+
 def test_api_ws_subscribe(botclient, mocker):
     _ftbot, client = botclient
     ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
@@ -3195,6 +3314,144 @@ def test_api_ws_requests(botclient, caplog):
     assert response["type"] == "analyzed_df"
 
 
+def test_api_ws_requests_binary(botclient, mocker):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&encoding=binary"
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="5min", tz="UTC"),
+            "close": [1.0, 2.0, 3.0],
+            "enter_long": [0, 1, 0],
+            "enter_tag": [None, "tag", None],
+        }
+    )
+    mocker.patch.object(
+        RPC,
+        "_ws_request_analyzed_df",
+        return_value=[{"key": ("ETH/BTC", "5m", "spot"), "df": df, "la": datetime.now(UTC)}],
+    )
+    serializer = BinaryWebSocketSerializer(MagicMock())
+
+    with client.websocket_connect(ws_url) as ws:
+        # Messages without dataframes are sent as JSON
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+        assert response["type"] == "whitelist"
+
+        ws.send_json({"type": "analyzed_df", "data": {}})
+        response = serializer._deserialize(ws.receive_bytes())
+
+    assert response["type"] == "analyzed_df"
+    assert response["data"]["key"] == ["ETH/BTC", "5m", "spot"]
+    pd.testing.assert_frame_equal(response["data"]["df"], df)
+
+
+async def test_binary_ws_serializer_delta_frames():
+    sent = []
+    sender = BinaryWebSocketSerializer(MagicMock())
+    receiver = BinaryWebSocketSerializer(MagicMock())
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=5, freq="5min", tz="UTC"),
+            "close": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "feature": [1.5, 1.5, 1.5, 1.5, 2.0],
+            "missing": [float("nan")] * 5,
+            "enter_long": [0, 0, 0, 0, 1],
+            "enter_tag": [None, None, None, None, "tag"],
+        },
+        index=range(10, 15),
+    )
+
+    def message(candles):
+        return {
+            "type": "analyzed_df",
+            "data": {"key": ("ETH/BTC", "5m", "spot"), "df": candles, "la": "2024-01-01"},
+        }
+
+    for candles in (df.iloc[:3], df.iloc[3:4], df.iloc[4:5]):
+        sent.append(sender._serialize(message(candles)))
+        received = receiver._deserialize(sent[-1])
+        assert "__all_columns__" not in received["data"]
+        pd.testing.assert_frame_equal(received["data"]["df"], candles)
+
+    def sent_columns(msg: bytes) -> list[str]:
+        header_len = int.from_bytes(msg[4:8], "little")
+        return rapidjson.loads(msg[8 : 8 + header_len])["data"]["df"]["__columns__"]
+
+    # Only changed columns are sent after the first message
+    assert sent_columns(sent[0]) == df.columns.tolist()
+    assert sent_columns(sent[1]) == ["date", "close"]
+    assert sent_columns(sent[2]) == ["date", "close", "feature", "enter_long", "enter_tag"]
+
+    # JSON messages are still understood
+    json_msg = HybridJSONWebSocketSerializer(MagicMock())._serialize(message(df))
+    received = receiver._deserialize(json_msg)
+    assert received["data"]["df"]["close"].tolist() == df["close"].tolist()
+
+    assert get_ws_serializer("binary") is BinaryWebSocketSerializer
+    assert get_ws_serializer("msgpack") is HybridJSONWebSocketSerializer
+    assert get_ws_serializer(None) is HybridJSONWebSocketSerializer
+
+
+async def test_ws_broadcast_encoded_once(mocker):
+    json_spy = mocker.spy(HybridJSONWebSocketSerializer, "_serialize")
+    binary_spy = mocker.spy(BinaryWebSocketSerializer, "_serialize")
+    json_channels = [WebSocketChannel(AsyncMock(), send_throttle=0) for _ in range(3)]
+    binary_channels = [
+        WebSocketChannel(AsyncMock(), serializer_cls=BinaryWebSocketSerializer, send_throttle=0)
+        for _ in range(3)
+    ]
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="5min", tz="UTC"),
+            "close": [1.0, 2.0, 3.0],
+            "feature": [1.5, 1.5, 1.5],
+        }
+    )
+
+    def message(candles):
+        return BroadcastMessage(
+            {
+                "type": "analyzed_df",
+                "data": {"key": ("ETH/BTC", "5m", "spot"), "df": candles, "la": "2024-01-01"},
+            }
+        )
+
+    msg = message(df.iloc[0:1])
+    for channel in json_channels + binary_channels:
+        await channel.send(msg, stream_lag=0.5)
+    assert json_spy.call_count == 1
+    assert binary_spy.call_count == 1
+
+    # The last binary channel was sent a different candle - its delta frame differs
+    await binary_channels[2].send(
+        {"type": "analyzed_df", "data": {"key": ("ETH/BTC", "5m", "spot"), "df": df.iloc[:2]}}
+    )
+    binary_spy.reset_mock()
+    msg = message(df.iloc[2:3])
+    for channel in binary_channels:
+        await channel.send(msg)
+    assert binary_spy.call_count == 2
+
+    sent = [channel.raw_websocket.send_bytes.call_args[0][0] for channel in binary_channels]
+    assert sent[0] is sent[1]
+    assert sent[0] is not sent[2]
+    for channel, data in zip(binary_channels, sent, strict=True):
+        receiver = BinaryWebSocketSerializer(MagicMock())
+        receiver._deserialize(channel.raw_websocket.send_bytes.call_args_list[0][0][0])
+        if channel is binary_channels[2]:
+            receiver._deserialize(channel.raw_websocket.send_bytes.call_args_list[1][0][0])
+        received = receiver._deserialize(data)
+        pd.testing.assert_frame_equal(received["data"]["df"], df.iloc[2:3])
+
+    stats = json_channels[0].send_stats
+    assert stats["messages_sent"] == 1
+    assert stats["bytes_sent"] == len(json_channels[0].raw_websocket.send_text.call_args[0][0])
+    assert stats["avg_stream_lag"] == 0.5
+    assert stats["max_stream_lag"] == 0.5
+    assert binary_channels[2].send_stats["messages_sent"] == 3
+
+
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
         caplog.set_level(logging.DEBUG)
@@ -3224,6 +3481,7 @@ def test_api_ws_send_msg(default_conf, mocker, caplog):
             first_waiter = apiserver._message_stream._waiter
             apiserver.send_msg(test_message)
             assert first_waiter.result()[0] == test_message
+            assert isinstance(first_waiter.result()[0], BroadcastMessage)
 
             second_waiter = apiserver._message_stream._waiter
             apiserver.send_msg(test_message)
@@ -160,7 +160,14 @@ def test_emc_handle_producer_message(patched_emc, caplog, ohlcv_history):
     assert log_has_re(r"Empty message .+", caplog)
 
 
-async def test_emc_create_connection_success(default_conf, caplog, mocker):
+@pytest.mark.parametrize(
+    "encoding,query",
+    [
+        ("json", f"token={_TEST_WS_TOKEN}"),
+        ("binary", f"token={_TEST_WS_TOKEN}&encoding=binary"),
+    ],
+)
+async def test_emc_create_connection_success(default_conf, caplog, mocker, encoding, query):
     default_conf.update(
         {
             "external_message_consumer": {
@@ -176,6 +183,7 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
                 "wait_timeout": 60,
                 "ping_timeout": 60,
                 "sleep_timeout": 60,
+                "message_encoding": encoding,
             }
         }
     )
@@ -190,8 +198,10 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
     lock = asyncio.Lock()
 
     emc._running = True
+    paths = []
 
     async def eat(websocket):
+        paths.append(websocket.request.path)
         emc._running = False
 
     try:
@@ -199,6 +209,7 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
             await emc._create_connection(test_producer, lock)
 
         assert log_has_re(r"Connected to channel.+", caplog)
+        assert paths == [f"/api/v1/message/ws?{query}"]
     finally:
         emc.shutdown()
 
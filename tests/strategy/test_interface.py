@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame, concat
+from pandas.testing import assert_series_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
@@ -22,7 +23,13 @@ from freqtrade.strategy.parameters import (
 )
 from freqtrade.strategy.strategy_validation import StrategyResultValidator
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -855,6 +862,93 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(mocker, caplog) -> None:
+    def _populate(dataframe, metadata):
+        dataframe["sma"] = dataframe["close"].rolling(5).mean()
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=_populate)
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.incremental_analysis_candles = 10
+    data = generate_test_data("5m", 120, "2022-01-03 12:00:00+00:00")
+    metadata = {"pair": "ETH/BTC"}
+
+    ret = strategy._analyze_ticker_internal(data.iloc[:100].copy(), metadata)
+    assert len(ind_mock.call_args[0][0]) == 100
+
+    # One new candle - window moves by one candle
+    window = data.iloc[1:101].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    assert len(ind_mock.call_args[0][0]) == 11
+    assert len(ret) == 100
+    assert ret.index.equals(window.index)
+    assert ret["date"].equals(window["date"])
+    expected = _populate(window.copy(), metadata)
+    # The first candles were analyzed with more history than the window holds.
+    assert ret.loc[3, "sma"] > 0
+    assert_series_equal(ret["sma"].iloc[4:], expected["sma"].iloc[4:])
+
+    # Multiple new candles
+    window = data.iloc[5:105].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    assert len(ind_mock.call_args[0][0]) == 14
+    assert_series_equal(ret["sma"].iloc[4:], _populate(window.copy(), metadata)["sma"].iloc[4:])
+
+    # Changed candle within warm-up period - full analysis
+    window = data.iloc[6:106].reset_index(drop=True)
+    window.loc[95, "close"] += 1
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    assert len(ind_mock.call_args[0][0]) == 100
+
+    # Too many new candles - full analysis
+    window = data.iloc[20:120].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    assert len(ind_mock.call_args[0][0]) == 100
+    assert_series_equal(ret["sma"], _populate(window.copy(), metadata)["sma"])
+
+
+def test__analyze_ticker_internal_incremental_verify(mocker, caplog) -> None:
+    def _populate(dataframe, metadata):
+        # Depends on the full history - can't be calculated incrementally
+        dataframe["cumsum"] = dataframe["close"].cumsum()
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=_populate)
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.incremental_analysis_candles = 5
+    strategy.incremental_analysis_verify_interval = 2
+    strategy.startup_candle_count = 5
+    data = generate_test_data("5m", 120, "2022-01-03 12:00:00+00:00")
+    metadata = {"pair": "ETH/BTC"}
+
+    strategy._analyze_ticker_internal(data.iloc[:100].reset_index(drop=True), metadata)
+    strategy._analyze_ticker_internal(data.iloc[:101].reset_index(drop=True), metadata)
+    assert ind_mock.call_count == 2
+    assert not log_has_re(r"Incremental analysis for ETH/BTC differs.*", caplog)
+
+    window = data.iloc[:102].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    # Incremental and full analysis
+    assert ind_mock.call_count == 4
+    assert log_has_re(r"Incremental analysis for ETH/BTC differs .* \['cumsum'\]\..*", caplog)
+    # Full analysis result is used
+    assert_series_equal(ret["cumsum"], _populate(window.copy(), metadata)["cumsum"])
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
@@ -0,0 +1,140 @@
+# pragma pylint: disable=missing-docstring, C0103, W0212
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.shared_store import SharedDataStore
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exceptions import OperationalException
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy import process_analysis
+from freqtrade.strategy.process_analysis import (
+    AnalysisProcessPool,
+    WorkerDataProvider,
+    _analyze_pair_worker,
+)
+from tests.conftest import generate_test_data, get_patched_exchange, log_has_re
+
+
+def _thread_executor(max_workers, mp_context, initializer, initargs):
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+
+@pytest.fixture
+def candles():
+    return {
+        ("UNITTEST/BTC", "5m", CandleType.SPOT): generate_test_data(
+            "5m", 100, "2022-01-03 12:00:00+00:00"
+        ),
+        ("ETH/BTC", "5m", CandleType.SPOT): generate_test_data(
+            "5m", 80, "2022-01-03 12:00:00+00:00"
+        ),
+    }
+
+
+def test_worker_dataprovider(default_conf, candles):
+    store = SharedDataStore.create(candles)
+    try:
+        dp = WorkerDataProvider(
+            default_conf, store.spec, {"ETH/BTC": {"symbol": "ETH/BTC"}}, ["ETH/BTC"]
+        )
+        assert dp.available_pairs == list(candles.keys())
+        df = dp.ohlcv("ETH/BTC", "5m")
+        assert_frame_equal(df, candles[("ETH/BTC", "5m", CandleType.SPOT)], check_dtype=False)
+        # Uses the strategy timeframe by default
+        assert len(dp.ohlcv("UNITTEST/BTC")) == 100
+        assert dp.ohlcv("XRP/BTC", "5m").empty
+        assert dp.ohlcv("ETH/BTC", "1h").empty
+
+        assert dp.current_whitelist() == ["ETH/BTC"]
+        assert dp.market("ETH/BTC") == {"symbol": "ETH/BTC"}
+        assert dp.market("XRP/BTC") is None
+        with pytest.raises(OperationalException, match=r"Ticker data is not available.*"):
+            dp.ticker("ETH/BTC")
+        with pytest.raises(OperationalException, match=r"Orderbooks are not available.*"):
+            dp.orderbook("ETH/BTC", 5)
+        dp.close()
+    finally:
+        store.unlink()
+
+
+def test_analyze_pair_worker(default_conf, mocker, candles):
+    mocker.patch.object(process_analysis, "_worker_strategy", None)
+    store = SharedDataStore.create(candles)
+    context = {"markets": {}, "whitelist": ["ETH/BTC"], "state": {"custom": 5}}
+    try:
+        with pytest.raises(OperationalException, match=r"Analysis worker was not initialized\."):
+            _analyze_pair_worker(store.spec, context, "ETH/BTC", "5m")
+
+        process_analysis._init_worker(default_conf)
+        strategy = process_analysis._worker_strategy
+        assert strategy is not None
+        load_state = mocker.patch.object(strategy, "load_analysis_worker_state")
+
+        res = _analyze_pair_worker(store.spec, context, "ETH/BTC", "5m")
+        assert load_state.call_count == 1
+        assert load_state.call_args[0][0] == {"custom": 5}
+        assert isinstance(strategy.dp, WorkerDataProvider)
+        assert len(res) == 80
+        assert "rsi" in res.columns
+        assert "enter_long" in res.columns
+    finally:
+        store.unlink()
+
+
+def test_analysis_process_pool_freqai(default_conf):
+    default_conf["freqai"] = {"enabled": True}
+    with pytest.raises(OperationalException, match=r".*is not supported with FreqAI\."):
+        AnalysisProcessPool(default_conf, 2)
+
+
+def test_analyze_in_processes(default_conf, mocker, candles, caplog):
+    mocker.patch.object(process_analysis, "_worker_strategy", None)
+    mocker.patch.object(process_analysis, "ProcessPoolExecutor", side_effect=_thread_executor)
+    default_conf["runmode"] = RunMode.DRY_RUN
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._klines.update(candles)
+
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, exchange, None)
+    expected = {
+        pair: strategy.analyze_ticker(candles[(pair, "5m", CandleType.SPOT)].copy(), {"pair": pair})
+        for pair in ("UNITTEST/BTC", "ETH/BTC")
+    }
+
+    default_conf["strategy_process_workers"] = 2
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, exchange, None)
+    state_mock = mocker.patch.object(strategy, "analysis_worker_state", return_value={"a": 1})
+    strategy.analyze(["UNITTEST/BTC", "ETH/BTC", "XRP/BTC"])
+
+    assert state_mock.call_count == 1
+    assert isinstance(strategy._analysis_pool, AnalysisProcessPool)
+    assert log_has_re(r"Empty candle \(OHLCV\) data for pair XRP/BTC", caplog)
+    for pair, df in expected.items():
+        analyzed, _ = strategy.dp.get_analyzed_dataframe(pair, "5m")
+        assert_frame_equal(analyzed, df)
+
+    # Already analyzed candles are skipped
+    analyze_mock = mocker.spy(strategy._analysis_pool, "analyze")
+    strategy.analyze(["UNITTEST/BTC", "ETH/BTC"])
+    assert analyze_mock.call_count == 0
+
+    # Errors in a worker only affect the failing pair
+    caplog.clear()
+    mocker.patch.object(
+        strategy._analysis_pool,
+        "analyze",
+        return_value={"UNITTEST/BTC": ValueError("xyz"), "ETH/BTC": DataFrame()},
+    )
+    strategy.process_only_new_candles = False
+    strategy.analyze(["UNITTEST/BTC", "ETH/BTC"])
+    assert log_has_re(r"Unable to analyze candle \(OHLCV\) data for pair UNITTEST/BTC: xyz", caplog)
+
+    strategy.freqai = MagicMock()
+    strategy.ft_bot_cleanup()
+    assert strategy._analysis_pool is None
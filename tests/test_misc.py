@@ -12,6 +12,7 @@ from freqtrade.misc import (
     deep_merge_dicts,
     file_dump_json,
     file_load_json,
+    get_dataframe_differences,
     is_file_in_dir,
     json_to_dataframe,
     pair_to_filename,
@@ -220,3 +221,29 @@ def test_dataframe_json(ohlcv_history):
     json = dataframe_to_json(ohlcv_history)
 
     dataframe = json_to_dataframe(json)
+
+
+def test_get_dataframe_differences():
+    df = pd.DataFrame(
+        {
+            "close": [1.0, 2.0, float("nan")],
+            "enter_long": [0, 1, 0],
+            "enter_tag": [None, "tag", None],
+        }
+    )
+    assert get_dataframe_differences(df, df.copy()) == []
+    # Index and tiny float differences are ignored
+    other = df.copy()
+    other.index = [5, 6, 7]
+    other["close"] += 1e-12
+    assert get_dataframe_differences(df, other) == []
+
+    other["enter_tag"] = [None, "other", None]
+    other["close"] = [1.0, 2.0, 3.0]
+    assert get_dataframe_differences(df, other) == ["close", "enter_tag"]
+    assert get_dataframe_differences(df, other.drop(columns=["enter_long"])) == [
+        "close",
+        "enter_long",
+        "enter_tag",
+    ]
+    assert get_dataframe_differences(df, df.iloc[1:]) == ["close", "enter_long", "enter_tag"]